@@ -1,6 +1,44 @@
-from meapi.me import Me
+from importlib import import_module
 from meapi._version import __version__
 
-__copyright__ = 'Copyright 2022 david-lev'
-__license__ = 'MIT'
-__title__ = 'meapi'
+# Submodules are imported on first access (PEP 562), so ``import meapi`` does not load requests, aiohttp and the mixins.
+_lazy_names = {
+    'Me': 'meapi.me',
+    'AsyncMe': 'meapi.aio',
+    'AsyncNotificationWatcher': 'meapi.aio',
+    'ResponseCache': 'meapi.cache',
+    'SQLiteCacheStore': 'meapi.cache',
+    'ContactImporter': 'meapi.contact_import',
+    'ContactSync': 'meapi.contact_sync',
+    'CredentialStore': 'meapi.credentials',
+    'JsonCredentialStore': 'meapi.credentials',
+    'SQLiteCredentialStore': 'meapi.credentials',
+    'MemoryCredentialStore': 'meapi.credentials',
+    'Metrics': 'meapi.metrics',
+    'MemorySink': 'meapi.metrics',
+    'PrometheusFileSink': 'meapi.metrics',
+    'CallbackSink': 'meapi.metrics',
+    'NotificationWatcher': 'meapi.watcher',
+    'SQLiteNotificationStore': 'meapi.notification_store',
+    'QuotaTracker': 'meapi.quota',
+    'RetryPolicy': 'meapi.retry',
+    'Tracer': 'meapi.tracing',
+    'MemoryExporter': 'meapi.tracing',
+    'FileExporter': 'meapi.tracing',
+    'OTLPExporter': 'meapi.tracing',
+}
+
+__all__ = list(_lazy_names) + ['__version__']
+
+
+def __getattr__(name: str):
+    module = _lazy_names.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_lazy_names))
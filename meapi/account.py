@@ -1,7 +1,11 @@
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
 from re import match
-from typing import Union, List, Tuple
-from meapi.exceptions import MeException, MeApiException
-from meapi.random_data import get_random_data
+from threading import Lock
+from time import sleep
+from typing import Callable, Union, List, Tuple
+from meapi.exceptions import MeException, MeApiException, MeConnectionException
+from meapi.util import _fit_delay
 from random import randint
 
 
@@ -47,6 +51,114 @@ def validate_calls(calls: List[dict]) -> List[dict]:
     return calls_list
 
 
+def _chunk_list(items: List[dict], chunk_size: int) -> List[List[dict]]:
+    if chunk_size < 1:
+        raise MeException("chunk_size must be at least 1!")
+    return [items[start:start + chunk_size] for start in range(0, len(items), chunk_size)]
+
+
+def _merge_chunk_results(chunks: List[List[dict]], results: List[Union[dict, None]],
+                         errors: List[Union[str, None]]) -> dict:
+    """
+    Merge the responses of the chunks: numbers are summed, lists are joined, booleans must all be true.
+    """
+    summary = {}
+    for result in results:
+        for key, value in (result if isinstance(result, dict) else {}).items():
+            if key not in summary:
+                summary[key] = list(value) if isinstance(value, list) else value
+            elif isinstance(value, bool):
+                summary[key] = summary[key] and value
+            elif key == 'count' and isinstance(value, int):  # A total after the chunk, not a change.
+                summary[key] = max(summary[key], value)
+            elif isinstance(value, (int, float)):
+                summary[key] += value
+            elif isinstance(value, list):
+                summary[key].extend(value)
+            else:
+                summary[key] = value
+    summary['chunks'] = len(chunks)
+    summary['failed'] = [item for chunk, error in zip(chunks, errors) if error is not None for item in chunk]
+    summary['errors'] = [error for error in errors if error is not None]
+    return summary
+
+
+def _prompt_registration_details(account_details: Union[dict, None]) -> Tuple[str, Union[str, None], Union[str, None], Union[bool, None]]:
+    if not account_details:
+        account_details = {}
+    print(account_details)
+    first_name = None
+    last_name = None
+    email = None
+    upload_random_data = None
+
+    if account_details.get('first_name'):
+        first_name = account_details['first_name']
+    else:
+        while not first_name:
+            first_name = input("* Enter your first name (Required): ")
+
+    if account_details.get('last_name'):
+        last_name = account_details['last_name']
+    elif not account_details:
+        last_name = input("* Enter your last name (Optional): ")
+
+    if account_details.get('email'):
+        email = account_details['email']
+    elif not account_details:
+        email = input("* Enter your email (Optional): ") or None
+
+    if account_details.get('upload_random_data'):
+        upload_random_data = account_details['upload_random_data']
+    elif not account_details:
+        answer = "X"
+        while answer.upper() not in ['Y', 'N', '']:
+            answer = input("* Do you want to upload some random data (contacts, calls, location) in order "
+                           "to initialize the account? (Enter is Y) [Y/N]: ")
+        if answer.upper() in ["Y", ""]:
+            upload_random_data = True
+        else:
+            upload_random_data = False
+    return first_name, last_name, email, upload_random_data
+
+
+def _profile_info_body(country_code: str = None, date_of_birth: str = None, device_type: str = None,
+                       login_type: str = None, email: str = None, facebook_url: str = None, first_name: str = None,
+                       last_name: str = None, gender: str = None, profile_picture_url: str = None,
+                       slogan: str = None) -> dict:
+    device_types = ['android', 'ios']
+    genders = {'M': 'M', 'F': 'F', 'N': None}
+    body = {}
+    if country_code is not None:
+        body['country_code'] = str(country_code).upper()[:2]
+    if date_of_birth is not None:
+        if not match(r"^\d{4}(\-)([0-2][0-9]|(3)[0-1])(\-)(((0)[0-9])|((1)[0-2]))$", str(date_of_birth)):
+            raise MeException("Date of birthday must be in YYYY-MM-DD format!")
+        body['date_of_birth'] = str(date_of_birth)
+    if str(device_type) in device_types:
+        body['device_type'] = str(device_type)
+    if login_type is not None:
+        body['login_type'] = str(login_type)
+    if match(r"^\S+@\S+\.\S+$", str(email)):
+        body['email'] = str(email)
+    if match(r"^\d+$", str(facebook_url)):
+        body['facebook_url'] = str(facebook_url)
+    if first_name is not None:
+        body['first_name'] = str(first_name)
+    if last_name is not None:
+        body['last_name'] = str(last_name)
+    if gender is not None:
+        if str(gender).upper() in genders.keys():
+            body['gender'] = genders.get(str(gender.upper()))
+        else:
+            raise MeException("Gender must be: 'F' for female, 'M' for Male, and 'N' for null.")
+    if match(r"(https?:\/\/.*\.(?:png|jpg))", str(profile_picture_url)):
+        body['profile_picture'] = profile_picture_url
+    if slogan is not None:
+        body['slogan'] = str(slogan)
+    return body
+
+
 class Account:
 
     def phone_search(self, phone_number: Union[str, int]) -> dict:
@@ -56,6 +168,7 @@ class Account:
         :param phone_number: International phone number format.
         :type phone_number: Union[str, int])
         :raises MeApiException: msg: ``api_search_passed_limit`` if you passed the limit (About 350 per day in the unofficial auth method).
+        :raises MeQuotaException: If the local :py:class:`~meapi.QuotaTracker` passed the limit.
         :return: Dict with information about the phone number.
         :rtype: dict
 
@@ -111,14 +224,24 @@ class Account:
                 }
             }
         """
+        phone_number = self.valid_phone_number(phone_number)
+        if self.cache is not None:
+            hit, response = self.cache.get('phone_search', phone_number)
+            if hit:
+                return response
+        self._consume_quota('phone_search')
         try:
-            response = self.make_request(req_type='get', endpoint='/main/contacts/search/?phone_number=' + str(
-                self.valid_phone_number(phone_number)))
+            response = self.make_request(req_type='get', endpoint='/main/contacts/search/?phone_number=' + str(phone_number))
         except MeApiException as err:
             if err.http_status == 404 and err.msg == 'Not found.':
+                if self.cache is not None:
+                    self.cache.set('phone_search', phone_number, {}, ttl=self.cache.negative_ttl)
                 return {}
-            else:
-                raise err
+            if err.msg == 'api_search_passed_limit' and self.quota is not None:
+                self.quota.exhaust('phone_search')
+            raise err
+        if self.cache is not None:
+            self.cache.set('phone_search', phone_number, response)
         return response
 
     def get_profile_info(self, uuid: str = None) -> dict:
@@ -130,6 +253,7 @@ class Account:
         :param uuid: uuid of the Me user. Default: your uuid.
         :type uuid: str
         :raises MeApiException: msg: ``api_profile_view_passed_limit`` if you passed the limit (About 500 per day in the unofficial auth method).
+        :raises MeQuotaException: If the local :py:class:`~meapi.QuotaTracker` passed the limit (Only when ``uuid`` is provided).
         :return: Dict with profile details
         :rtype: dict
 
@@ -293,9 +417,24 @@ class Account:
                 },
             }
         """
+        key = str(uuid) if uuid else self._own_profile_key()
+        if self.cache is not None and key is not None:
+            hit, response = self.cache.get('get_profile_info', key)
+            if hit:
+                return response
         if uuid:
-            return self.make_request('get', '/main/users/profile/' + str(uuid))
-        return self.make_request('get', '/main/users/profile/me/')
+            self._consume_quota('get_profile_info')
+            try:
+                response = self.make_request('get', '/main/users/profile/' + str(uuid))
+            except MeApiException as err:
+                if err.msg == 'api_profile_view_passed_limit' and self.quota is not None:
+                    self.quota.exhaust('get_profile_info')
+                raise err
+        else:
+            response = self.make_request('get', '/main/users/profile/me/')
+        if self.cache is not None and key is not None:
+            self.cache.set('get_profile_info', key, response)
+        return response
 
     def get_uuid(self, phone_number: Union[int, str] = None) -> Union[str, None]:
         """
@@ -311,49 +450,17 @@ class Account:
             if res:
                 return res.get('uuid')
             return None
+        if self.phone_number and not self.access_token:
+            self._login()  # The login loads the uuid from the credentials
+        if self.uuid:
+            return self.uuid
         try:
-            return self.get_profile_info()['uuid']
+            self.uuid = self.get_profile_info()['uuid']
+            return self.uuid
         except MeApiException as err:
             if err.http_status == 401:  # on login, if no active account on this number you need to register
                 print("** This is a new account and you need to register first.")
-                if self.account_details:
-                    account_details: dict = self.account_details
-                else:
-                    account_details = {}
-                print(account_details)
-                first_name = None
-                last_name = None
-                email = None
-                upload_random_data = None
-
-                if account_details.get('first_name'):
-                    first_name = account_details['first_name']
-                else:
-                    while not first_name:
-                        first_name = input("* Enter your first name (Required): ")
-
-                if account_details.get('last_name'):
-                    last_name = account_details['last_name']
-                elif not account_details:
-                    last_name = input("* Enter your last name (Optional): ")
-
-                if account_details.get('email'):
-                    email = account_details['email']
-                elif not account_details:
-                    email = input("* Enter your email (Optional): ") or None
-
-                if account_details.get('upload_random_data'):
-                    upload_random_data = account_details['upload_random_data']
-                elif not account_details:
-                    answer = "X"
-                    while answer.upper() not in ['Y', 'N', '']:
-                        answer = input("* Do you want to upload some random data (contacts, calls, location) in order "
-                                       "to initialize the account? (Enter is Y) [Y/N]: ")
-                    if answer.upper() in ["Y", ""]:
-                        upload_random_data = True
-                    else:
-                        upload_random_data = False
-
+                first_name, last_name, email, upload_random_data = _prompt_registration_details(self.account_details)
                 results = self.update_profile_info(first_name=first_name, last_name=last_name, email=email, login_type='email')
                 if results[0]:
                     msg = "** Your profile successfully created!"
@@ -407,41 +514,14 @@ class Account:
         :return: Tuple of: is update success, list of failed.
         :rtype: Tuple[bool, list]
         """
-        device_types = ['android', 'ios']
-        genders = {'M': 'M', 'F': 'F', 'N': None}
-        body = {}
-        if country_code is not None:
-            body['country_code'] = str(country_code).upper()[:2]
-        if date_of_birth is not None:
-            if not match(r"^\d{4}(\-)([0-2][0-9]|(3)[0-1])(\-)(((0)[0-9])|((1)[0-2]))$", str(date_of_birth)):
-                raise MeException("Date of birthday must be in YYYY-MM-DD format!")
-            body['date_of_birth'] = str(date_of_birth)
-        if str(device_type) in device_types:
-            body['device_type'] = str(device_type)
-        if login_type is not None:
-            body['login_type'] = str(login_type)
-        if match(r"^\S+@\S+\.\S+$", str(email)):
-            body['email'] = str(email)
-        if match(r"^\d+$", str(facebook_url)):
-            body['facebook_url'] = str(facebook_url)
-        if first_name is not None:
-            body['first_name'] = str(first_name)
-        if last_name is not None:
-            body['last_name'] = str(last_name)
-        if gender is not None:
-            if str(gender).upper() in genders.keys():
-                body['gender'] = genders.get(str(gender.upper()))
-            else:
-                raise MeException("Gender must be: 'F' for female, 'M' for Male, and 'N' for null.")
-        if match(r"(https?:\/\/.*\.(?:png|jpg))", str(profile_picture_url)):
-            body['profile_picture'] = profile_picture_url
-        if slogan is not None:
-            body['slogan'] = str(slogan)
-
+        body = _profile_info_body(country_code=country_code, date_of_birth=date_of_birth, device_type=device_type,
+                                  login_type=login_type, email=email, facebook_url=facebook_url, first_name=first_name,
+                                  last_name=last_name, gender=gender, profile_picture_url=profile_picture_url, slogan=slogan)
         if not body:
             raise MeException("You must change at least one detail!")
 
         results = self.make_request('patch', '/main/users/profile/', body)
+        self._invalidate_own_profile()
         failed = []
         for key in body.keys():
             if results[key] != body[key] and key != 'profile_picture':
@@ -461,7 +541,11 @@ class Account:
         :return: Is deleted.
         :rtype: bool
         """
-        return True if not self.make_request('delete', '/main/settings/remove-user/') else False
+        results = self.make_request('delete', '/main/settings/remove-user/')
+        self._invalidate_own_profile()  # Only the entries of this account, the cache may be shared.
+        if self.cache is not None and self.phone_number:
+            self.cache.invalidate_contact(self.phone_number)
+        return True if not results else False
 
     def suspend_account(self) -> bool:
         """
@@ -472,13 +556,30 @@ class Account:
         """
         return self.make_request('put', '/main/settings/suspend-user/')['contact_suspended']
 
-    def add_contacts(self, contacts: List[dict]):
+    def add_contacts(self,
+                     contacts: List[dict],
+                     chunk_size: Union[int, None] = None,
+                     max_concurrency: int = 4,
+                     chunk_retries: int = 2,
+                     progress: Union[Callable[[int, int], None], None] = None) -> dict:
         """
         Upload new contacts to your Me account. See :py:func:`upload_random_data`.
 
+        - With ``chunk_size``, the contacts are uploaded in chunks, ``max_concurrency`` at a time. A failed chunk is retried (Only on
+          connection errors, timeouts and the retryable statuses of :py:class:`~meapi.RetryPolicy`) and does not stop the others.
+
         :param contacts: List of dicts with contacts data.
         :type contacts: List[dict])
-        :return: Dict with upload results.
+        :param chunk_size: Max contacts in each request. Default: ``None`` (All in one request).
+        :type chunk_size: Union[int, None]
+        :param max_concurrency: Max chunks to upload at a time. Default: ``4``.
+        :type max_concurrency: int
+        :param chunk_retries: Max retries of each failed chunk. Default: ``2``.
+        :type chunk_retries: int
+        :param progress: Function that gets the count of uploaded contacts and the total, after each chunk. Default: ``None``.
+        :type progress: Union[Callable[[int, int], None], None]
+        :return: Dict with upload results. With ``chunk_size``, the results of the chunks merged (Counts summed, lists joined), with
+            ``chunks`` (Count), ``failed`` (The contacts of chunks that failed) and ``errors`` (Errors of the failed chunks).
         :rtype: dict
 
         Example of list of contacts to add::
@@ -522,9 +623,46 @@ class Account:
                 },
             ]
         """
-        body = {"add": validate_contacts(contacts), "is_first": False, "remove": []}
+        contacts = validate_contacts(contacts)
+        if chunk_size is not None:
+            return self._upload_chunks('/main/contacts/sync/', contacts,
+                                       lambda chunk: {"add": chunk, "is_first": False, "remove": []},
+                                       chunk_size, max_concurrency, chunk_retries, progress)
+        body = {"add": contacts, "is_first": False, "remove": []}
         return self.make_request('post', '/main/contacts/sync/', body)
 
+    def _upload_chunks(self, endpoint: str, items: List[dict], make_body: Callable[[List[dict]], dict], chunk_size: int,
+                       max_concurrency: int, chunk_retries: int, progress: Union[Callable[[int, int], None], None]) -> dict:
+        chunks = _chunk_list(items, chunk_size)
+        results, errors = [None] * len(chunks), [None] * len(chunks)
+        progress_lock, uploaded = Lock(), 0
+
+        def upload(index: int):
+            nonlocal uploaded
+            retry = 0
+            while True:
+                try:
+                    results[index] = self.make_request('post', endpoint, make_body(chunks[index]))
+                    break
+                except (MeApiException, MeConnectionException) as err:
+                    retry += 1
+                    if retry > chunk_retries or (isinstance(err, MeApiException) and
+                                                 not self.retry_policy.is_retryable_status(err.http_status)):
+                        errors[index] = f"Chunk {index} ({len(chunks[index])} items): {err}"
+                        return
+                    sleep(_fit_delay(self.retry_policy.backoff(retry)))
+            with progress_lock:
+                uploaded += len(chunks[index])
+                if progress is not None:
+                    progress(uploaded, len(items))
+
+        with ThreadPoolExecutor(max_workers=max(1, min(max_concurrency, len(chunks))),
+                                thread_name_prefix='meapi-upload') as executor:
+            futures = [executor.submit(copy_context().run, upload, index) for index in range(len(chunks))]
+        for future in futures:
+            future.result()  # Raises errors that are not of the chunk, like MeDeadlineException.
+        return _merge_chunk_results(chunks, results, errors)
+
     def get_saved_contacts(self) -> List[dict]:
         """
         Get all the contacts stored in your contacts (Which has an Me account).
@@ -532,7 +670,7 @@ class Account:
         :return: List of dicts with all contacts data.
         :rtype: List[dict]
         """
-        return [contact for group in self.get_groups_names['names'] for contact in group['contacts'] if contact['in_contact_list']]
+        return [contact for group in self.get_groups_names()['names'] for contact in group['contacts'] if contact['in_contact_list']]
 
     def get_unsaved_contacts(self) -> List[dict]:
         """
@@ -541,15 +679,28 @@ class Account:
         :return: List of dicts with all contacts data.
         :rtype: List[dict]
         """
-        return [contact for group in self.get_groups_names['names'] for contact in group['contacts'] if not contact['in_contact_list']]
-
-    def remove_contacts(self, contacts: List[dict]) -> dict:
+        return [contact for group in self.get_groups_names()['names'] for contact in group['contacts'] if not contact['in_contact_list']]
+
+    def remove_contacts(self,
+                        contacts: List[dict],
+                        chunk_size: Union[int, None] = None,
+                        max_concurrency: int = 4,
+                        chunk_retries: int = 2,
+                        progress: Union[Callable[[int, int], None], None] = None) -> dict:
         """
-        Remove contacts from your Me account.
+        Remove contacts from your Me account. With ``chunk_size``, in chunks like :py:func:`add_contacts`.
 
         :param contacts: List of dicts with contacts data.
         :type contacts: List[dict])
-        :return: Dict with upload results.
+        :param chunk_size: Max contacts in each request. Default: ``None`` (All in one request).
+        :type chunk_size: Union[int, None]
+        :param max_concurrency: Max chunks to upload at a time. Default: ``4``.
+        :type max_concurrency: int
+        :param chunk_retries: Max retries of each failed chunk. Default: ``2``.
+        :type chunk_retries: int
+        :param progress: Function that gets the count of uploaded contacts and the total, after each chunk. Default: ``None``.
+        :type progress: Union[Callable[[int, int], None], None]
+        :return: Dict with upload results (Merged with ``chunks``, ``failed`` and ``errors``, see :py:func:`add_contacts`).
         :rtype: dict
 
         Example of list of contacts to remove::
@@ -593,16 +744,34 @@ class Account:
                 },
             ]
         """
-        body = {"add": [], "is_first": False, "remove": validate_contacts(contacts)}
+        contacts = validate_contacts(contacts)
+        if chunk_size is not None:
+            return self._upload_chunks('/main/contacts/sync/', contacts,
+                                       lambda chunk: {"add": [], "is_first": False, "remove": chunk},
+                                       chunk_size, max_concurrency, chunk_retries, progress)
+        body = {"add": [], "is_first": False, "remove": contacts}
         return self.make_request('post', '/main/contacts/sync/', body)
 
-    def add_calls_to_log(self, calls: List[dict]) -> dict:
+    def add_calls_to_log(self,
+                         calls: List[dict],
+                         chunk_size: Union[int, None] = None,
+                         max_concurrency: int = 4,
+                         chunk_retries: int = 2,
+                         progress: Union[Callable[[int, int], None], None] = None) -> dict:
         """
-        Add call to your calls log. See :py:func:`upload_random_data`.
+        Add call to your calls log. See :py:func:`upload_random_data`. With ``chunk_size``, in chunks like :py:func:`add_contacts`.
 
         :param calls: List of dicts with calls data.
         :type calls: List[dict]
-        :return: dict with upload result.
+        :param chunk_size: Max calls in each request. Default: ``None`` (All in one request).
+        :type chunk_size: Union[int, None]
+        :param max_concurrency: Max chunks to upload at a time. Default: ``4``.
+        :type max_concurrency: int
+        :param chunk_retries: Max retries of each failed chunk. Default: ``2``.
+        :type chunk_retries: int
+        :param progress: Function that gets the count of uploaded calls and the total, after each chunk. Default: ``None``.
+        :type progress: Union[Callable[[int, int], None], None]
+        :return: dict with upload result (Merged with ``chunks``, ``failed`` and ``errors``, see :py:func:`add_contacts`).
         :rtype: dict
 
         Example of list of calls to add::
@@ -634,16 +803,34 @@ class Account:
                 },
             ]
         """
-        body = {"add": validate_calls(calls), "remove": []}
+        calls = validate_calls(calls)
+        if chunk_size is not None:
+            return self._upload_chunks('/main/call-log/change-sync/', calls,
+                                       lambda chunk: {"add": chunk, "remove": []},
+                                       chunk_size, max_concurrency, chunk_retries, progress)
+        body = {"add": calls, "remove": []}
         return self.make_request('post', '/main/call-log/change-sync/', body)
 
-    def remove_calls_from_log(self, calls: List[dict]) -> dict:
+    def remove_calls_from_log(self,
+                              calls: List[dict],
+                              chunk_size: Union[int, None] = None,
+                              max_concurrency: int = 4,
+                              chunk_retries: int = 2,
+                              progress: Union[Callable[[int, int], None], None] = None) -> dict:
         """
-        Remove calls from your calls log.
+        Remove calls from your calls log. With ``chunk_size``, in chunks like :py:func:`add_contacts`.
 
         :param calls: List of dicts with calls data.
         :type calls: List[dict]
-        :return: dict with upload result.
+        :param chunk_size: Max calls in each request. Default: ``None`` (All in one request).
+        :type chunk_size: Union[int, None]
+        :param max_concurrency: Max chunks to upload at a time. Default: ``4``.
+        :type max_concurrency: int
+        :param chunk_retries: Max retries of each failed chunk. Default: ``2``.
+        :type chunk_retries: int
+        :param progress: Function that gets the count of uploaded calls and the total, after each chunk. Default: ``None``.
+        :type progress: Union[Callable[[int, int], None], None]
+        :return: dict with upload result (Merged with ``chunks``, ``failed`` and ``errors``, see :py:func:`add_contacts`).
         :rtype: dict
 
         Example of list of calls to remove::
@@ -675,7 +862,12 @@ class Account:
                 },
             ]
         """
-        body = {"add": [], "remove": validate_calls(calls)}
+        calls = validate_calls(calls)
+        if chunk_size is not None:
+            return self._upload_chunks('/main/call-log/change-sync/', calls,
+                                       lambda chunk: {"add": [], "remove": chunk},
+                                       chunk_size, max_concurrency, chunk_retries, progress)
+        body = {"add": [], "remove": calls}
         return self.make_request('post', '/main/call-log/change-sync/', body)
 
     def block_profile(self, phone_number: Union[str, int], block_contact=True, me_full_block=True) -> bool:
@@ -693,7 +885,10 @@ class Account:
         """
         body = {"block_contact": block_contact, "me_full_block": me_full_block,
                 "phone_number": str(self.valid_phone_number(phone_number))}
-        return self.make_request('post', '/main/users/profile/block/', body)['success']
+        results = self.make_request('post', '/main/users/profile/block/', body)
+        if self.cache is not None:
+            self.cache.invalidate_contact(body['phone_number'])
+        return results['success']
 
     def unblock_profile(self, phone_number: int, block_contact=False, me_full_block=False) -> bool:
         """
@@ -710,7 +905,10 @@ class Account:
         """
         body = {"block_contact": block_contact, "me_full_block": me_full_block,
                 "phone_number": str(self.valid_phone_number(phone_number))}
-        return self.make_request('post', '/main/users/profile/block/', body)['success']
+        results = self.make_request('post', '/main/users/profile/block/', body)
+        if self.cache is not None:
+            self.cache.invalidate_contact(body['phone_number'])
+        return results['success']
 
     def block_numbers(self, numbers: Union[int, List[int]]) -> bool:
         """
@@ -734,7 +932,11 @@ class Account:
         if not isinstance(numbers, list):
             numbers = [numbers]
         body = {"phone_numbers": numbers}
-        return self.make_request('post', '/main/users/profile/bulk-block/', body)['block_contact']
+        results = self.make_request('post', '/main/users/profile/bulk-block/', body)
+        if self.cache is not None:
+            for number in numbers:
+                self.cache.invalidate_contact(self.valid_phone_number(number))
+        return results['block_contact']
 
     def unblock_numbers(self, numbers: Union[int, List[int]]) -> bool:
         """
@@ -748,7 +950,11 @@ class Account:
         if not isinstance(numbers, list):
             numbers = [numbers]
         body = {"phone_numbers": numbers}
-        return self.make_request('post', '/main/users/profile/bulk-unblock/', body)['success']
+        results = self.make_request('post', '/main/users/profile/bulk-unblock/', body)
+        if self.cache is not None:
+            for number in numbers:
+                self.cache.invalidate_contact(self.valid_phone_number(number))
+        return results['success']
 
     def get_blocked_numbers(self) -> List[dict]:
         """
@@ -794,7 +1000,10 @@ class Account:
         :return: is sharing success.
         :rtype: bool
         """
-        return self.make_request('post', '/main/users/profile/share-location/' + str(uuid) + "/")['success']
+        results = self.make_request('post', '/main/users/profile/share-location/' + str(uuid) + "/")
+        if self.cache is not None:
+            self.cache.invalidate('get_profile_info', uuid)
+        return results['success']
 
     def get_distance(self, uuid: str) -> Union[float, None]:
         """
@@ -837,7 +1046,11 @@ class Account:
         if not isinstance(uuids, list):
             uuids = [uuids]
         body = {"uuids": uuids}
-        return self.make_request('post', '/main/users/profile/share-location/stop/', body)['success']
+        results = self.make_request('post', '/main/users/profile/share-location/stop/', body)
+        if self.cache is not None:
+            for uuid in uuids:
+                self.cache.invalidate('get_profile_info', uuid)
+        return results['success']
 
     def locations_shared_by_me(self) -> List[dict]:
         """
@@ -902,6 +1115,7 @@ class Account:
         :return: Is uploading success.
         :rtype: bool
         """
+        from meapi.random_data import get_random_data  # Large lists, used only here.
         random_data = get_random_data(contacts, calls, location)
         if contacts:
             self.add_contacts(random_data['contacts'])
@@ -0,0 +1,19 @@
+from importlib import import_module
+
+# Imported on first access, so ``import meapi.aio`` does not load aiohttp.
+_lazy_names = {
+    'AsyncMe': 'meapi.aio.me',
+    'AsyncNotificationWatcher': 'meapi.aio.watcher',
+}
+
+
+def __getattr__(name: str):
+    module = _lazy_names.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+__all__ = list(_lazy_names)
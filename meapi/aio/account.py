@@ -0,0 +1,375 @@
+from asyncio import gather, get_running_loop, sleep, Semaphore
+from inspect import isawaitable
+from typing import Callable, Union, List, Tuple
+from meapi.account import validate_contacts, validate_calls, _prompt_registration_details, _profile_info_body, \
+    _chunk_list, _merge_chunk_results
+from meapi.exceptions import MeException, MeApiException, MeConnectionException
+from meapi.util import _fit_delay
+
+
+class AsyncAccount:
+
+    async def phone_search(self, phone_number: Union[str, int]) -> dict:
+        """
+        Async version of :py:func:`~meapi.Me.phone_search`.
+        """
+        phone_number = self.valid_phone_number(phone_number)
+        if self.cache is not None:
+            hit, response = self.cache.get('phone_search', phone_number)
+            if hit:
+                return response
+        await self._consume_quota('phone_search')
+        try:
+            response = await self.make_request(req_type='get', endpoint='/main/contacts/search/?phone_number=' + str(phone_number))
+        except MeApiException as err:
+            if err.http_status == 404 and err.msg == 'Not found.':
+                if self.cache is not None:
+                    self.cache.set('phone_search', phone_number, {}, ttl=self.cache.negative_ttl)
+                return {}
+            if err.msg == 'api_search_passed_limit' and self.quota is not None:
+                self.quota.exhaust('phone_search')
+            raise err
+        if self.cache is not None:
+            self.cache.set('phone_search', phone_number, response)
+        return response
+
+    async def get_profile_info(self, uuid: str = None) -> dict:
+        """
+        Async version of :py:func:`~meapi.Me.get_profile_info`.
+        """
+        key = str(uuid) if uuid else self._own_profile_key()
+        if self.cache is not None and key is not None:
+            hit, response = self.cache.get('get_profile_info', key)
+            if hit:
+                return response
+        if uuid:
+            await self._consume_quota('get_profile_info')
+            try:
+                response = await self.make_request('get', '/main/users/profile/' + str(uuid))
+            except MeApiException as err:
+                if err.msg == 'api_profile_view_passed_limit' and self.quota is not None:
+                    self.quota.exhaust('get_profile_info')
+                raise err
+        else:
+            response = await self.make_request('get', '/main/users/profile/me/')
+        if self.cache is not None and key is not None:
+            self.cache.set('get_profile_info', key, response)
+        return response
+
+    async def get_uuid(self, phone_number: Union[int, str] = None) -> Union[str, None]:
+        """
+        Async version of :py:func:`~meapi.Me.get_uuid`.
+        """
+        if phone_number:
+            res = (await self.phone_search(phone_number)).get('contact').get('user')
+            if res:
+                return res.get('uuid')
+            return None
+        if self.phone_number and not self.access_token:
+            await self._login()  # The login loads the uuid from the credentials
+        if self.uuid:
+            return self.uuid
+        try:
+            self.uuid = (await self.get_profile_info())['uuid']
+            return self.uuid
+        except MeApiException as err:
+            if err.http_status == 401:  # on login, if no active account on this number you need to register
+                print("** This is a new account and you need to register first.")
+                # The prompts block on input(), so they run in a thread and not on the event loop.
+                first_name, last_name, email, upload_random_data = await get_running_loop().run_in_executor(
+                    None, _prompt_registration_details, self.account_details)
+                results = await self.update_profile_info(first_name=first_name, last_name=last_name, email=email, login_type='email')
+                if results[0]:
+                    msg = "** Your profile successfully created!"
+                    if upload_random_data:
+                        await self.upload_random_data()
+                        msg += "\n* But you may not be able to perform searches for a few hours. It my help to " \
+                               "upload some data. You can use in me.upload_random_data() or other account methods to " \
+                               "activate your account."
+                    print(msg)
+                    return await self.get_uuid()
+                raise MeException("Can't update the following details: " + ", ".join(results[1]))
+            else:
+                raise err
+
+    async def update_profile_info(self, country_code: str = None,
+                                  date_of_birth: str = None,
+                                  device_type: str = None,
+                                  login_type: str = None,
+                                  email: str = None,
+                                  facebook_url: str = None,
+                                  first_name: str = None,
+                                  last_name: str = None,
+                                  gender: str = None,
+                                  profile_picture_url: str = None,
+                                  slogan: str = None) -> Tuple[bool, list]:
+        """
+        Async version of :py:func:`~meapi.Me.update_profile_info`.
+        """
+        body = _profile_info_body(country_code=country_code, date_of_birth=date_of_birth, device_type=device_type,
+                                  login_type=login_type, email=email, facebook_url=facebook_url, first_name=first_name,
+                                  last_name=last_name, gender=gender, profile_picture_url=profile_picture_url, slogan=slogan)
+        if not body:
+            raise MeException("You must change at least one detail!")
+
+        results = await self.make_request('patch', '/main/users/profile/', body)
+        self._invalidate_own_profile()
+        failed = []
+        for key in body.keys():
+            if results[key] != body[key] and key != 'profile_picture':
+                failed.append(key)
+        return not bool(failed), failed
+
+    async def delete_account(self) -> bool:
+        """
+        Async version of :py:func:`~meapi.Me.delete_account`.
+        """
+        results = await self.make_request('delete', '/main/settings/remove-user/')
+        self._invalidate_own_profile()  # Only the entries of this account, the cache may be shared.
+        if self.cache is not None and self.phone_number:
+            self.cache.invalidate_contact(self.phone_number)
+        return True if not results else False
+
+    async def suspend_account(self) -> bool:
+        """
+        Async version of :py:func:`~meapi.Me.suspend_account`.
+        """
+        return (await self.make_request('put', '/main/settings/suspend-user/'))['contact_suspended']
+
+    async def add_contacts(self,
+                           contacts: List[dict],
+                           chunk_size: Union[int, None] = None,
+                           max_concurrency: int = 4,
+                           chunk_retries: int = 2,
+                           progress: Union[Callable[[int, int], None], None] = None) -> dict:
+        """
+        Async version of :py:func:`~meapi.Me.add_contacts`.
+        """
+        contacts = validate_contacts(contacts)
+        if chunk_size is not None:
+            return await self._upload_chunks('/main/contacts/sync/', contacts,
+                                             lambda chunk: {"add": chunk, "is_first": False, "remove": []},
+                                             chunk_size, max_concurrency, chunk_retries, progress)
+        body = {"add": contacts, "is_first": False, "remove": []}
+        return await self.make_request('post', '/main/contacts/sync/', body)
+
+    async def _upload_chunks(self, endpoint: str, items: List[dict], make_body: Callable[[List[dict]], dict],
+                             chunk_size: int, max_concurrency: int, chunk_retries: int,
+                             progress: Union[Callable[[int, int], None], None]) -> dict:
+        chunks = _chunk_list(items, chunk_size)
+        results, errors = [None] * len(chunks), [None] * len(chunks)
+        slots, uploaded = Semaphore(max(1, max_concurrency)), 0
+
+        async def upload(index: int):
+            nonlocal uploaded
+            retry = 0
+            async with slots:
+                while True:
+                    try:
+                        results[index] = await self.make_request('post', endpoint, make_body(chunks[index]))
+                        break
+                    except (MeApiException, MeConnectionException) as err:
+                        retry += 1
+                        if retry > chunk_retries or (isinstance(err, MeApiException) and
+                                                     not self.retry_policy.is_retryable_status(err.http_status)):
+                            errors[index] = f"Chunk {index} ({len(chunks[index])} items): {err}"
+                            return
+                        await sleep(_fit_delay(self.retry_policy.backoff(retry)))
+            uploaded += len(chunks[index])
+            if progress is not None:
+                result = progress(uploaded, len(items))
+                if isawaitable(result):
+                    await result
+
+        await gather(*(upload(index) for index in range(len(chunks))))
+        return _merge_chunk_results(chunks, results, errors)
+
+    async def get_saved_contacts(self) -> List[dict]:
+        """
+        Async version of :py:func:`~meapi.Me.get_saved_contacts`.
+        """
+        return [contact for group in (await self.get_groups_names())['names'] for contact in group['contacts'] if contact['in_contact_list']]
+
+    async def get_unsaved_contacts(self) -> List[dict]:
+        """
+        Async version of :py:func:`~meapi.Me.get_unsaved_contacts`.
+        """
+        return [contact for group in (await self.get_groups_names())['names'] for contact in group['contacts'] if not contact['in_contact_list']]
+
+    async def remove_contacts(self,
+                              contacts: List[dict],
+                              chunk_size: Union[int, None] = None,
+                              max_concurrency: int = 4,
+                              chunk_retries: int = 2,
+                              progress: Union[Callable[[int, int], None], None] = None) -> dict:
+        """
+        Async version of :py:func:`~meapi.Me.remove_contacts`.
+        """
+        contacts = validate_contacts(contacts)
+        if chunk_size is not None:
+            return await self._upload_chunks('/main/contacts/sync/', contacts,
+                                             lambda chunk: {"add": [], "is_first": False, "remove": chunk},
+                                             chunk_size, max_concurrency, chunk_retries, progress)
+        body = {"add": [], "is_first": False, "remove": contacts}
+        return await self.make_request('post', '/main/contacts/sync/', body)
+
+    async def add_calls_to_log(self,
+                               calls: List[dict],
+                               chunk_size: Union[int, None] = None,
+                               max_concurrency: int = 4,
+                               chunk_retries: int = 2,
+                               progress: Union[Callable[[int, int], None], None] = None) -> dict:
+        """
+        Async version of :py:func:`~meapi.Me.add_calls_to_log`.
+        """
+        calls = validate_calls(calls)
+        if chunk_size is not None:
+            return await self._upload_chunks('/main/call-log/change-sync/', calls,
+                                             lambda chunk: {"add": chunk, "remove": []},
+                                             chunk_size, max_concurrency, chunk_retries, progress)
+        body = {"add": calls, "remove": []}
+        return await self.make_request('post', '/main/call-log/change-sync/', body)
+
+    async def remove_calls_from_log(self,
+                                    calls: List[dict],
+                                    chunk_size: Union[int, None] = None,
+                                    max_concurrency: int = 4,
+                                    chunk_retries: int = 2,
+                                    progress: Union[Callable[[int, int], None], None] = None) -> dict:
+        """
+        Async version of :py:func:`~meapi.Me.remove_calls_from_log`.
+        """
+        calls = validate_calls(calls)
+        if chunk_size is not None:
+            return await self._upload_chunks('/main/call-log/change-sync/', calls,
+                                             lambda chunk: {"add": [], "remove": chunk},
+                                             chunk_size, max_concurrency, chunk_retries, progress)
+        body = {"add": [], "remove": calls}
+        return await self.make_request('post', '/main/call-log/change-sync/', body)
+
+    async def block_profile(self, phone_number: Union[str, int], block_contact=True, me_full_block=True) -> bool:
+        """
+        Async version of :py:func:`~meapi.Me.block_profile`.
+        """
+        body = {"block_contact": block_contact, "me_full_block": me_full_block,
+                "phone_number": str(self.valid_phone_number(phone_number))}
+        results = await self.make_request('post', '/main/users/profile/block/', body)
+        if self.cache is not None:
+            self.cache.invalidate_contact(body['phone_number'])
+        return results['success']
+
+    async def unblock_profile(self, phone_number: int, block_contact=False, me_full_block=False) -> bool:
+        """
+        Async version of :py:func:`~meapi.Me.unblock_profile`.
+        """
+        body = {"block_contact": block_contact, "me_full_block": me_full_block,
+                "phone_number": str(self.valid_phone_number(phone_number))}
+        results = await self.make_request('post', '/main/users/profile/block/', body)
+        if self.cache is not None:
+            self.cache.invalidate_contact(body['phone_number'])
+        return results['success']
+
+    async def block_numbers(self, numbers: Union[int, List[int]]) -> bool:
+        """
+        Async version of :py:func:`~meapi.Me.block_numbers`.
+        """
+        if not isinstance(numbers, list):
+            numbers = [numbers]
+        body = {"phone_numbers": numbers}
+        results = await self.make_request('post', '/main/users/profile/bulk-block/', body)
+        if self.cache is not None:
+            for number in numbers:
+                self.cache.invalidate_contact(self.valid_phone_number(number))
+        return results['block_contact']
+
+    async def unblock_numbers(self, numbers: Union[int, List[int]]) -> bool:
+        """
+        Async version of :py:func:`~meapi.Me.unblock_numbers`.
+        """
+        if not isinstance(numbers, list):
+            numbers = [numbers]
+        body = {"phone_numbers": numbers}
+        results = await self.make_request('post', '/main/users/profile/bulk-unblock/', body)
+        if self.cache is not None:
+            for number in numbers:
+                self.cache.invalidate_contact(self.valid_phone_number(number))
+        return results['success']
+
+    async def get_blocked_numbers(self) -> List[dict]:
+        """
+        Async version of :py:func:`~meapi.Me.get_blocked_numbers`.
+        """
+        return await self.make_request('get', '/main/settings/blocked-phone-numbers/')
+
+    async def update_location(self, lat: float, lon: float) -> bool:
+        """
+        Async version of :py:func:`~meapi.Me.update_location`.
+        """
+        if not isinstance(lat, float) or not isinstance(lon, float):
+            raise Exception("Not a valid coordination!")
+        body = {"location_latitude": float(lat), "location_longitude": float(lon)}
+        return (await self.make_request('post', '/main/location/update/', body))['success']
+
+    async def share_location(self, uuid: str) -> bool:
+        """
+        Async version of :py:func:`~meapi.Me.share_location`.
+        """
+        results = await self.make_request('post', '/main/users/profile/share-location/' + str(uuid) + "/")
+        if self.cache is not None:
+            self.cache.invalidate('get_profile_info', uuid)
+        return results['success']
+
+    async def get_distance(self, uuid: str) -> Union[float, None]:
+        """
+        Async version of :py:func:`~meapi.Me.get_distance`.
+        """
+        results = await self.get_profile_info(uuid)
+        if results['profile'].get('distance'):
+            return results['profile']['distance']
+        return None
+
+    async def stop_sharing_location(self, uuids: Union[str, List[str]]) -> bool:
+        """
+        Async version of :py:func:`~meapi.Me.stop_sharing_location`.
+        """
+        if not isinstance(uuids, list):
+            uuids = [uuids]
+        body = {"uuids": uuids}
+        return (await self.make_request('post', '/main/users/profile/share-location/stop-for-me/', body))['success']
+
+    async def stop_shared_location(self, uuids: Union[str, List[str]]) -> bool:
+        """
+        Async version of :py:func:`~meapi.Me.stop_shared_location`.
+        """
+        if not isinstance(uuids, list):
+            uuids = [uuids]
+        body = {"uuids": uuids}
+        results = await self.make_request('post', '/main/users/profile/share-location/stop/', body)
+        if self.cache is not None:
+            for uuid in uuids:
+                self.cache.invalidate('get_profile_info', uuid)
+        return results['success']
+
+    async def locations_shared_by_me(self) -> List[dict]:
+        """
+        Async version of :py:func:`~meapi.Me.locations_shared_by_me`.
+        """
+        return await self.make_request('get', '/main/users/profile/share-location/')
+
+    async def locations_shared_with_me(self) -> dict:
+        """
+        Async version of :py:func:`~meapi.Me.locations_shared_with_me`.
+        """
+
+    async def upload_random_data(self, contacts=True, calls=True, location=True):
+        """
+        Async version of :py:func:`~meapi.Me.upload_random_data`.
+        """
+        from meapi.random_data import get_random_data  # Large lists, used only here.
+        random_data = get_random_data(contacts, calls, location)
+        if contacts:
+            await self.add_contacts(random_data['contacts'])
+        if calls:
+            await self.add_calls_to_log(random_data['calls'])
+        if location:
+            await self.update_location(random_data['location']['lat'], random_data['location']['lon'])
@@ -0,0 +1,156 @@
+from asyncio import AbstractEventLoop, Lock, sleep, get_running_loop
+from typing import Union
+from weakref import WeakKeyDictionary, ref
+from meapi.auth import Auth, _prompt_activation_code, _refreshing, _refresh_delay
+from meapi.exceptions import MeException, MeApiException
+
+# An asyncio lock is bound to the event loop that first waits on it, so the locks are kept by loop (And by refresh lock).
+_refresh_locks: 'WeakKeyDictionary[AbstractEventLoop, WeakKeyDictionary[object, Lock]]' = WeakKeyDictionary()
+
+
+def _start_proactive_refresh(client_ref, used_token: str):
+    # The timer holds a weak reference, so a client that was not closed is still collected.
+    client = client_ref()
+    if client is not None:
+        client._refresh_task = get_running_loop().create_task(client._proactive_refresh(used_token))
+
+
+class AsyncAuth(Auth):
+    async def activate_account(self, activation_code: Union[int, str, None] = None) -> bool:
+        """
+        Async version of :py:func:`~meapi.Me.activate_account`.
+        """
+        if not activation_code and self.activation_code:
+            activation_code = self.activation_code
+
+        # The prompt blocks on input(), so it runs in a thread and not on the event loop.
+        activation_code = await get_running_loop().run_in_executor(None, _prompt_activation_code, self.phone_number,
+                                                                   activation_code)
+        data = {
+            "activation_code": activation_code,
+            "activation_type": "sms",
+            "phone_number": int(self.phone_number)
+        }
+        try:
+            print("** Trying to verify...")
+            results = await self.make_request(req_type='post', endpoint='/auth/authorization/activate/', body=data, auth=False)
+            if results.get('access'):
+                access_token = results['access']
+            else:
+                raise MeException(str(results))
+        except MeApiException as err:
+            if err.http_status == 400 and err.msg == 'api_incorrect_activation_code':
+                err.reason = "Wrong activation code!"
+            raise err
+
+        if access_token:
+            print("Verification completed.")
+            self.access_token = access_token
+            await self.credentials_manager(results)
+            return True
+        else:
+            return False
+
+    async def generate_access_token(self) -> bool:
+        """
+        Async version of :py:func:`~meapi.Me.generate_access_token`.
+        """
+        auth_data = await self.credentials_manager()
+        if not auth_data:
+            if await self.activate_account():
+                return True
+        body = {"phone_number": str(self.phone_number),
+                "pwd_token": auth_data['pwd_token']}
+        print("Generating new access token...")
+        try:
+            auth_data = await self.make_request(req_type='post', endpoint='/auth/authorization/login/', body=body, auth=False)
+        except MeApiException as err:
+            if err.http_status == 400 and err.msg == 'api_incorrect_pwd_token':
+                err.reason = f"Your pwd_token in {self.config_file} is broken (You probably activated the account elsewhere)."
+            raise err
+        access_token = auth_data['access']
+        if access_token:
+            print("Success to generate new token.")
+            self.access_token = access_token
+            await self.credentials_manager(auth_data)
+            return True
+        return False
+
+    async def credentials_manager(self, data: Union[dict, None] = None) -> dict:
+        """
+        Async version of :py:func:`~meapi.Me.credentials_manager`.
+        """
+        existing_content = self._credentials.get(self.phone_number)
+        if not data:
+            if not existing_content:
+                if await self.activate_account():
+                    return await self.credentials_manager()
+            else:
+                self.uuid = existing_content['uuid']
+                return existing_content
+        else:
+            if not data.get('access') or not data.get('refresh'):
+                raise MeException(f"Wrong data provided! {data}")
+
+            uuid = (existing_content or {}).get('uuid') or await self.get_uuid()
+            self.uuid = uuid
+            return self._save_credentials(data, uuid)
+
+    async def _login(self):
+        # Concurrent first calls wait here for a single login instead of each one logging in.
+        if self._login_lock is None:
+            self._login_lock = Lock()
+        async with self._login_lock:
+            if not self.access_token:
+                auth_data = await self.credentials_manager()
+                if auth_data:
+                    self.access_token = auth_data['access']
+
+    async def _refresh_access_token(self, used_token: Union[str, None]):
+        # Same single-flight flow as Auth._refresh_access_token.
+        if _refreshing.get():  # Nested refresh inside a refresh
+            await self.generate_access_token()
+            return
+        # The refresh lock is re-entrant for all the tasks of the event loop thread,
+        # so the tasks of this process are serialized by an asyncio lock first.
+        refresh_lock = self._refresh_lock()
+        task_lock = _refresh_locks.setdefault(get_running_loop(), WeakKeyDictionary()).setdefault(refresh_lock, Lock())
+        token = _refreshing.set(True)
+        try:
+            async with task_lock:
+                while not refresh_lock.acquire(blocking=False):
+                    await sleep(0.05)
+                try:
+                    if self.access_token != used_token:
+                        return
+                    auth_data = self._credentials.get(self.phone_number)
+                    if auth_data and auth_data.get('access') and auth_data['access'] != used_token:
+                        self.access_token = auth_data['access']
+                        return
+                    await self.generate_access_token()
+                finally:
+                    refresh_lock.release()
+        finally:
+            _refreshing.reset(token)
+
+    def _schedule_token_refresh(self):
+        # Same as Auth._schedule_token_refresh, on the event loop. Without a running loop (On init),
+        # the next token change inside the loop schedules it.
+        if self._refresh_timer is not None:
+            self._refresh_timer.cancel()
+            self._refresh_timer = None
+        expires_in = self.token_expires_in
+        if self.refresh_margin is None or expires_in is None or not self.phone_number:
+            return
+        try:
+            loop = get_running_loop()
+        except RuntimeError:
+            return
+        self._refresh_timer = loop.call_later(_refresh_delay(expires_in, self.refresh_margin),
+                                              _start_proactive_refresh, ref(self), self.access_token)
+
+    async def _proactive_refresh(self, used_token: str):
+        try:
+            await self._refresh_access_token(used_token)
+        except Exception as err:
+            print(f"Failed to refresh the access token in the background: {err}")
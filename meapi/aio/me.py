@@ -0,0 +1,130 @@
+from typing import Callable, Dict, List, Union
+from meapi.aio.account import AsyncAccount
+from meapi.aio.auth import AsyncAuth
+from meapi.aio.notifications import AsyncNotifications, _AsyncReadCoalescer
+from meapi.aio.settings import AsyncSettings
+from meapi.aio.social import AsyncSocial
+from meapi.aio.transport import AsyncTransport, AiohttpTransport
+from meapi.aio.util import AsyncUtil, ClientSession
+from meapi.exceptions import MeException
+from meapi.cache import ResponseCache
+from meapi.credentials import CredentialStore
+from meapi.metrics import Metrics
+from meapi.quota import QuotaTracker
+from meapi.retry import RetryPolicy
+from meapi.tracing import Tracer, trace_methods
+from meapi.util import _setup_hooks
+
+
+@trace_methods
+class AsyncMe(AsyncAuth, AsyncAccount, AsyncSocial, AsyncSettings, AsyncNotifications, AsyncUtil):
+    """
+    Async client for MeAPI. Has the same methods, return values and exceptions as :py:class:`~meapi.Me`, but every method is a coroutine.
+
+    - Requires ``aiohttp``: ``pip3 install -U meapi[async]``.
+    - Creating the client does no network I/O. The login (and the activation prompt, if needed) happens on the first request.
+
+    :param phone_number: International phone number format. Default: ``None``.
+    :type phone_number: Union[str, int, None]
+    :param activation_code: You can provide the ``activation_code`` from Me in advance, without the need for a prompt. Default = ``None``.
+    :type activation_code: Union[int, str, None]
+    :param access_token: Official access token. Default: ``None``.
+    :type access_token: Union[str, None]
+    :param account_details: Login details in dict format, see :py:class:`~meapi.Me`. Default: ``None``
+    :type account_details: dict
+    :param config_file: Path to credentials json file. Default: ``config.json``.
+    :type config_file: Union[str, None]
+    :param credential_store: Where to keep the credentials, see :py:class:`~meapi.CredentialStore`. Default: ``None`` (:py:class:`~meapi.JsonCredentialStore` of ``config_file``).
+    :type credential_store: Union[CredentialStore, None]
+    :param proxies: Dict with proxy configuration. Default: ``None``.
+    :type proxies: dict
+    :param session: Shared aiohttp session, see :py:func:`~meapi.aio.util.create_async_session`. Default: ``None`` (New session for this instance).
+    :type session: Union[aiohttp.ClientSession, None]
+    :param pool_limit: Max connections to keep open in total, when creating a new session. Default: ``100``.
+    :type pool_limit: int
+    :param pool_limit_per_host: Max connections to keep open for each host, when creating a new session. Default: ``10``.
+    :type pool_limit_per_host: int
+    :param retry_policy: Retry policy for transient failures. Default: ``None`` (:py:class:`~meapi.RetryPolicy` defaults).
+    :type retry_policy: Union[RetryPolicy, None]
+    :param connect_timeout: Seconds to wait for a connection to the server. ``None`` to wait forever. Default: ``10``.
+    :type connect_timeout: Union[float, None]
+    :param read_timeout: Seconds to wait for the server between bytes of the response. ``None`` to wait forever. Default: ``30``.
+    :type read_timeout: Union[float, None]
+    :param quota: Client-side quota tracker for searches and profile views. Default: ``None`` (No local quota).
+    :type quota: Union[QuotaTracker, None]
+    :param cache: Cache for searches and profiles. Default: ``None`` (No cache).
+    :type cache: Union[ResponseCache, None]
+    :param metrics: Record metrics of the requests, see :py:class:`~meapi.Metrics`. Default: ``None`` (No metrics).
+    :type metrics: Union[Metrics, None]
+    :param refresh_margin: Refresh the access token in the background this many seconds before it expires. ``None`` to refresh only after the server rejects it. Default: ``60``.
+    :type refresh_margin: Union[float, None]
+    :param transport: Send the requests through this transport instead of ``aiohttp``, see :py:class:`~meapi.aio.transport.AsyncTransport`. ``proxies``, ``session`` and the pool arguments are ignored. Default: ``None``.
+    :type transport: Union[AsyncTransport, None]
+    :param hooks: Functions (Or coroutine functions) to run on every request attempt, by event: ``before_request`` and ``after_response`` (See :py:func:`~meapi.Me.make_request`). Default: ``None``.
+    :type hooks: Union[Dict[str, Union[Callable, List[Callable]]], None]
+    :param tracer: Trace the methods and their requests, see :py:class:`~meapi.Tracer`. Default: ``None`` (No tracing).
+    :type tracer: Union[Tracer, None]
+
+    Example::
+
+        async with AsyncMe(phone_number=972123456789) as me:
+            results = await asyncio.gather(*(me.phone_search(number) for number in numbers))
+    """
+    def __init__(self,
+                 phone_number: Union[int, str, None] = None,
+                 activation_code: Union[int, str, None] = None,
+                 access_token: Union[str, None] = None,
+                 account_details: dict = None,
+                 config_file: Union[str, None] = 'config.json',
+                 credential_store: Union[CredentialStore, None] = None,
+                 proxies: dict = None,
+                 session: Union['ClientSession', None] = None,
+                 pool_limit: int = 100,
+                 pool_limit_per_host: int = 10,
+                 retry_policy: Union[RetryPolicy, None] = None,
+                 connect_timeout: Union[float, None] = 10,
+                 read_timeout: Union[float, None] = 30,
+                 quota: Union[QuotaTracker, None] = None,
+                 cache: Union[ResponseCache, None] = None,
+                 refresh_margin: Union[float, None] = 60,
+                 transport: Union[AsyncTransport, None] = None,
+                 metrics: Union[Metrics, None] = None,
+                 hooks: Union[Dict[str, Union[Callable, List[Callable]]], None] = None,
+                 tracer: Union[Tracer, None] = None):
+        if ClientSession is None:
+            raise MeException("The async client requires aiohttp. Install it with: pip3 install -U meapi[async]")
+        self.tracer = tracer
+        self.hooks = _setup_hooks(hooks)
+        self.refresh_margin = refresh_margin
+        self._refresh_timer = None
+        self._refresh_task = None
+        self._login_lock = None  # An asyncio lock, created in the event loop of the first login.
+        self._setup_credentials(phone_number=phone_number, activation_code=activation_code,
+                                access_token=access_token, account_details=account_details, config_file=config_file,
+                                credential_store=credential_store)
+        self.proxies = proxies
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.quota = quota
+        self.cache = cache
+        self.metrics = metrics
+        self._read_coalescer = _AsyncReadCoalescer()
+        self._own_transport = transport is None
+        self.transport = transport or AiohttpTransport(session=session, proxies=proxies, limit=pool_limit,
+                                                       limit_per_host=pool_limit_per_host)
+
+    async def close(self):
+        """
+        Close the connection pool of this instance and stop the background token refresh. A session or a transport that was passed in is not closed.
+        """
+        if self._refresh_timer is not None:
+            self._refresh_timer.cancel()
+        if self._own_transport:
+            await self.transport.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
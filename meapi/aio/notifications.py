@@ -0,0 +1,155 @@
+from asyncio import ensure_future, gather, get_running_loop, CancelledError, Future, Semaphore
+from datetime import datetime
+from typing import AsyncIterator, Dict, Iterable, Tuple, List, Union
+from meapi.exceptions import MeException
+from meapi.notifications import _notifications_params, _since_time, _reached_since
+
+
+class _AsyncReadCoalescer:
+    # Async version of meapi.notifications._ReadCoalescer.
+    def __init__(self):
+        self._in_flight: Dict[int, Future] = {}
+
+    async def read(self, notification_id: int, read) -> bool:
+        future = self._in_flight.get(notification_id)
+        if future is not None:
+            return await future
+        future = self._in_flight[notification_id] = get_running_loop().create_future()
+        try:
+            result = await read()
+            future.set_result(result)
+            return result
+        except CancelledError:
+            future.cancel()
+            raise
+        except BaseException as err:
+            future.set_exception(err)
+            future.exception()  # Retrieved, so a read without waiters does not log a warning.
+            raise
+        finally:
+            del self._in_flight[notification_id]
+
+
+class AsyncNotifications:
+    async def unread_notifications_count(self) -> int:
+        """
+        Async version of :py:func:`~meapi.Me.unread_notifications_count`.
+        """
+        return (await self.make_request('get', '/notification/notification/count/'))['count']
+
+    async def get_notifications(self,
+                                page_number: int = 1,
+                                results_limit: int = 20,
+                                names_filter: bool = False,
+                                system_filter: bool = False,
+                                comments_filter: bool = False,
+                                who_watch_filter: bool = False,
+                                who_deleted_filter: bool = False,
+                                birthday_filter: bool = False,
+                                location_filter: bool = False) -> dict:
+        """
+        Async version of :py:func:`~meapi.Me.get_notifications`.
+        """
+        args = locals()
+        del args['self']
+        return await self.make_request('get', '/notification/notification/items/' + _notifications_params(**args))
+
+    async def iter_notifications(self,
+                                 results_limit: int = 100,
+                                 since: Union[datetime, str, int, float, None] = None,
+                                 since_id: Union[int, str, None] = None,
+                                 prefetch: bool = True,
+                                 names_filter: bool = False,
+                                 system_filter: bool = False,
+                                 comments_filter: bool = False,
+                                 who_watch_filter: bool = False,
+                                 who_deleted_filter: bool = False,
+                                 birthday_filter: bool = False,
+                                 location_filter: bool = False) -> AsyncIterator[dict]:
+        """
+        Async version of :py:func:`~meapi.Me.iter_notifications`: ``async for notification in me.iter_notifications(): ...``.
+        """
+        filters = dict(names_filter=names_filter, system_filter=system_filter, comments_filter=comments_filter,
+                       who_watch_filter=who_watch_filter, who_deleted_filter=who_deleted_filter,
+                       birthday_filter=birthday_filter, location_filter=location_filter)
+        since_time, since_id = _since_time(since), int(since_id) if since_id is not None else None
+
+        async def fetch(page_number: int) -> dict:
+            return await self.get_notifications(page_number=page_number, results_limit=results_limit, **filters)
+
+        page_number, next_page = 1, None
+        try:
+            notifications = await fetch(page_number)
+            while True:
+                results = notifications['results']
+                more = bool(notifications.get('next') and results) and not _reached_since(results[-1], since_time, since_id)
+                if more and prefetch:
+                    next_page = ensure_future(fetch(page_number + 1))
+                for notification in results:
+                    if _reached_since(notification, since_time, since_id):
+                        return
+                    yield notification
+                if not more:
+                    return
+                page_number += 1
+                notifications = await next_page if next_page is not None else await fetch(page_number)
+                next_page = None
+        finally:
+            if next_page is not None:
+                next_page.cancel()
+
+    async def read_notification(self, notification_id: Union[int, str]) -> bool:
+        """
+        Async version of :py:func:`~meapi.Me.read_notification`.
+        """
+        notification_id = int(notification_id)
+        body = {"notification_id": notification_id}
+
+        async def read() -> bool:
+            return (await self.make_request('post', '/notification/notification/read/', body))['is_read']
+        return await self._read_coalescer.read(notification_id, read)
+
+    async def read_notifications(self,
+                                 notification_ids: Iterable[Union[int, str]],
+                                 max_concurrency: int = 8) -> Dict[int, Union[bool, Exception]]:
+        """
+        Async version of :py:func:`~meapi.Me.read_notifications`.
+        """
+        ids = list(dict.fromkeys(int(notification_id) for notification_id in notification_ids))
+        slots = Semaphore(max(1, max_concurrency))
+
+        async def read(notification_id: int) -> Union[bool, Exception]:
+            async with slots:
+                try:
+                    return await self.read_notification(notification_id)
+                except Exception as err:
+                    return err
+        return dict(zip(ids, await gather(*(read(notification_id) for notification_id in ids))))
+
+    async def change_notification_settings(self,
+                                           who_deleted_notification_enabled: bool = None,
+                                           who_watched_notification_enabled: bool = None,
+                                           distance_notification_enabled: bool = None,
+                                           system_notification_enabled: bool = None,
+                                           birthday_notification_enabled: bool = None,
+                                           comments_notification_enabled: bool = None,
+                                           names_notification_enabled: bool = None,
+                                           notifications_enabled: bool = None) -> Tuple[bool, List[str]]:
+        """
+        Async version of :py:func:`~meapi.Me.change_notification_settings`.
+        """
+        args = locals()
+        del args['self']
+        body = {}
+        for setting, value in args.items():
+            if value is not None:
+                body[setting] = value
+        if not body:
+            raise MeException("You need to provide at least one setting!")
+
+        results = await self.make_request('patch', '/main/settings/', body)
+        failed = []
+        for setting in body.keys():
+            if results[setting] != body[setting]:
+                failed.append(setting)
+        return not bool(failed), failed
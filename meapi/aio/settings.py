@@ -0,0 +1,36 @@
+from typing import Tuple, List
+from meapi.exceptions import MeException
+
+
+class AsyncSettings:
+    async def get_settings(self) -> dict:
+        """
+        Async version of :py:func:`~meapi.Me.get_settings`.
+        """
+        return await self.make_request('get', '/main/settings/')
+
+    async def change_social_settings(self,
+                                     mutual_contacts_available: bool = None,
+                                     who_watched_enabled: bool = None,
+                                     who_deleted_enabled: bool = None,
+                                     comments_enabled: bool = None,
+                                     location_enabled: bool = None,
+                                     language: str = None) -> Tuple[bool, List[str]]:
+        """
+        Async version of :py:func:`~meapi.Me.change_social_settings`.
+        """
+        args = locals()
+        del args['self']
+        body = {}
+        for setting, value in args.items():
+            if value is not None:
+                body[setting] = value
+        if not body:
+            raise MeException("You need to change at least one setting!")
+
+        results = await self.make_request('patch', '/main/settings/', body)
+        failed = []
+        for setting in body.keys():
+            if results[setting] != body[setting]:
+                failed.append(setting)
+        return not bool(failed), failed
@@ -0,0 +1,261 @@
+from re import match, sub
+from typing import List, Union, Tuple
+from meapi.exceptions import MeException
+from datetime import datetime, date
+
+
+class AsyncSocial:
+
+    async def friendship(self, phone_number: Union[int, str]) -> dict:
+        """
+        Async version of :py:func:`~meapi.Me.friendship`.
+        """
+        return await self.make_request('get', '/main/contacts/friendship/?phone_number=' + str(self.valid_phone_number(phone_number)))
+
+    async def report_spam(self, country_code: str, spam_name: str, phone_number: Union[str, int]) -> bool:
+        """
+        Async version of :py:func:`~meapi.Me.report_spam`.
+        """
+        body = {"country_code": country_code.upper(), "is_spam": True, "is_from_v": False,
+                "name": str(spam_name), "phone_number": str(self.valid_phone_number(phone_number))}
+        results = await self.make_request('post', '/main/names/suggestion/report/', body)
+        if self.cache is not None:
+            self.cache.invalidate_contact(body['phone_number'])
+        return results['success']
+
+    async def who_deleted(self) -> List[dict]:
+        """
+        Async version of :py:func:`~meapi.Me.who_deleted`.
+        """
+        return await self.make_request('get', '/main/users/profile/who-deleted/')
+
+    async def who_watched(self) -> List[dict]:
+        """
+        Async version of :py:func:`~meapi.Me.who_watched`.
+        """
+        return await self.make_request('get', '/main/users/profile/who-watched/')
+
+    async def get_comments(self, uuid: str = None) -> dict:
+        """
+        Async version of :py:func:`~meapi.Me.get_comments`.
+        """
+        if not uuid:
+            if self.phone_number:
+                uuid = await self.get_uuid()
+            else:
+                raise MeException("In https://meapi.readthedocs.io/en/latest/setup.html#official-method mode you must to provide user uuid.")
+        return await self.make_request('get', '/main/comments/list/' + uuid)
+
+    async def get_comment(self, comment_id: Union[int, str]) -> dict:
+        """
+        Async version of :py:func:`~meapi.Me.get_comment`.
+        """
+        return await self.make_request('get', '/main/comments/retrieve/' + str(comment_id))
+
+    async def approve_comment(self, comment_id: Union[str, int]) -> bool:
+        """
+        Async version of :py:func:`~meapi.Me.approve_comment`.
+        """
+        return bool((await self.make_request('post', '/main/comments/approve/' + str(comment_id)))['status'] == 'approved')
+
+    async def delete_comment(self, comment_id: Union[str, int]) -> bool:
+        """
+        Async version of :py:func:`~meapi.Me.delete_comment`.
+        """
+        return bool((await self.make_request('delete', '/main/comments/approve/' + str(comment_id)))['status'] == 'ignored')
+
+    async def like_comment(self, comment_id: Union[int, str]) -> bool:
+        """
+        Async version of :py:func:`~meapi.Me.like_comment`.
+        """
+        return (await self.make_request('post', '/main/comments/like/' + str(comment_id)))['success']
+
+    async def publish_comment(self, uuid: str, comment: str) -> Union[int, bool]:
+        """
+        Async version of :py:func:`~meapi.Me.publish_comment`.
+        """
+        body = {"message": str(comment)}
+        results = await self.make_request('get', '/main/comments/add/' + str(uuid), body)
+        return int(results.get('id')) if results.get('status') == 'waiting' else False
+
+    async def get_groups_names(self) -> dict:
+        """
+        Async version of :py:func:`~meapi.Me.get_groups_names`.
+        """
+        return await self.make_request('get', '/main/names/groups/')
+
+    async def get_deleted_names(self) -> dict:
+        """
+        Async version of :py:func:`~meapi.Me.get_deleted_names`.
+        """
+        return await self.make_request('get', '/main/settings/hidden-names/')
+
+    async def delete_name(self, contacts_ids: Union[int, str, List[Union[int, str]]]) -> bool:
+        """
+        Async version of :py:func:`~meapi.Me.delete_name`.
+        """
+        if not isinstance(contacts_ids, list):
+            contacts_ids = [contacts_ids]
+        body = {"contact_ids": [int(_id) for _id in contacts_ids]}
+        return (await self.make_request('post', '/main/contacts/hide/', body))['success']
+
+    async def restore_name(self, contacts_ids: Union[int, str, List[Union[int, str]]]) -> bool:
+        """
+        Async version of :py:func:`~meapi.Me.restore_name`.
+        """
+        if not isinstance(contacts_ids, list):
+            contacts_ids = [contacts_ids]
+        body = {"contact_ids": [int(_id) for _id in contacts_ids]}
+        return (await self.make_request('post', '/main/settings/hidden-names/', body))['success']
+
+    async def ask_group_rename(self, contacts_ids: Union[int, str, List[Union[int, str]]], new_name: str) -> bool:
+        """
+        Async version of :py:func:`~meapi.Me.ask_group_rename`.
+        """
+        if not isinstance(contacts_ids, list):
+            contacts_ids = [contacts_ids]
+        body = {"contact_ids": [int(_id) for _id in contacts_ids], "name": new_name}
+        return (await self.make_request('post', '/main/names/suggestion/', body))['success']
+
+    async def get_socials(self, uuid: str = None) -> dict:
+        """
+        Async version of :py:func:`~meapi.Me.get_socials`.
+        """
+        if not uuid:
+            return await self.make_request('post', '/main/social/update/')
+        return (await self.get_profile_info(str(uuid)))['social']
+
+    async def add_social(self,
+                         twitter_token: str = None,
+                         spotify_token: str = None,
+                         instagram_token: str = None,
+                         facebook_token: str = None,
+                         pinterest_url: str = None,
+                         linkedin_url: str = None, ) -> Tuple[bool, List[str]]:
+        """
+        Async version of :py:func:`~meapi.Me.add_social`.
+        """
+        args = locals()
+        del args['self']
+        if sum(bool(i) for i in args.values()) < 1:
+            raise MeException("You need to provide at least one social!")
+        failed = []
+        for social, token_or_url in args.items():
+            if token_or_url is not None:
+                if 'url' in social:
+                    if match(r"^https?:\/\/.*{domain}.*$".format(domain=social.replace('_url', '')), token_or_url):
+                        field_name = 'profile_id'
+                        endpoint = 'update-url'
+                        is_token = False
+                    else:
+                        raise MeException(f"You must provide a valid link to the {social.replace('_url', '').capitalize()} profile!")
+                else:
+                    field_name = 'code_first'
+                    endpoint = 'save-auth-token'
+                    is_token = True
+                social_name = sub(r'_(token|url)$', '', social)
+                body = {'social_name': social_name, field_name: token_or_url}
+                results = await self.make_request('post', f'/main/social/{endpoint}/', body)
+                if not (bool(results['success']) if is_token else bool(results[social_name]['profile_id'] == token_or_url)):
+                    failed.append(social_name)
+        self._invalidate_own_profile()
+        return not bool(failed), failed
+
+    async def remove_social(self,
+                            twitter: bool = False,
+                            spotify: bool = False,
+                            instagram: bool = False,
+                            facebook: bool = False,
+                            pinterest: bool = False,
+                            linkedin: bool = False,
+                            ) -> bool:
+        """
+        Async version of :py:func:`~meapi.Me.remove_social`.
+        """
+        args = locals()
+        del args['self']
+        true_values = sum(bool(i) for i in args.values())
+        if true_values < 1:
+            raise MeException("You need to remove at least one social!")
+        successes = 0
+        for social, value in args.items():
+            if value and isinstance(value, bool):
+                body = {"social_name": str(social)}
+                if (await self.make_request('post', '/main/social/delete/', body)).get('success'):
+                    successes += 1
+        self._invalidate_own_profile()
+        return bool(true_values == successes)
+
+    async def switch_social_status(self,
+                                   twitter: bool = None,
+                                   spotify: bool = None,
+                                   instagram: bool = None,
+                                   facebook: bool = None,
+                                   pinterest: bool = None,
+                                   linkedin: bool = None,
+                                   ) -> bool:
+        """
+        Async version of :py:func:`~meapi.Me.switch_social_status`.
+        """
+        args = locals()
+        del args['self']
+        not_null_values = sum(bool(i) for i in args.values() if i is not None) or sum(not bool(i) for i in args.values() if i is not None)
+        if not_null_values < 1:
+            raise MeException("You need to switch status to at least one social!")
+        successes = 0
+        for social, status in args.items():
+            if status is not None and isinstance(status, bool):
+                body = {"social_name": str(social)}
+                current_status = await self.get_socials()
+                if status == current_status[social]['is_hidden'] and current_status[social]['is_active']:  # exists but status not as the required
+                    new_status = not bool((await self.make_request('post', '/main/social/hide/', body))['is_hidden'])
+                    if status == new_status:
+                        successes += 1
+        self._invalidate_own_profile()
+        return bool(not_null_values == successes)
+
+    async def numbers_count(self) -> int:
+        """
+        Async version of :py:func:`~meapi.Me.numbers_count`.
+        """
+        return (await self.make_request('get', '/main/contacts/count/'))['count']
+
+    async def suggest_turn_on_comments(self, uuid: str) -> bool:
+        """
+        Async version of :py:func:`~meapi.Me.suggest_turn_on_comments`.
+        """
+        body = {"uuid": str(uuid)}
+        return (await self.make_request('post', '/main/users/profile/suggest-turn-on-comments/', body))['requested']
+
+    async def suggest_turn_on_mutual(self, uuid: str) -> bool:
+        """
+        Async version of :py:func:`~meapi.Me.suggest_turn_on_mutual`.
+        """
+        body = {"uuid": str(uuid)}
+        return (await self.make_request('post', '/main/users/profile/suggest-turn-on-mutual/', body))['requested']
+
+    async def suggest_turn_on_location(self, uuid: str) -> bool:
+        """
+        Async version of :py:func:`~meapi.Me.suggest_turn_on_location`.
+        """
+        body = {"uuid": str(uuid)}
+        return (await self.make_request('post', '/main/users/profile/suggest-turn-on-location/', body))['requested']
+
+    async def get_age(self, uuid=None) -> float:
+        """
+        Async version of :py:func:`~meapi.Me.get_age`.
+        """
+        date_of_birth = (await self.get_profile_info(uuid))['profile']['date_of_birth']
+        if match(r"^\d{4}(\-)([0-2][0-9]|(3)[0-1])(\-)(((0)[0-9])|((1)[0-2]))$", str(date_of_birth)):
+            days_in_year = 365.2425
+            return round((date.today() - datetime.strptime(date_of_birth, "%Y-%m-%d").date()).days / days_in_year, 1)
+        return 0.0
+
+    async def is_spammer(self, phone_number: Union[int, str]) -> int:
+        """
+        Async version of :py:func:`~meapi.Me.is_spammer`.
+        """
+        results = await self.phone_search(phone_number)
+        if results:
+            return results['contact']['suggested_as_spam']
+        return 0
@@ -0,0 +1,78 @@
+from asyncio import TimeoutError
+from typing import Tuple, Union
+from meapi.aio.util import ClientConnectionError, ClientTimeout, create_async_session
+from meapi.tracing import record_phase
+from meapi.transport import TransportResponse
+from meapi.util import ME_BASE_API
+
+
+class AsyncTransport:
+    """
+    Base class for the transports that send the requests of :py:class:`~meapi.AsyncMe`. Async version of :py:class:`~meapi.transport.Transport`.
+    """
+    base_url: str = ME_BASE_API
+    errors: Tuple[type, ...] = (ConnectionError, TimeoutError)
+
+    async def request(self,
+                      method: str,
+                      endpoint: str,
+                      body: Union[bytes, None] = None,
+                      headers: Union[dict, None] = None,
+                      timeout: Tuple[Union[float, None], Union[float, None]] = (None, None),
+                      total_timeout: Union[float, None] = None) -> TransportResponse:
+        """
+        Send a request. Same as :py:func:`meapi.transport.Transport.request`, with ``total_timeout``: seconds for the whole request (``None`` to wait forever).
+        """
+        raise NotImplementedError
+
+    async def close(self):
+        """
+        Release the resources of the transport.
+        """
+
+
+class AiohttpTransport(AsyncTransport):
+    """
+    The default async transport: ``aiohttp`` with a connection pool.
+
+    :param session: Shared aiohttp session, see :py:func:`~meapi.aio.util.create_async_session`. Default: ``None`` (New session on the first request, closed on :py:func:`close`).
+    :type session: Union[aiohttp.ClientSession, None]
+    :param base_url: Base url of the api. Default: ``https://app.mobile.me.app``.
+    :type base_url: str
+    :param proxies: Dict with proxy configuration. Default: ``None``.
+    :type proxies: Union[dict, None]
+    :param limit: Max connections to keep open in total, when creating a new session. Default: ``100``.
+    :type limit: int
+    :param limit_per_host: Max connections to keep open for each host, when creating a new session. Default: ``10``.
+    :type limit_per_host: int
+    """
+    errors = (ClientConnectionError, TimeoutError)
+
+    def __init__(self,
+                 session: Union['ClientSession', None] = None,
+                 base_url: str = ME_BASE_API,
+                 proxies: Union[dict, None] = None,
+                 limit: int = 100,
+                 limit_per_host: int = 10):
+        self.base_url = base_url
+        self.proxy = (proxies or {}).get('https') or (proxies or {}).get('http')
+        self._own_session = session is None
+        self.session = session
+        self._limit = limit
+        self._limit_per_host = limit_per_host
+
+    async def request(self, method, endpoint, body=None, headers=None, timeout=(None, None),
+                      total_timeout=None) -> TransportResponse:
+        if self.session is None:  # The session must be created inside the event loop.
+            self.session = create_async_session(limit=self._limit, limit_per_host=self._limit_per_host)
+        client_timeout = ClientTimeout(total=total_timeout, sock_connect=timeout[0], sock_read=timeout[1])
+        async with self.session.request(method, self.base_url + endpoint, data=body, headers=headers, proxy=self.proxy,
+                                        timeout=client_timeout) as response:
+            content = await response.read()
+            record_phase('receive')
+            return TransportResponse(response.status, content, response.headers, response.reason)
+
+    async def close(self):
+        if self._own_session and self.session is not None:
+            await self.session.close()
+            self.session = None
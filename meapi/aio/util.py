@@ -0,0 +1,163 @@
+from asyncio import sleep
+from contextlib import nullcontext
+from inspect import isawaitable
+from typing import Union
+from time import monotonic, perf_counter
+from meapi.exceptions import MeException, MeApiException, MeConnectionException
+from meapi.metrics import RequestMetric, endpoint_template
+from meapi.tracing import record_phase
+from meapi.util import Util, REQUEST_TYPES, _default_headers, _encode_body, _decode_response, _api_error, \
+    _remaining_time, _fit_delay
+
+try:
+    from aiohttp import ClientSession, TCPConnector, ClientConnectionError, ClientTimeout, TraceConfig
+except ImportError:
+    ClientSession = TCPConnector = ClientConnectionError = ClientTimeout = TraceConfig = None
+
+
+def _phase_trace_config() -> 'TraceConfig':
+    # Report the dns, connect, send and wait phases of the requests to the current trace span.
+    async def on_dns_start(session, context, params):
+        context.dns_start = perf_counter()
+
+    async def on_dns_end(session, context, params):
+        context.dns_end = perf_counter()
+        record_phase('dns', context.dns_start, context.dns_end)
+
+    async def on_connection_start(session, context, params):
+        context.connection_start = perf_counter()
+
+    async def on_connection_end(session, context, params):
+        record_phase('connect', max(context.connection_start, getattr(context, 'dns_end', 0.0)))
+
+    async def on_headers_sent(session, context, params):
+        record_phase('send')
+
+    async def on_request_end(session, context, params):
+        record_phase('wait')
+
+    trace_config = TraceConfig()
+    trace_config.on_dns_resolvehost_start.append(on_dns_start)
+    trace_config.on_dns_resolvehost_end.append(on_dns_end)
+    trace_config.on_connection_create_start.append(on_connection_start)
+    trace_config.on_connection_create_end.append(on_connection_end)
+    trace_config.on_request_headers_sent.append(on_headers_sent)
+    trace_config.on_request_end.append(on_request_end)
+    return trace_config
+
+
+def create_async_session(limit: int = 100, limit_per_host: int = 10) -> 'ClientSession':
+    """
+    Create a non-blocking HTTP session with a connection pool. The session can be shared between several :py:class:`~meapi.AsyncMe` instances.
+
+    - Must be called while an event loop is running.
+
+    :param limit: Max connections to keep open in total. Default: ``100``.
+    :type limit: int
+    :param limit_per_host: Max connections to keep open for each host. Default: ``10``.
+    :type limit_per_host: int
+    :raises MeException: If ``aiohttp`` is not installed.
+    :return: aiohttp ClientSession (Reports the ``dns``, ``connect``, ``send`` and ``wait`` phases to :py:class:`~meapi.Tracer`).
+    :rtype: aiohttp.ClientSession
+    """
+    if ClientSession is None:
+        raise MeException("The async client requires aiohttp. Install it with: pip3 install -U meapi[async]")
+    return ClientSession(connector=TCPConnector(limit=limit, limit_per_host=limit_per_host),
+                         trace_configs=[_phase_trace_config()])
+
+
+class AsyncUtil(Util):
+
+    async def make_request(self,
+                           req_type: str,
+                           endpoint: str,
+                           body: dict = None,
+                           headers: dict = None,
+                           auth: bool = True
+                           ) -> Union[dict, list]:
+        """
+        Async version of :py:func:`~meapi.Me.make_request`.
+        """
+        if req_type not in REQUEST_TYPES:
+            raise MeException("Request type not in requests type list!!\nAvailable types: " + ", ".join(REQUEST_TYPES))
+        if headers is None:
+            headers = _default_headers()
+        if auth and not self.access_token:
+            await self._login()
+        data = _encode_body(body)
+        attempts, retries, waited, token_refreshes, bytes_in = 0, 0, 0.0, 0, 0
+        started, status, error = monotonic(), None, None
+        tracer = self.tracer
+        span = tracer.start(f"{req_type.upper()} {endpoint_template(endpoint)}", endpoint=endpoint) if tracer else None
+        try:
+            while True:
+                attempts += 1
+                total_timeout = _remaining_time()
+                if headers and auth:
+                    headers['authorization'] = self.access_token
+                for hook in self.hooks['before_request']:
+                    result = hook(req_type, endpoint, data, headers)
+                    if isawaitable(result):
+                        await result
+                try:
+                    with tracer.span('attempt') if tracer else nullcontext() as attempt:
+                        response = await self.transport.request(req_type, endpoint, data, headers,
+                                                                timeout=(self.connect_timeout, self.read_timeout),
+                                                                total_timeout=total_timeout)
+                        if attempt is not None:
+                            attempt.attributes['status'] = response.status_code
+                except self.transport.errors as err:
+                    retries += 1
+                    delay = _fit_delay(self.retry_policy.get_delay(req_type, retries))
+                    if delay is None:
+                        raise MeConnectionException(f"Request failed: {type(err).__name__}: {err}", attempts, waited) from err
+                    await sleep(delay)
+                    waited += delay
+                    continue
+                status = response.status_code
+                bytes_in += len(response.content)
+                for hook in self.hooks['after_response']:
+                    result = hook(req_type, endpoint, response)
+                    if isawaitable(result):
+                        await result
+                if status == 403 and self.phone_number and token_refreshes < 2:
+                    token_refreshes += 1
+                    with tracer.span('token_refresh') if tracer else nullcontext():
+                        await self._refresh_access_token(headers.get('authorization') if auth else None)
+                    continue
+                if self.retry_policy.is_retryable_status(status):
+                    retries += 1
+                    delay = _fit_delay(self.retry_policy.get_delay(req_type, retries, response.headers.get('retry-after')))
+                    if delay is not None:
+                        await sleep(delay)
+                        waited += delay
+                        continue
+
+                with tracer.span('decode', bytes=len(response.content)) if tracer else nullcontext():
+                    response_text = _decode_response(status, response.content)
+                if status >= 400:
+                    raise _api_error(status, response_text, response.reason, attempts, waited)
+                return response_text
+        except BaseException as err:
+            if isinstance(err, MeApiException):
+                error = str(err.http_status)
+            else:  # The name of the transport error, like 'ConnectionError'.
+                error = type(err.__cause__ if isinstance(err, MeConnectionException) else err).__name__
+            raise
+        finally:
+            if span is not None:
+                span.attributes.update(status=status, attempts=attempts, retries=retries)
+                tracer.finish(span, error)
+            if self.metrics is not None:
+                self.metrics.record(RequestMetric(endpoint_template(endpoint), req_type, status, error, monotonic() - started,
+                                                  attempts, retries, token_refreshes,
+                                                  len(data) * attempts if data else 0, bytes_in))
+
+    async def _consume_quota(self, name: str):
+        if self.quota is None:
+            return
+        while True:
+            wait = self.quota.reserve(name)
+            if not wait:
+                return
+            await sleep(_fit_delay(wait))
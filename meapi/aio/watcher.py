@@ -0,0 +1,90 @@
+from asyncio import Event, Queue, wait_for, TimeoutError
+from inspect import isawaitable
+from typing import Callable, List, Union
+from meapi.watcher import _BaseNotificationWatcher
+
+
+class AsyncNotificationWatcher(_BaseNotificationWatcher):
+    """
+    Async version of :py:class:`~meapi.NotificationWatcher`, for :py:class:`~meapi.AsyncMe`. New notifications are passed to the
+    callbacks (Functions or coroutine functions) and put in ``queue``. Takes the arguments of :py:class:`~meapi.NotificationWatcher`.
+
+    :param queue: Queue to put each new notification in, after the callbacks. Default: ``None``.
+    :type queue: Union[asyncio.Queue, None]
+
+    Example::
+
+        queue = asyncio.Queue()
+        watcher = AsyncNotificationWatcher(me, queue=queue, watermark_file='watermark.json')
+        task = asyncio.create_task(watcher.run())
+        while True:
+            notification = await queue.get()
+    """
+    def __init__(self,
+                 me,
+                 callbacks: Union[List[Callable], None] = None,
+                 queue: Union[Queue, None] = None,
+                 **kwargs):
+        super().__init__(me, callbacks, **kwargs)
+        self.queue = queue
+        self._stop_event = None
+
+    async def poll(self) -> List[dict]:
+        """
+        Async version of :py:func:`~meapi.NotificationWatcher.poll`.
+        """
+        count = await self.me.unread_notifications_count()
+        if self.watermark is None and not self.deliver_existing:
+            latest = (await self.me.get_notifications(results_limit=1, **self.filters))['results']
+            self._set_watermark(latest[0]['id'] if latest else 0)
+            self._fetched(count, [])
+            return []
+        if not self._should_fetch(count):
+            return []
+        new = self._fetched(count, [notification async for notification in self.me.iter_notifications(
+            results_limit=self._page_size(count), since_id=self.watermark, prefetch=False, **self.filters)])
+        delivered = []
+        for notification in new:
+            failed = False
+            for callback in self.callbacks:
+                try:
+                    result = callback(notification)
+                    if isawaitable(result):
+                        await result
+                except Exception as err:  # A broken callback must not stop the watcher.
+                    self._callback_failed(callback, notification, err)
+                    failed = True
+            if failed:
+                break
+            if self.queue is not None:
+                await self.queue.put(notification)
+            delivered.append(notification)
+        self._advance(new, delivered)
+        return delivered
+
+    async def run(self):
+        """
+        Poll until :py:func:`stop` is called (Also before the task started) or the task is cancelled. Errors of a poll are printed
+        and the next poll is delayed.
+        """
+        if self._stop_event is None:
+            self._stop_event = Event()
+        while not self._stop_event.is_set():
+            try:
+                await self.poll()
+            except Exception as err:
+                print(f"Failed to poll notifications: {err}")
+                self._back_off()
+            try:
+                await wait_for(self._stop_event.wait(), self.interval)
+            except TimeoutError:
+                pass
+        self._stop_event = None  # A stop() before the run started is kept, and the next run() starts clean.
+
+    def stop(self):
+        """
+        Stop the watcher after the current poll.
+        """
+        if self._stop_event is None:
+            self._stop_event = Event()
+        self._stop_event.set()
@@ -1,14 +1,130 @@
-from json import load, JSONDecodeError, dump
-from os import path
+from base64 import urlsafe_b64decode
+from contextvars import ContextVar
+from heapq import heapify, heappop, heappush
+from itertools import count
+from json import loads
 from re import match
+from threading import Condition, Lock, RLock, Thread
+from time import monotonic, time
 from typing import Union
+from weakref import WeakKeyDictionary, ref
+from meapi.credentials import CredentialStore, JsonCredentialStore
 from meapi.exceptions import MeException, MeApiException
+from meapi.filelock import FileLock, get_file_lock
 
 wa_auth_url = "https://wa.me/972543229534?text=Connectme"
 tg_auth_url = "http://t.me/Meofficialbot?start=__iw__{}"
+_refreshing = ContextVar('meapi_refreshing', default=False)
+# Refresh locks of the stores without lock files (``lock_path`` is ``None``), in this process only.
+_store_locks: 'WeakKeyDictionary[CredentialStore, RLock]' = WeakKeyDictionary()
+_store_locks_lock = Lock()
+
+
+def _prompt_activation_code(phone_number: Union[int, str], activation_code: Union[int, str, None] = None) -> str:
+    if activation_code and not match(r'^\d{6}$', str(activation_code)):
+        raise MeException("Not a valid 6-digits activation code!")
+    if not activation_code:
+        print(f"To get access token you need to authorize yourself:"
+              f"\n* WhatsApp (Recommended): {wa_auth_url}\n* Telegram: {tg_auth_url.format(phone_number)}\n")
+    while not activation_code:
+        activation_code = input("** Enter your verification code (6 digits): ")
+        while not match(r'^\d{6}$', str(activation_code)):
+            activation_code = input("** Incorrect code. The verification code includes 6 digits. Please enter: ")
+    return str(activation_code)
+
+
+def _token_expiry(access_token: Union[str, None]) -> Union[float, None]:
+    # The access token is a JWT, the expiry is the ``exp`` claim of the payload (Unix time).
+    try:
+        payload = access_token.split('.')[1]
+        return float(loads(urlsafe_b64decode(payload + '=' * (-len(payload) % 4)))['exp'])
+    except (AttributeError, IndexError, KeyError, TypeError, ValueError):
+        return None
+
+
+def _refresh_delay(expires_in: float, refresh_margin: float) -> float:
+    # Never less than half of the lifetime, so short-lived tokens do not refresh in a loop.
+    return max(expires_in - refresh_margin, expires_in / 2, 0)
+
+
+class _ScheduledRefresh:
+    __slots__ = ('_scheduler', '_entry')
+
+    def __init__(self, scheduler: '_RefreshScheduler', entry: list):
+        self._scheduler = scheduler
+        self._entry = entry
+
+    def cancel(self):
+        self._scheduler.cancel(self._entry)
+
+
+class _RefreshScheduler:
+    """
+    One daemon thread for the background token refresh of all the clients, instead of a timer thread for each client.
+    Clients are held by weak references, so a client that was not closed is still collected, and its refresh is dropped.
+    The thread exits when nothing is scheduled.
+    """
+    def __init__(self):
+        self._heap = []  # Entries of [due (monotonic), sequence, weak reference to the client, token].
+        self._sequence = count()
+        self._condition = Condition()
+        self._thread = None
+
+    def schedule(self, client: 'Auth', delay: float, used_token: str) -> _ScheduledRefresh:
+        entry = [monotonic() + delay, next(self._sequence), ref(client), used_token]
+        with self._condition:
+            heappush(self._heap, entry)
+            if self._thread is None:
+                self._thread = Thread(target=self._run, name='meapi-token-refresh', daemon=True)
+                self._thread.start()
+            self._condition.notify()
+        return _ScheduledRefresh(self, entry)
+
+    def cancel(self, entry: list):
+        with self._condition:
+            if entry in self._heap:
+                self._heap.remove(entry)
+                heapify(self._heap)
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while self._heap and self._heap[0][0] > monotonic():
+                    self._condition.wait(self._heap[0][0] - monotonic())
+                if not self._heap:
+                    self._thread = None
+                    return
+                _, _, client_ref, used_token = heappop(self._heap)
+            client = client_ref()
+            if client is not None:  # In its own thread, so a slow refresh does not delay the others.
+                Thread(target=client._proactive_refresh, args=(used_token,), name='meapi-token-refresh-run',
+                       daemon=True).start()
+            del client
+
+
+_refresh_scheduler = _RefreshScheduler()
 
 
 class Auth:
+    @property
+    def access_token(self) -> Union[str, None]:
+        return self._access_token
+
+    @access_token.setter
+    def access_token(self, access_token: Union[str, None]):
+        self._access_token = access_token
+        self._access_token_expiry = _token_expiry(access_token)
+        self._schedule_token_refresh()
+
+    @property
+    def token_expires_in(self) -> Union[float, None]:
+        """
+        Seconds until the access token expires (Negative if already expired). ``None`` if unknown.
+        """
+        if self._access_token_expiry is None:
+            return None
+        return self._access_token_expiry - time()
+
     def activate_account(self, activation_code: Union[int, str, None] = None) -> bool:
         """
         Activate new phone number account.
@@ -23,17 +139,9 @@ class Auth:
         if not activation_code and self.activation_code:
             activation_code = self.activation_code
 
-        if activation_code and not match(r'^\d{6}$', str(activation_code)):
-            raise MeException("Not a valid 6-digits activation code!")
-        if not activation_code:
-            print(f"To get access token you need to authorize yourself:"
-                  f"\n* WhatsApp (Recommended): {wa_auth_url}\n* Telegram: {tg_auth_url.format(self.phone_number)}\n")
-        while not activation_code:
-            activation_code = input("** Enter your verification code (6 digits): ")
-            while not match(r'^\d{6}$', str(activation_code)):
-                activation_code = input("** Incorrect code. The verification code includes 6 digits. Please enter: ")
+        activation_code = _prompt_activation_code(self.phone_number, activation_code)
         data = {
-            "activation_code": str(activation_code),
+            "activation_code": activation_code,
             "activation_type": "sms",
             "phone_number": int(self.phone_number)
         }
@@ -88,7 +196,7 @@ class Auth:
 
     def credentials_manager(self, data: Union[dict, None] = None) -> dict:
         """
-        Read / write auth data from ``config_file``.
+        Read / write auth data from the ``credential_store`` (Default: :py:class:`~meapi.JsonCredentialStore` of ``config_file``).
 
         :param data: Dict with ``access``, ``refresh`` and ``pwd_token``. Default: ``None``.
         :type data: Union[dict, None]
@@ -96,38 +204,117 @@ class Auth:
         :return: Dict with auth data.
         :rtype: dict
         """
-        if not path.isfile(str(self.config_file)):
-            with open(self.config_file, "w") as new_config_file:
-                new_config_file.write('{}')
-
-        with open(self.config_file, "r") as config_file:
-            try:
-                existing_content = load(config_file)
-            except JSONDecodeError:
-                raise MeException("Not a valid json file: " + self.config_file)
+        existing_content = self._credentials.get(self.phone_number)
         if not data:
-            if not existing_content.get(str(self.phone_number)):
+            if not existing_content:
                 if self.activate_account():
                     return self.credentials_manager()
             else:
-                existing_content = existing_content.get(str(self.phone_number))
                 self.uuid = existing_content['uuid']
                 return existing_content
         else:
             if not data.get('access') or not data.get('refresh'):
                 raise MeException(f"Wrong data provided! {data}")
 
-            pwd_token = None
-            if existing_content:
-                if existing_content.get(str(self.phone_number)):
-                    pwd_token = existing_content.get(str(self.phone_number)).get('pwd_token')
-            uuid = self.get_uuid()
+            uuid = (existing_content or {}).get('uuid') or self.get_uuid()
             self.uuid = uuid
-            existing_content[str(self.phone_number)] = data
-            existing_content[str(self.phone_number)]['uuid'] = uuid
-            if pwd_token and not data.get('pwd_token'):
-                existing_content[str(self.phone_number)]['pwd_token'] = pwd_token
-
-            with open(self.config_file, "w") as config_file:
-                dump(existing_content, config_file, indent=4, sort_keys=True)
-            return existing_content[str(self.phone_number)]
+            return self._save_credentials(data, uuid)
+
+    def _save_credentials(self, data: dict, uuid: str) -> dict:
+        pwd_token = (self._credentials.get(self.phone_number) or {}).get('pwd_token')
+        data = {**data, 'uuid': uuid}
+        if pwd_token and not data.get('pwd_token'):
+            data['pwd_token'] = pwd_token
+        self._credentials.set(self.phone_number, data)
+        return data
+
+    def _login(self):
+        # Concurrent first calls wait here for a single login instead of each one logging in.
+        with self._auth_lock:
+            if not self.access_token:
+                auth_data = self.credentials_manager()
+                if auth_data:
+                    self.access_token = auth_data['access']
+
+    def _refresh_lock(self) -> Union[FileLock, RLock]:
+        # The lock file of the account, shared between processes, or a lock of this process for stores that are not on disk.
+        if self._credentials.lock_path is None:
+            with _store_locks_lock:
+                return _store_locks.setdefault(self._credentials, RLock())
+        return get_file_lock(f"{self._credentials.lock_path}.{self.phone_number}.lock")
+
+    def _refresh_access_token(self, used_token: Union[str, None]):
+        """
+        Single-flight token refresh: the first call that got ``403`` refreshes the token, and the calls that
+        waited for it (In this process or in other processes) reuse the new token.
+        """
+        if _refreshing.get():  # Nested refresh inside a refresh
+            self.generate_access_token()
+            return
+        token = _refreshing.set(True)
+        try:
+            with self._refresh_lock():
+                if self.access_token != used_token:  # Refreshed by another thread while waiting
+                    return
+                auth_data = self._credentials.get(self.phone_number)
+                if auth_data and auth_data.get('access') and auth_data['access'] != used_token:
+                    self.access_token = auth_data['access']  # Refreshed by another process or instance
+                    return
+                self.generate_access_token()
+        finally:
+            _refreshing.reset(token)
+
+    def _schedule_token_refresh(self):
+        # Refresh the token in the background, ``refresh_margin`` seconds before it expires.
+        if self._refresh_timer is not None:
+            self._refresh_timer.cancel()
+            self._refresh_timer = None
+        expires_in = self.token_expires_in
+        if self.refresh_margin is None or expires_in is None or not self.phone_number:
+            return
+        self._refresh_timer = _refresh_scheduler.schedule(self, _refresh_delay(expires_in, self.refresh_margin),
+                                                          self.access_token)
+
+    def _proactive_refresh(self, used_token: str):
+        try:
+            self._refresh_access_token(used_token)
+        except Exception as err:  # The next request refreshes the token on 403 anyway.
+            print(f"Failed to refresh the access token in the background: {err}")
+
+    def _setup_credentials(self,
+                           phone_number: Union[int, str, None] = None,
+                           activation_code: Union[int, str, None] = None,
+                           access_token: Union[str, None] = None,
+                           account_details: dict = None,
+                           config_file: Union[str, None] = 'config.json',
+                           credential_store: Union[CredentialStore, None] = None):
+        if config_file.endswith(".json"):
+            self.config_file = config_file
+        else:
+            print("Not a valid config json file. Using default 'config.json' file.")
+            self.config_file = 'config.json'
+
+        if not access_token and not phone_number and not account_details:
+            raise MeException("You need to provide phone number, account details or access token!")
+        if access_token and phone_number:
+            raise MeException("Access-token mode does not accept phone number, just access token.")
+        if account_details and (phone_number or access_token):
+            raise MeException("No need to provide phone number or access token if account_detail provided.")
+
+        if account_details:
+            if not isinstance(account_details, dict):
+                raise MeException("Account details must be data dict. ")
+            if account_details.get('phone_number') and account_details.get('activation_code'):
+                phone_number = account_details['phone_number']
+                if match(r'^\d{6}$', str(account_details['activation_code'])):
+                    activation_code = account_details['activation_code']
+                else:
+                    raise MeException("Not a valid 6-digits activation code!")
+
+        self.phone_number = self.valid_phone_number(phone_number) if phone_number else phone_number
+        self.activation_code = activation_code
+        self.access_token = access_token
+        self.account_details = account_details
+        self.uuid = None
+        self._auth_lock = RLock()
+        self._credentials = credential_store or JsonCredentialStore(self.config_file)
@@ -0,0 +1,278 @@
+"""
+Benchmarks of meapi against the local stand-in server (:py:mod:`meapi.testing`). Run with ``python -m meapi.bench``.
+
+The results are printed (Or written to ``--output``) as JSON, to compare releases::
+
+    python -m meapi.bench --output bench-0.1.8.json
+    python -m meapi.bench --only overhead,decode --calls 5000
+"""
+from argparse import ArgumentParser
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from json import dumps
+from platform import platform, python_implementation, python_version
+from statistics import median
+from subprocess import run, PIPE
+from sys import executable
+from time import perf_counter
+from typing import Callable, List, Union
+
+IMPORT_MODULES = ['meapi', 'meapi.me', 'meapi.aio.me']
+BENCHMARKS = ['import', 'construction', 'overhead', 'decode', 'throughput']
+_phone_number = 972541234567
+
+
+def _best_of(repeat: int, number: int, func: Callable[[], object]) -> float:
+    # Min of the runs, in microseconds per call. The min is the least noisy estimate of the cost.
+    times = []
+    for _ in range(repeat):
+        start = perf_counter()
+        for _ in range(number):
+            func()
+        times.append((perf_counter() - start) / number)
+    return round(min(times) * 1e6, 3)
+
+
+def _percentile(values: List[float], percent: float) -> float:
+    values = sorted(values)
+    return values[min(int(len(values) * percent / 100), len(values) - 1)]
+
+
+def bench_import(module: str = 'meapi', repeat: int = 5) -> dict:
+    """
+    Measure the import time of ``module`` in fresh interpreters, with ``python -X importtime``.
+
+    :param module: Module to import. Default: ``meapi``.
+    :type module: str
+    :param repeat: Number of interpreters to run. Default: ``5``.
+    :type repeat: int
+    :return: Dict with ``module``, ``runs``, ``min_ms`` and ``median_ms`` (Cumulative import time of the module).
+    :rtype: dict
+    """
+    times = []
+    for _ in range(repeat):
+        result = run([executable, '-X', 'importtime', '-c', f'import {module}'], stdout=PIPE, stderr=PIPE,
+                     universal_newlines=True, check=True)
+        times.append(_cumulative_import_time(result.stderr, module) / 1000)
+    return {'module': module, 'runs': repeat, 'min_ms': round(min(times), 3), 'median_ms': round(median(times), 3)}
+
+
+def _cumulative_import_time(importtime_output: str, module: str) -> int:
+    # Lines of ``-X importtime``: "import time: self [us] | cumulative | imported package"
+    for line in importtime_output.splitlines():
+        parts = line.split('|')
+        if len(parts) == 3 and parts[2].strip() == module:
+            return int(parts[1])
+    raise ValueError(f"No import time for {module}")
+
+
+def bench_construction(repeat: int = 5, number: int = 1000) -> dict:
+    """
+    Measure the time to create clients, without network I/O.
+
+    :return: Dict of microseconds per construction, by client kind.
+    :rtype: dict
+    """
+    from meapi import Me, MemoryCredentialStore
+    from meapi.testing import FakeMeApi, InProcessTransport
+    api = FakeMeApi(users=10, notifications=0)
+    transport = InProcessTransport(api)
+    token = api.issue_token(_phone_number)
+    store = MemoryCredentialStore()
+    results = {
+        'me_access_token_us': _best_of(repeat, number, lambda: Me(access_token=token, transport=transport, refresh_margin=None)),
+        'me_lazy_us': _best_of(repeat, number, lambda: Me(phone_number=_phone_number, credential_store=store,
+                                                          transport=transport, lazy=True)),
+        'me_default_transport_us': _best_of(repeat, max(number // 10, 1), lambda: Me(access_token=token).close()),
+    }
+    try:
+        from meapi import AsyncMe
+        results['async_me_us'] = _best_of(repeat, number, lambda: AsyncMe(access_token=token, refresh_margin=None))
+    except Exception:  # aiohttp is optional
+        pass
+    return results
+
+
+def bench_overhead(repeat: int = 5, number: int = 2000) -> dict:
+    """
+    Measure the client overhead of :py:func:`~meapi.Me.make_request`: a call through the client minus the same call
+    straight to the in-process stand-in (So the server side and the network are not counted).
+
+    :return: Dict with microseconds per call: ``transport_us``, ``make_request_us`` and ``overhead_us``.
+    :rtype: dict
+    """
+    from meapi import Me
+    from meapi.testing import FakeMeApi, InProcessTransport
+    from meapi.util import _default_headers
+    api = FakeMeApi(users=10, notifications=0)
+    transport = InProcessTransport(api)
+    me = Me(access_token=api.issue_token(_phone_number), transport=transport, refresh_margin=None)
+    headers = {**_default_headers(), 'authorization': me.access_token}
+    transport_us = _best_of(repeat, number, lambda: transport.request('get', '/main/settings/', None, headers))
+    make_request_us = _best_of(repeat, number, lambda: me.make_request('get', '/main/settings/'))
+    return {'endpoint': '/main/settings/', 'calls': number, 'transport_us': transport_us,
+            'make_request_us': make_request_us, 'overhead_us': round(make_request_us - transport_us, 3)}
+
+
+def bench_decode(repeat: int = 5, number: int = 50) -> List[dict]:
+    """
+    Measure the JSON decode cost of large responses: :py:func:`~meapi.Me.get_groups_names` and :py:func:`~meapi.Me.get_notifications`.
+
+    :return: List of dicts with ``endpoint``, ``bytes``, ``decode_us`` and ``mb_per_s``.
+    :rtype: List[dict]
+    """
+    from meapi.testing import FakeMeApi
+    from meapi.transport import TransportResponse
+    from meapi.util import _decode_response
+    api = FakeMeApi(users=5000, notifications=1000, seed=1)
+    token = api.issue_token(_phone_number)
+    results = []
+    for name, endpoint in (('get_groups_names', '/main/names/groups/'),
+                           ('get_notifications', '/notification/notification/items/?page=1&page_size=1000&status=distributed')):
+        status, headers, content = api.handle('get', endpoint, b'', {'authorization': token})
+        response = TransportResponse(status, content, headers)
+        decode_us = _best_of(repeat, number, lambda: _decode_response(response.status_code, response.content))
+        results.append({'endpoint': name, 'bytes': len(content), 'decode_us': decode_us,
+                        'mb_per_s': round(len(content) / decode_us, 3)})
+    return results
+
+
+def bench_throughput(concurrency: List[int], requests: int = 200, latency: float = 0.01) -> List[dict]:
+    """
+    Measure requests per second of :py:func:`~meapi.Me.phone_search` against a :py:class:`~meapi.testing.MeTestServer`
+    at each concurrency level: threads sharing one :py:class:`~meapi.Me`, and tasks of one :py:class:`~meapi.AsyncMe`.
+
+    :return: List of dicts with ``client``, ``concurrency``, ``requests``, ``rps``, ``p50_ms`` and ``p95_ms``.
+    :rtype: List[dict]
+    """
+    from meapi import Me
+    from meapi.testing import FakeMeApi, MeTestServer
+    results = []
+    with MeTestServer(FakeMeApi(latency=latency, users=requests, notifications=0)) as server:
+        token = server.api.issue_token(_phone_number)
+        for level in concurrency:
+            transport = server.transport(pool_maxsize=level)
+            me = Me(access_token=token, transport=transport, refresh_margin=None)
+
+            def call(number: int) -> float:
+                start = perf_counter()
+                me.phone_search(972500000000 + number % requests)
+                return perf_counter() - start
+
+            with ThreadPoolExecutor(max_workers=level) as executor:
+                start = perf_counter()
+                latencies = list(executor.map(call, range(requests)))
+                elapsed = perf_counter() - start
+            transport.close()
+            results.append(_throughput_result('sync', level, latencies, elapsed))
+        try:
+            from asyncio import run as run_async
+            from meapi.aio.util import ClientSession
+        except ImportError:
+            ClientSession = None
+        if ClientSession is not None:
+            for level in concurrency:
+                results.append(run_async(_async_throughput(server, token, level, requests)))
+    return results
+
+
+async def _async_throughput(server, token: str, level: int, requests: int) -> dict:
+    from asyncio import gather, Semaphore
+    from meapi import AsyncMe
+    transport = server.async_transport(limit=level, limit_per_host=level)
+    me = AsyncMe(access_token=token, transport=transport, refresh_margin=None)
+    semaphore = Semaphore(level)
+
+    async def call(number: int) -> float:
+        async with semaphore:
+            start = perf_counter()
+            await me.phone_search(972500000000 + number % requests)
+            return perf_counter() - start
+
+    start = perf_counter()
+    latencies = await gather(*(call(number) for number in range(requests)))
+    elapsed = perf_counter() - start
+    await transport.close()
+    return _throughput_result('async', level, latencies, elapsed)
+
+
+def _throughput_result(client: str, level: int, latencies: List[float], elapsed: float) -> dict:
+    return {'client': client, 'concurrency': level, 'requests': len(latencies), 'rps': round(len(latencies) / elapsed, 1),
+            'p50_ms': round(_percentile(latencies, 50) * 1000, 3), 'p95_ms': round(_percentile(latencies, 95) * 1000, 3)}
+
+
+def run_benchmarks(only: Union[List[str], None] = None,
+                   repeat: int = 5,
+                   calls: int = 2000,
+                   requests: int = 200,
+                   concurrency: Union[List[int], None] = None,
+                   latency: float = 0.01) -> dict:
+    """
+    Run the benchmarks.
+
+    :param only: Names of benchmarks to run (``import``, ``construction``, ``overhead``, ``decode``, ``throughput``). Default: ``None`` (All).
+    :type only: Union[List[str], None]
+    :param repeat: Runs of each measurement. Default: ``5``.
+    :type repeat: int
+    :param calls: Calls in each run of the overhead benchmark. Default: ``2000``.
+    :type calls: int
+    :param requests: Requests in each concurrency level of the throughput benchmark. Default: ``200``.
+    :type requests: int
+    :param concurrency: Concurrency levels of the throughput benchmark. Default: ``[1, 4, 16, 64]``.
+    :type concurrency: Union[List[int], None]
+    :param latency: Seconds of server latency in the throughput benchmark. Default: ``0.01``.
+    :type latency: float
+    :return: Dict with ``meta`` and the results of each benchmark.
+    :rtype: dict
+    """
+    from meapi._version import __version__
+    from meapi.util import JSON_BACKEND
+    only = only or BENCHMARKS
+    results = {'meta': {'meapi': __version__, 'python': python_version(), 'implementation': python_implementation(),
+                        'json': JSON_BACKEND, 'platform': platform(), 'date': datetime.now(timezone.utc).isoformat(timespec='seconds')}}
+    if 'import' in only:
+        results['import'] = [bench_import(module, repeat) for module in IMPORT_MODULES]
+    if 'construction' in only:
+        results['construction'] = bench_construction(repeat)
+    if 'overhead' in only:
+        results['overhead'] = bench_overhead(repeat, calls)
+    if 'decode' in only:
+        results['decode'] = bench_decode(repeat)
+    if 'throughput' in only:
+        results['throughput'] = bench_throughput(concurrency or [1, 4, 16, 64], requests, latency)
+    return results
+
+
+def main(argv: Union[List[str], None] = None) -> int:
+    parser = ArgumentParser(prog='python -m meapi.bench', description='Benchmarks of meapi against a local stand-in server. Prints the results as JSON.')
+    parser.add_argument('--only', default=','.join(BENCHMARKS), help=f"Comma separated benchmarks. Default: {','.join(BENCHMARKS)}.")
+    parser.add_argument('--repeat', type=int, default=5, help='Runs of each measurement. Default: 5.')
+    parser.add_argument('--calls', type=int, default=2000, help='Calls in each run of the overhead benchmark. Default: 2000.')
+    parser.add_argument('--requests', type=int, default=200, help='Requests in each concurrency level. Default: 200.')
+    parser.add_argument('--concurrency', default='1,4,16,64', help='Comma separated concurrency levels. Default: 1,4,16,64.')
+    parser.add_argument('--latency', type=float, default=0.01, help='Seconds of server latency in the throughput benchmark. Default: 0.01.')
+    parser.add_argument('--output', default=None, help='Write the results to this file instead of printing them.')
+    parser.add_argument('--max-import-ms', type=float, default=None,
+                        help='Exit with status 1 if the import of meapi takes longer (min of the runs).')
+    args = parser.parse_args(argv)
+
+    only = [name.strip() for name in args.only.split(',') if name.strip()]
+    unknown = set(only) - set(BENCHMARKS)
+    if unknown:
+        parser.error(f"Unknown benchmarks: {', '.join(sorted(unknown))}")
+    results = run_benchmarks(only=only, repeat=args.repeat, calls=args.calls, requests=args.requests,
+                             concurrency=[int(level) for level in args.concurrency.split(',')], latency=args.latency)
+    output = dumps(results, indent=2)
+    if args.output:
+        with open(args.output, 'w') as output_file:
+            output_file.write(output + '\n')
+    else:
+        print(output)
+    if args.max_import_ms is not None and 'import' in results and results['import'][0]['min_ms'] > args.max_import_ms:
+        print(f"Import of meapi took {results['import'][0]['min_ms']}ms (Limit: {args.max_import_ms}ms).")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,243 @@
+from collections import OrderedDict
+from copy import deepcopy
+from json import dumps, loads
+from sqlite3 import connect
+from threading import Lock
+from time import monotonic, time
+from typing import Any, Dict, Tuple, Union
+
+DEFAULT_TTLS = {'phone_search': 3600, 'get_profile_info': 600}
+
+
+class ResponseCache:
+    """
+    Read-through cache for the read-only lookups :py:func:`~meapi.Me.phone_search` and :py:func:`~meapi.Me.get_profile_info`.
+
+    - Also serves the methods that use them: :py:func:`~meapi.Me.get_uuid`, :py:func:`~meapi.Me.is_spammer`, :py:func:`~meapi.Me.get_distance`, :py:func:`~meapi.Me.get_age` and :py:func:`~meapi.Me.get_socials`.
+    - Cache hits do not consume the :py:class:`~meapi.QuotaTracker`.
+    - Entries are evicted by TTL, and by least recent use when the cache is full.
+    - Numbers without results (``404``, ``Not found.``) are cached with ``negative_ttl``.
+    - Methods that change data (:py:func:`~meapi.Me.update_profile_info`, :py:func:`~meapi.Me.block_profile` etc.) invalidate the affected entries.
+    - With ``store``, entries are also saved on disk and the in-memory cache sits in front of it.
+
+    :param max_size: Max count of entries. Default: ``1024``.
+    :type max_size: int
+    :param ttls: Seconds to keep entries of each method. Default: ``{'phone_search': 3600, 'get_profile_info': 600}``.
+    :type ttls: Dict[str, float]
+    :param negative_ttl: Seconds to keep empty :py:func:`~meapi.Me.phone_search` results. Default: ``300``.
+    :type negative_ttl: float
+    :param store: Persistent store behind the in-memory cache. Default: ``None`` (In memory only).
+    :type store: Union[SQLiteCacheStore, None]
+
+    Example::
+
+        me = Me(phone_number=972123456789, cache=ResponseCache(max_size=10000, store=SQLiteCacheStore('cache.db')))
+        me.get_uuid(972987654321)
+        me.is_spammer(972987654321)  # Served from the cache
+        print(me.cache.stats)
+    """
+    def __init__(self, max_size: int = 1024, ttls: Dict[str, float] = None, negative_ttl: float = 300,
+                 store: Union['SQLiteCacheStore', None] = None):
+        self.max_size = max_size
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self.negative_ttl = negative_ttl
+        self.store = store
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = Lock()
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """
+        Counters of the cache: ``hits``, ``misses``, ``evictions`` and current ``size``.
+        """
+        return {'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions, 'size': len(self._entries)}
+
+    def get(self, name: str, key: Any) -> Tuple[bool, Any]:
+        """
+        Get cached response.
+
+        :param name: Method name, ``phone_search`` or ``get_profile_info``.
+        :type name: str
+        :param key: Parameters of the call (phone number, uuid).
+        :type key: Any
+        :return: Tuple of: is hit, copy of the cached response.
+        :rtype: Tuple[bool, Any]
+        """
+        cache_key = (name, str(key))
+        with self._lock:
+            entry = self._entries.get(cache_key)
+            if entry is not None:
+                if entry[0] > monotonic():
+                    self._entries.move_to_end(cache_key)
+                    self.hits += 1
+                    return True, deepcopy(entry[1])
+                del self._entries[cache_key]
+        if self.store is not None:
+            found, value, expires_at = self.store.get(name, str(key))
+            if found:
+                with self._lock:
+                    self.hits += 1
+                    self._put(cache_key, value, expires_at - time())
+                return True, value
+        with self._lock:
+            self.misses += 1
+        return False, None
+
+    def set(self, name: str, key: Any, value: Any, ttl: Union[float, None] = None):
+        """
+        Save response in the cache.
+
+        :param name: Method name, ``phone_search`` or ``get_profile_info``.
+        :type name: str
+        :param key: Parameters of the call (phone number, uuid).
+        :type key: Any
+        :param value: The response.
+        :type value: Any
+        :param ttl: Seconds to keep the response. Default: ``None`` (The ttl of the method).
+        :type ttl: Union[float, None]
+        """
+        ttl = self.ttls.get(name, 0) if ttl is None else ttl
+        if ttl <= 0 or self.max_size <= 0:
+            return
+        cache_key = (name, str(key))
+        with self._lock:
+            self._put(cache_key, value, ttl)
+        if self.store is not None:
+            self.store.set(name, str(key), value, time() + ttl)
+
+    def _put(self, cache_key: Tuple[str, str], value: Any, ttl: float):
+        self._entries[cache_key] = (monotonic() + ttl, deepcopy(value))
+        self._entries.move_to_end(cache_key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, name: str, key: Any = None):
+        """
+        Remove entries from the cache.
+
+        :param name: Method name, ``phone_search`` or ``get_profile_info``.
+        :type name: str
+        :param key: Parameters of the call. Default: ``None`` (All the entries of the method).
+        :type key: Any
+        """
+        with self._lock:
+            if key is not None:
+                self._entries.pop((name, str(key)), None)
+            else:
+                for cache_key in [cache_key for cache_key in self._entries if cache_key[0] == name]:
+                    del self._entries[cache_key]
+        if self.store is not None:
+            self.store.delete(name, None if key is None else str(key))
+
+    def invalidate_contact(self, phone_number: Union[int, str]):
+        """
+        Remove the :py:func:`~meapi.Me.phone_search` entry of a phone number, and the profile of its user if known.
+
+        :param phone_number: Phone number in international format.
+        :type phone_number: Union[int, str]
+        """
+        with self._lock:
+            entry = self._entries.get(('phone_search', str(phone_number)))
+        results = entry[1] if entry else None
+        if results is None and self.store is not None:
+            results = self.store.get('phone_search', str(phone_number))[1]
+        self.invalidate('phone_search', phone_number)
+        user = ((results or {}).get('contact') or {}).get('user') or {}
+        if user.get('uuid'):
+            self.invalidate('get_profile_info', user['uuid'])
+
+    def clear(self):
+        """
+        Remove all the entries from the cache.
+        """
+        with self._lock:
+            self._entries.clear()
+        if self.store is not None:
+            self.store.clear()
+
+
+class SQLiteCacheStore:
+    """
+    On-disk store for :py:class:`ResponseCache`, so lookups survive process restarts.
+
+    - The database runs in WAL mode, so several processes can share one file: readers do not block the writer.
+    - Expired entries are never returned and are removed on eviction.
+    - When the store passes ``max_size`` entries, expired entries and then the oldest ones are removed.
+
+    :param db_file: Path to the SQLite database file. Default: ``meapi_cache.db``.
+    :type db_file: str
+    :param max_size: Max count of entries. Default: ``100000``.
+    :type max_size: int
+    :param busy_timeout: Seconds to wait for a lock held by another process. Default: ``10``.
+    :type busy_timeout: float
+    """
+    def __init__(self, db_file: str = 'meapi_cache.db', max_size: int = 100000, busy_timeout: float = 10):
+        self.db_file = db_file
+        self.max_size = max_size
+        self._lock = Lock()
+        self._writes = 0
+        self._db = connect(db_file, timeout=busy_timeout, check_same_thread=False, isolation_level=None)
+        self._db.execute('PRAGMA journal_mode=WAL')
+        self._db.execute('PRAGMA synchronous=NORMAL')
+        self._db.execute('CREATE TABLE IF NOT EXISTS cache (name TEXT NOT NULL, key TEXT NOT NULL, value TEXT NOT NULL, '
+                         'expires_at REAL NOT NULL, stored_at REAL NOT NULL, PRIMARY KEY (name, key))')
+        self._db.execute('CREATE INDEX IF NOT EXISTS cache_stored_at ON cache (stored_at)')
+
+    def get(self, name: str, key: str) -> Tuple[bool, Any, float]:
+        """
+        Get stored response.
+
+        :return: Tuple of: is found, the response, expiry time (Unix time).
+        :rtype: Tuple[bool, Any, float]
+        """
+        with self._lock:
+            row = self._db.execute('SELECT value, expires_at FROM cache WHERE name = ? AND key = ? AND expires_at > ?',
+                                   (name, key, time())).fetchone()
+        if row is None:
+            return False, None, 0.0
+        return True, loads(row[0]), row[1]
+
+    def set(self, name: str, key: str, value: Any, expires_at: float):
+        """
+        Save response until ``expires_at`` (Unix time).
+        """
+        with self._lock:
+            self._db.execute('INSERT OR REPLACE INTO cache (name, key, value, expires_at, stored_at) VALUES (?, ?, ?, ?, ?)',
+                             (name, key, dumps(value), expires_at, time()))
+            self._writes += 1
+            if self._writes % 100 == 0:  # Counting the table on every write is too slow.
+                self._evict()
+
+    def delete(self, name: str, key: Union[str, None] = None):
+        """
+        Remove one entry, or all the entries of ``name`` if ``key`` is ``None``.
+        """
+        with self._lock:
+            if key is None:
+                self._db.execute('DELETE FROM cache WHERE name = ?', (name,))
+            else:
+                self._db.execute('DELETE FROM cache WHERE name = ? AND key = ?', (name, key))
+
+    def clear(self):
+        """
+        Remove all the entries.
+        """
+        with self._lock:
+            self._db.execute('DELETE FROM cache')
+
+    def close(self):
+        """
+        Close the database connection.
+        """
+        with self._lock:
+            self._db.close()
+
+    def _evict(self):
+        self._db.execute('DELETE FROM cache WHERE expires_at <= ?', (time(),))
+        extra = self._db.execute('SELECT COUNT(*) FROM cache').fetchone()[0] - self.max_size
+        if extra > 0:
+            self._db.execute('DELETE FROM cache WHERE rowid IN (SELECT rowid FROM cache ORDER BY stored_at LIMIT ?)', (extra,))
@@ -0,0 +1,403 @@
+from asyncio import ensure_future, get_running_loop
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from csv import reader
+from io import TextIOWrapper
+from itertools import chain
+from math import ceil, log
+from os import PathLike, fspath, path
+from quopri import decodestring
+from re import compile as regex
+from sqlite3 import connect
+from typing import Callable, Dict, Iterator, List, Tuple, Union
+from meapi.account import _merge_chunk_results
+from meapi.exceptions import MeException
+from meapi.util import _clean_phone_number
+
+_VCARD_PROPERTIES = ('BEGIN', 'END', 'FN', 'N', 'ORG', 'TEL', 'BDAY')
+_NAME_HEADERS = ('name', 'full name', 'display name', 'fn')
+_NAME_PART_HEADERS = (('first name', 'given name'), ('middle name', 'additional name'), ('last name', 'family name'))
+_BIRTHDAY_HEADERS = ('birthday', 'date of birth', 'date_of_birth', 'bday')
+_escaped = regex(r'\\(.)')
+_unescaped_semicolon = regex(r'(?<!\\);')
+_date = regex(r'^(\d{4})-?(\d{2})-?(\d{2})')
+_mask = 0xFFFFFFFFFFFFFFFF
+
+
+class _PhoneNumberFilter:
+    """
+    Set of phone numbers in bounded memory: a Bloom filter answers most lookups, and the numbers are kept in a temporary
+    SQLite database (On disk, with a small cache) to confirm its hits, so no new number is ever dropped.
+    """
+    def __init__(self, capacity: int, error_rate: float, cache_kib: int = 2048, flush_size: int = 10000):
+        self._bits = max(64, ceil(-capacity * log(error_rate) / log(2) ** 2))
+        self._hashes = max(1, round(self._bits / capacity * log(2)))
+        self._filter = bytearray((self._bits + 7) // 8)
+        self._pending = set()
+        self._flush_size = flush_size
+        self._db = connect('', check_same_thread=False, isolation_level=None)  # An empty path is a private database, deleted on close.
+        self._db.execute(f'PRAGMA cache_size=-{cache_kib}')
+        self._db.execute('CREATE TABLE numbers (phone_number INTEGER PRIMARY KEY)')
+
+    def add(self, phone_number: int) -> bool:
+        """
+        Add a number, return ``False`` if it was already added.
+        """
+        x = (phone_number + 0x9E3779B97F4A7C15) & _mask  # splitmix64, for two independent hashes.
+        x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & _mask
+        x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & _mask
+        x ^= x >> 31
+        first, second, bits, bloom = x & 0xFFFFFFFF, (x >> 32) | 1, self._bits, self._filter
+        positions = [(first + i * second) % bits for i in range(self._hashes)]
+        if all(bloom[position >> 3] & (1 << (position & 7)) for position in positions):
+            if phone_number in self._pending or self._db.execute(
+                    'SELECT 1 FROM numbers WHERE phone_number = ?', (phone_number,)).fetchone():
+                return False
+        else:
+            for position in positions:
+                bloom[position >> 3] |= 1 << (position & 7)
+        self._pending.add(phone_number)
+        if len(self._pending) >= self._flush_size:
+            self._flush()
+        return True
+
+    def _flush(self):
+        self._db.executemany('INSERT OR IGNORE INTO numbers VALUES (?)', ((number,) for number in self._pending))
+        self._pending.clear()
+
+    def close(self):
+        self._db.close()
+
+
+def _property_name(line: str) -> str:
+    name = line.split(':', 1)[0].split(';', 1)[0]
+    return name.rsplit('.', 1)[-1].strip().upper()  # Without the group, like ``item1.TEL``.
+
+
+def _unfold(lines) -> Iterator[str]:
+    """
+    Join the folded lines of a vCard (And the soft line breaks of quoted-printable), only for the properties that are used,
+    so large properties like photos are not kept in memory.
+    """
+    current = None
+    for line in lines:
+        if current is not None and line[:1] in (' ', '\t'):
+            if current:
+                current += line[1:].rstrip('\r\n')
+            continue
+        line = line.rstrip('\r\n')
+        if current and current.endswith('=') and 'QUOTED-PRINTABLE' in current.split(':', 1)[0].upper():
+            current = current[:-1] + line
+            continue
+        if current:
+            yield current
+        current = line if _property_name(line) in _VCARD_PROPERTIES else ''
+    if current:
+        yield current
+
+
+def _property_value(line: str) -> str:
+    head, _, value = line.partition(':')
+    params = head.upper().split(';')[1:]
+    if 'ENCODING=QUOTED-PRINTABLE' in params or 'QUOTED-PRINTABLE' in params:
+        charset = next((param.split('=', 1)[1] for param in params if param.startswith('CHARSET=')), 'UTF-8')
+        try:
+            value = decodestring(value.encode('ascii', 'replace')).decode(charset, 'replace')
+        except LookupError:
+            value = decodestring(value.encode('ascii', 'replace')).decode('utf-8', 'replace')
+    return value.strip()
+
+
+def _unescape(value: str) -> str:
+    return _escaped.sub(lambda escaped: ' ' if escaped.group(1) in 'nN' else escaped.group(1), value).strip()
+
+
+def _birthday(value: Union[str, None]) -> Union[str, None]:
+    date = _date.match(value.strip()) if value else None
+    return '-'.join(date.groups()) if date else None
+
+
+def _iter_vcard(lines) -> Iterator[Tuple[Union[str, None], List[str], Union[str, None]]]:
+    card = None
+    for line in _unfold(lines):
+        name = _property_name(line)
+        if name == 'BEGIN':
+            card = {'TEL': []}
+        elif name == 'END':
+            if card is not None:
+                full_name = card.get('FN')
+                if not full_name and card.get('N'):
+                    parts = [_unescape(part) for part in _unescaped_semicolon.split(card['N'])] + [''] * 3
+                    full_name = ' '.join(part for part in (parts[1], parts[2], parts[0]) if part)
+                yield _unescape(full_name or card.get('ORG') or '') or None, card['TEL'], _birthday(card.get('BDAY'))
+            card = None
+        elif card is not None:
+            value = _property_value(line)
+            if name == 'TEL':
+                card['TEL'].append(value[4:] if value.lower().startswith('tel:') else value)
+            elif name not in card:
+                card[name] = value
+
+
+def _csv_columns(header: List[str], name_columns, phone_columns, birthday_column) -> Tuple[List[int], List[int], Union[int, None]]:
+    normalized = [column.strip().lower() for column in header]
+
+    def index(column: str) -> int:
+        if column.strip().lower() not in normalized:
+            raise MeException(f"Column {column!r} not found in the CSV header: {', '.join(header)}")
+        return normalized.index(column.strip().lower())
+
+    if name_columns is not None:
+        names = [index(column) for column in ([name_columns] if isinstance(name_columns, str) else name_columns)]
+    else:
+        names = [normalized.index(column) for column in _NAME_HEADERS if column in normalized][:1] or \
+                [normalized.index(column) for options in _NAME_PART_HEADERS for column in options if column in normalized]
+    if phone_columns is not None:
+        phones = [index(column) for column in ([phone_columns] if isinstance(phone_columns, str) else phone_columns)]
+    else:
+        phones = [i for i, column in enumerate(normalized) if ('phone' in column or 'mobile' in column or column in ('tel', 'telephone'))
+                  and 'type' not in column and 'label' not in column]
+    if not names or not phones:
+        raise MeException(f"Name or phone columns not found in the CSV header: {', '.join(header)}. "
+                          f"Set them with name_columns and phone_columns.")
+    if birthday_column is not None:
+        birthday = index(birthday_column)
+    else:
+        birthday = next((normalized.index(column) for column in _BIRTHDAY_HEADERS if column in normalized), None)
+    return names, phones, birthday
+
+
+def _iter_csv(lines, delimiter: str, name_columns, phone_columns, birthday_column
+              ) -> Iterator[Tuple[Union[str, None], List[str], Union[str, None]]]:
+    rows = reader(lines, delimiter=delimiter)
+    header = next(rows, None)
+    if header is None:
+        return
+    names, phones, birthday = _csv_columns(header, name_columns, phone_columns, birthday_column)
+    for row in rows:
+        if not row:
+            continue
+        full_name = ' '.join(row[i].strip() for i in names if i < len(row) and row[i].strip())
+        numbers = [number for i in phones if i < len(row) and row[i].strip()
+                   for number in row[i].split(':::')]  # Google joins numbers with ``:::``.
+        yield full_name or None, numbers, _birthday(row[birthday]) if birthday is not None and birthday < len(row) else None
+
+
+def _merge_summaries(summary: Union[dict, None], result: dict) -> dict:
+    if summary is None:
+        return result
+    merged = _merge_chunk_results([], [summary, result], [])
+    merged.update(chunks=summary['chunks'] + result['chunks'], failed=summary['failed'] + result['failed'],
+                  errors=summary['errors'] + result['errors'])
+    return merged
+
+
+class ContactImporter:
+    """
+    Stream contacts from a vCard (``.vcf``) or CSV export to a Me account, in flat memory no matter how big the file is.
+
+    - The file is read lazily, record by record: only the contacts of the batches that are being uploaded are in memory.
+    - Phone numbers are normalized like :py:func:`~meapi.Me.valid_phone_number`. Records without a name or a valid number are skipped.
+      A vCard with several numbers gives a contact for each number.
+    - Duplicate numbers are dropped (The first contact of a number is used) with a Bloom filter of fixed size, backed by a temporary
+      database on disk, so no unique number is lost when the file has more numbers than ``dedup_capacity``.
+    - CSV columns are detected from the header (Google, Outlook, or ``name`` and ``phone`` columns), or set with ``name_columns`` and ``phone_columns``.
+    - :py:func:`upload` sends the contacts in chunks with :py:func:`~meapi.Me.add_contacts`, while the next batch is read.
+
+    :param source: Path of the file, or a file object (Text or binary).
+    :type source: Union[str, os.PathLike, typing.IO]
+    :param file_format: ``'vcard'`` or ``'csv'``. Default: ``None`` (By the file extension, or by the first line).
+    :type file_format: Union[str, None]
+    :param encoding: Encoding of the file. Default: ``utf-8-sig`` (UTF-8, with or without a BOM).
+    :type encoding: str
+    :param country_code: ``country_code`` of the contacts (``IL``, ``US``...). Default: ``None``.
+    :type country_code: Union[str, None]
+    :param delimiter: Delimiter of the CSV. Default: ``None`` (Tab for ``.tsv`` files, else ``,``).
+    :type delimiter: Union[str, None]
+    :param name_columns: CSV columns of the name, joined with spaces. Default: ``None`` (Detected).
+    :type name_columns: Union[str, List[str], None]
+    :param phone_columns: CSV columns of phone numbers. Default: ``None`` (Detected).
+    :type phone_columns: Union[str, List[str], None]
+    :param birthday_column: CSV column of the date of birth. Default: ``None`` (Detected).
+    :type birthday_column: Union[str, None]
+    :param dedup_capacity: Expected count of numbers, for the size of the Bloom filter (About 1.8 MB for a million). Larger files
+        are still deduplicated exactly, with more lookups on disk. Default: ``1000000``.
+    :type dedup_capacity: int
+    :param dedup_error_rate: Rate of lookups on disk for new numbers. Default: ``0.001``.
+    :type dedup_error_rate: float
+
+    Example::
+
+        importer = ContactImporter('contacts.vcf', country_code='IL')
+        result = importer.upload(me, chunk_size=1000, progress=lambda uploaded, read: print(uploaded, read))
+        print(result['contacts'], result['duplicates'], result['failed'])
+    """
+    def __init__(self,
+                 source,
+                 file_format: Union[str, None] = None,
+                 encoding: str = 'utf-8-sig',
+                 country_code: Union[str, None] = None,
+                 delimiter: Union[str, None] = None,
+                 name_columns: Union[str, List[str], None] = None,
+                 phone_columns: Union[str, List[str], None] = None,
+                 birthday_column: Union[str, None] = None,
+                 dedup_capacity: int = 1000000,
+                 dedup_error_rate: float = 0.001):
+        if file_format is not None and file_format.lower() not in ('vcard', 'vcf', 'csv'):
+            raise MeException(f"Not a supported file format: {file_format}. Available formats: vcard, csv")
+        if dedup_capacity < 1 or not 0 < dedup_error_rate < 1:
+            raise MeException("dedup_capacity must be at least 1, and dedup_error_rate between 0 and 1!")
+        self.source = fspath(source) if isinstance(source, (str, PathLike)) else source
+        self.file_format = file_format
+        self.encoding = encoding
+        self.country_code = country_code
+        self.delimiter = delimiter
+        self.name_columns = name_columns
+        self.phone_columns = phone_columns
+        self.birthday_column = birthday_column
+        self.dedup_capacity = dedup_capacity
+        self.dedup_error_rate = dedup_error_rate
+        self.stats: Dict[str, int] = {'records': 0, 'contacts': 0, 'invalid': 0, 'duplicates': 0}
+
+    def __iter__(self) -> Iterator[dict]:
+        """
+        Contacts of the file, normalized and without duplicates, in the format of :py:func:`~meapi.Me.add_contacts`.
+        Counts of the iteration are in ``stats``: ``records``, ``contacts``, ``invalid`` (Skipped) and ``duplicates``.
+        """
+        self.stats = stats = {'records': 0, 'contacts': 0, 'invalid': 0, 'duplicates': 0}
+        numbers = _PhoneNumberFilter(self.dedup_capacity, self.dedup_error_rate)
+        try:
+            for full_name, phone_numbers, date_of_birth in self._records():
+                stats['records'] += 1
+                if not full_name:
+                    stats['invalid'] += 1
+                    continue
+                for phone_number in phone_numbers:
+                    phone_number = _clean_phone_number(phone_number.split(';', 1)[0])
+                    if phone_number is None:
+                        stats['invalid'] += 1
+                    elif not numbers.add(phone_number):
+                        stats['duplicates'] += 1
+                    else:
+                        stats['contacts'] += 1
+                        yield {"country_code": self.country_code, "date_of_birth": date_of_birth,
+                               "name": full_name, "phone_number": phone_number}
+        finally:
+            numbers.close()
+
+    def batches(self, batch_size: int) -> Iterator[List[dict]]:
+        """
+        Contacts of the file in lists of up to ``batch_size``, for :py:func:`~meapi.Me.add_contacts`.
+
+        :param batch_size: Max contacts in each list.
+        :type batch_size: int
+        :rtype: Iterator[List[dict]]
+        """
+        if batch_size < 1:
+            raise MeException("batch_size must be at least 1!")
+        batch = []
+        for contact in self:
+            batch.append(contact)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    def upload(self,
+               me,
+               chunk_size: int = 1000,
+               max_concurrency: int = 4,
+               chunk_retries: int = 2,
+               progress: Union[Callable[[int, int], None], None] = None) -> dict:
+        """
+        Upload the contacts of the file to the account with :py:func:`~meapi.Me.add_contacts`, in chunks. Each batch of
+        ``chunk_size * max_concurrency`` contacts is uploaded while the next one is read.
+
+        :param me: The client.
+        :type me: Me
+        :param chunk_size: Max contacts in each request. Default: ``1000``.
+        :type chunk_size: int
+        :param max_concurrency: Max chunks to upload at a time. Default: ``4``.
+        :type max_concurrency: int
+        :param chunk_retries: Max retries of each failed chunk. Default: ``2``.
+        :type chunk_retries: int
+        :param progress: Function that gets the count of uploaded contacts and the count of contacts read so far. Default: ``None``.
+        :type progress: Union[Callable[[int, int], None], None]
+        :return: The merged results of the chunks (See :py:func:`~meapi.Me.add_contacts`), with the counts of ``stats``.
+        :rtype: dict
+        """
+        summary, pending, offset = None, None, 0
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix='meapi-import') as executor:
+            for batch in self.batches(chunk_size * max(1, max_concurrency)):
+                future = executor.submit(copy_context().run, me.add_contacts, batch, chunk_size, max_concurrency,
+                                         chunk_retries, self._progress(progress, offset))
+                offset += len(batch)
+                if pending is not None:
+                    summary = _merge_summaries(summary, pending.result())
+                pending = future
+            if pending is not None:
+                summary = _merge_summaries(summary, pending.result())
+        return {**(summary or {'chunks': 0, 'failed': [], 'errors': []}), **self.stats}
+
+    async def upload_async(self,
+                           me,
+                           chunk_size: int = 1000,
+                           max_concurrency: int = 4,
+                           chunk_retries: int = 2,
+                           progress: Union[Callable[[int, int], None], None] = None) -> dict:
+        """
+        :py:func:`upload` for :py:class:`~meapi.AsyncMe`. The file is read in a thread, so it does not block the event loop.
+        ``progress`` may be a coroutine function.
+        """
+        loop = get_running_loop()
+        batches = self.batches(chunk_size * max(1, max_concurrency))
+        summary, pending, offset = None, None, 0
+        try:
+            while True:
+                batch = await loop.run_in_executor(None, next, batches, None)
+                if batch is None:
+                    break
+                task = ensure_future(me.add_contacts(batch, chunk_size, max_concurrency, chunk_retries,
+                                                     self._progress(progress, offset)))
+                offset += len(batch)
+                if pending is not None:
+                    summary = _merge_summaries(summary, await pending)
+                pending = task
+            if pending is not None:
+                summary = _merge_summaries(summary, await pending)
+        except BaseException:
+            if pending is not None:
+                pending.cancel()
+            raise
+        return {**(summary or {'chunks': 0, 'failed': [], 'errors': []}), **self.stats}
+
+    def _progress(self, progress: Union[Callable[[int, int], None], None], offset: int):
+        if progress is None:
+            return None
+        return lambda uploaded, total: progress(offset + uploaded, self.stats['contacts'])
+
+    def _records(self) -> Iterator[Tuple[Union[str, None], List[str], Union[str, None]]]:
+        if isinstance(self.source, str):
+            with open(self.source, encoding=self.encoding, errors='replace', newline='') as source:
+                yield from self._parse(source, path.splitext(self.source)[1].lower())
+        else:
+            source = self.source
+            if isinstance(source.read(0), bytes):
+                source = TextIOWrapper(source, encoding=self.encoding, errors='replace', newline='')
+            yield from self._parse(source, path.splitext(getattr(self.source, 'name', '') or '')[1].lower())
+
+    def _parse(self, lines, extension: str) -> Iterator[Tuple[Union[str, None], List[str], Union[str, None]]]:
+        file_format = (self.file_format or '').lower()
+        if not file_format and extension in ('.vcf', '.vcard'):
+            file_format = 'vcard'
+        elif not file_format and extension in ('.csv', '.tsv'):
+            file_format = 'csv'
+        elif not file_format:
+            first_line = next(lines, '')
+            lines = chain([first_line], lines)
+            file_format = 'vcard' if first_line.lstrip('\ufeff').strip().upper().startswith('BEGIN:VCARD') else 'csv'
+        if file_format in ('vcard', 'vcf'):
+            return _iter_vcard(lines)
+        return _iter_csv(lines, self.delimiter or ('\t' if extension == '.tsv' else ','),
+                         self.name_columns, self.phone_columns, self.birthday_column)
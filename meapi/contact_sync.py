@@ -0,0 +1,174 @@
+from hashlib import sha1
+from json import dumps, loads
+from sqlite3 import connect
+from threading import Lock
+from typing import Dict, Iterable, List, Tuple, Union
+from meapi.exceptions import MeException
+from meapi.util import _clean_phone_number
+
+_CONTACTS_SYNC = '/main/contacts/sync/'
+
+
+def _contact_hash(contact: dict) -> str:
+    return sha1(dumps(contact, sort_keys=True, default=str).encode()).hexdigest()
+
+
+class ContactSync:
+    """
+    Sync an address book to a Me account incrementally: only the contacts that were added, changed or removed since the last sync are sent.
+
+    - A snapshot of the uploaded contacts is kept in a SQLite database, by account and normalized phone number, with a hash of each contact.
+    - Phone numbers are normalized like :py:func:`~meapi.Me.valid_phone_number`. Contacts without a name or a valid phone number are skipped. For duplicates, the first contact of a number is used.
+    - Each sync sends the whole delta (Additions and removals) in one contacts sync request, and unchanged contacts are not sent at all.
+    - The snapshot is updated only after the server accepted the delta, so a failed sync is sent again on the next run.
+
+    :param db_file: Path to the SQLite database file. Default: ``meapi_contacts.db``.
+    :type db_file: str
+    :param busy_timeout: Seconds to wait for a lock held by another process. Default: ``10``.
+    :type busy_timeout: float
+
+    Example::
+
+        contact_sync = ContactSync()
+        result = contact_sync.sync(me, address_book)  # Every run sends only the changes.
+        print(result['added'], result['removed'], result['unchanged'])
+    """
+    def __init__(self, db_file: str = 'meapi_contacts.db', busy_timeout: float = 10):
+        self.db_file = db_file
+        self._lock = Lock()
+        self._db = connect(db_file, timeout=busy_timeout, check_same_thread=False, isolation_level=None)
+        self._db.execute('PRAGMA journal_mode=WAL')
+        self._db.execute('PRAGMA synchronous=NORMAL')
+        self._db.execute('CREATE TABLE IF NOT EXISTS contacts (account TEXT NOT NULL, phone_number INTEGER NOT NULL, '
+                         'hash TEXT NOT NULL, contact TEXT NOT NULL, PRIMARY KEY (account, phone_number))')
+
+    def delta(self, contacts: Iterable[dict], account: Union[str, int]) -> Tuple[List[dict], List[dict], dict]:
+        """
+        Compute the changes between the contacts and the snapshot of the account, without sending them.
+
+        :param contacts: The full address book: dicts with ``name``, ``phone_number`` and optional ``country_code`` and ``date_of_birth`` (See :py:func:`~meapi.Me.add_contacts`).
+        :type contacts: Iterable[dict]
+        :param account: The account of the snapshot (Phone number of the Me account).
+        :type account: Union[str, int]
+        :return: Tuple of: contacts to add (New and changed), contacts to remove, and a dict with ``unchanged`` and ``skipped`` counts.
+        :rtype: Tuple[List[dict], List[dict], dict]
+        """
+        current: Dict[int, Tuple[str, dict]] = {}
+        skipped = 0
+        for contact in contacts:
+            phone_number = _clean_phone_number(contact.get('phone_number')) if isinstance(contact, dict) else None
+            if phone_number is None or not contact.get('name'):
+                skipped += 1
+                continue
+            if phone_number in current:
+                skipped += 1
+                continue
+            contact = {**contact, 'phone_number': phone_number}
+            current[phone_number] = (_contact_hash(contact), contact)
+        with self._lock:
+            snapshot = dict(self._db.execute('SELECT phone_number, hash FROM contacts WHERE account = ?', (str(account),)))
+        add = [contact for phone_number, (contact_hash, contact) in current.items() if snapshot.get(phone_number) != contact_hash]
+        removed_numbers = [phone_number for phone_number in snapshot if phone_number not in current]
+        remove = []
+        with self._lock:
+            for start in range(0, len(removed_numbers), 500):  # SQLite limits the count of query parameters.
+                numbers = removed_numbers[start:start + 500]
+                remove.extend(loads(row[0]) for row in self._db.execute(
+                    f"SELECT contact FROM contacts WHERE account = ? AND phone_number IN ({', '.join('?' * len(numbers))})",
+                    (str(account), *numbers)))
+        return add, remove, {'unchanged': len(current) - len(add), 'skipped': skipped}
+
+    def sync(self, me, contacts: Iterable[dict], account: Union[str, int, None] = None) -> dict:
+        """
+        Send the changes of the address book since the last sync, in one request.
+
+        :param me: The client.
+        :type me: Me
+        :param contacts: The full address book, see :py:func:`delta`.
+        :type contacts: Iterable[dict]
+        :param account: The account of the snapshot. Default: ``None`` (The phone number of ``me``, or its uuid in access-token mode).
+        :type account: Union[str, int, None]
+        :return: Dict with ``added``, ``removed``, ``unchanged`` and ``skipped`` counts, and the ``response`` of the server (``None`` if nothing changed).
+        :rtype: dict
+        """
+        if account is None:
+            account = me.phone_number or me.uuid or me.get_uuid()
+        account = self._account(account)
+        add, remove, counts = self.delta(contacts, account)
+        response = None
+        if add or remove:
+            response = me.make_request('post', _CONTACTS_SYNC, {"add": add, "is_first": False, "remove": remove})
+            self.commit(account, add, remove)
+        return {'added': len(add), 'removed': len(remove), **counts, 'response': response}
+
+    async def sync_async(self, me, contacts: Iterable[dict], account: Union[str, int, None] = None) -> dict:
+        """
+        :py:func:`sync` for :py:class:`~meapi.AsyncMe`.
+        """
+        if account is None:
+            account = me.phone_number or me.uuid or await me.get_uuid()
+        account = self._account(account)
+        add, remove, counts = self.delta(contacts, account)
+        response = None
+        if add or remove:
+            response = await me.make_request('post', _CONTACTS_SYNC, {"add": add, "is_first": False, "remove": remove})
+            self.commit(account, add, remove)
+        return {'added': len(add), 'removed': len(remove), **counts, 'response': response}
+
+    def commit(self, account: Union[str, int], add: List[dict], remove: List[dict]):
+        """
+        Save in the snapshot that contacts were added and removed (Called by :py:func:`sync` after the server accepted them).
+
+        :param account: The account of the snapshot.
+        :type account: Union[str, int]
+        :param add: Added contacts, with normalized phone numbers.
+        :type add: List[dict]
+        :param remove: Removed contacts.
+        :type remove: List[dict]
+        """
+        account = str(account)
+        with self._lock:
+            self._db.execute('BEGIN')
+            try:
+                self._db.executemany('DELETE FROM contacts WHERE account = ? AND phone_number = ?',
+                                     [(account, contact['phone_number']) for contact in remove])
+                self._db.executemany('INSERT OR REPLACE INTO contacts (account, phone_number, hash, contact) VALUES (?, ?, ?, ?)',
+                                     [(account, contact['phone_number'], _contact_hash(contact), dumps(contact, default=str))
+                                      for contact in add])
+                self._db.execute('COMMIT')
+            except BaseException:
+                self._db.execute('ROLLBACK')
+                raise
+
+    def count(self, account: Union[str, int]) -> int:
+        """
+        Count of contacts in the snapshot of the account.
+
+        :rtype: int
+        """
+        with self._lock:
+            return self._db.execute('SELECT COUNT(*) FROM contacts WHERE account = ?', (str(account),)).fetchone()[0]
+
+    def reset(self, account: Union[str, int, None] = None):
+        """
+        Remove the snapshot of the account (All the accounts if ``None``), so the next sync sends the whole address book.
+        """
+        with self._lock:
+            if account is None:
+                self._db.execute('DELETE FROM contacts')
+            else:
+                self._db.execute('DELETE FROM contacts WHERE account = ?', (str(account),))
+
+    def close(self):
+        """
+        Close the database connection.
+        """
+        with self._lock:
+            self._db.close()
+
+    @staticmethod
+    def _account(account: Union[str, int, None]) -> str:
+        # Never a shared default: accounts that share a snapshot would see the contacts of each other as unchanged.
+        if not account:
+            raise MeException("The account of the contacts snapshot is unknown, pass it as account.")
+        return str(account)
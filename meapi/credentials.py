@@ -0,0 +1,196 @@
+from copy import deepcopy
+from json import load, loads, dump, dumps, JSONDecodeError
+from os import path, replace, remove, stat, fsync
+from sqlite3 import connect
+from tempfile import NamedTemporaryFile
+from threading import Lock
+from typing import Dict, Tuple, Union
+from meapi.exceptions import MeException
+from meapi.filelock import get_file_lock
+
+# Parsed content of each credentials file in this process, by path: (mtime_ns, size), content.
+_files_cache: Dict[str, Tuple[Tuple[int, int], dict]] = {}
+_files_cache_lock = Lock()
+
+
+class CredentialStore:
+    """
+    Base class for credentials stores. Credentials of an account are a dict with ``access``, ``refresh``, ``pwd_token`` and ``uuid``, by phone number.
+
+    - Subclass it and implement :py:func:`get`, :py:func:`set` and :py:func:`delete` to keep the credentials anywhere else.
+    - ``lock_path`` is the base path of the lock files that make the token refresh single-flight between processes.
+      ``None`` for stores that are not shared between processes: the refresh is single-flight in this process only, without lock files.
+    """
+    lock_path: Union[str, None] = 'config.json'
+
+    def get(self, phone_number: Union[int, str]) -> Union[dict, None]:
+        """
+        Get the credentials of an account.
+
+        :param phone_number: Phone number of the account.
+        :type phone_number: Union[int, str]
+        :return: Dict with ``access``, ``refresh``, ``pwd_token`` and ``uuid``, or ``None`` if not exists.
+        :rtype: Union[dict, None]
+        """
+        raise NotImplementedError
+
+    def set(self, phone_number: Union[int, str], data: dict):
+        """
+        Save the credentials of an account.
+
+        :param phone_number: Phone number of the account.
+        :type phone_number: Union[int, str]
+        :param data: Dict with ``access``, ``refresh``, ``pwd_token`` and ``uuid``.
+        :type data: dict
+        """
+        raise NotImplementedError
+
+    def delete(self, phone_number: Union[int, str]):
+        """
+        Remove the credentials of an account.
+
+        :param phone_number: Phone number of the account.
+        :type phone_number: Union[int, str]
+        """
+        raise NotImplementedError
+
+
+def _file_version(file_stat) -> tuple:
+    # The atomic replace creates a new inode, so a rewrite is noticed even with the same size inside one mtime tick.
+    return file_stat.st_ino, file_stat.st_mtime_ns, file_stat.st_size
+
+
+class JsonCredentialStore(CredentialStore):
+    """
+    Credentials of accounts in a json file. This is the default store, see `Credentials <https://meapi.readthedocs.io/en/latest/setup.html#unofficial-method>`_.
+
+    - The file is parsed once and kept in memory. It is parsed again only if it was changed on disk (By another process).
+    - Writes are atomic (Temp file and rename), under a lock file, and only replace the changed account,
+      so accounts written by other processes are kept.
+
+    :param config_file: Path to credentials json file. Default: ``config.json``.
+    :type config_file: str
+    """
+    def __init__(self, config_file: str = 'config.json'):
+        self.config_file = config_file
+        self.lock_path = config_file
+        self._path = path.abspath(config_file)
+
+    def get(self, phone_number: Union[int, str]) -> Union[dict, None]:
+        account = self._load().get(str(phone_number))
+        return deepcopy(account) if account else None
+
+    def set(self, phone_number: Union[int, str], data: dict):
+        with get_file_lock(self._path + '.lock'):
+            content = dict(self._load())
+            content[str(phone_number)] = deepcopy(data)
+            self._write(content)
+
+    def delete(self, phone_number: Union[int, str]):
+        with get_file_lock(self._path + '.lock'):
+            content = dict(self._load())
+            if content.pop(str(phone_number), None) is not None:
+                self._write(content)
+
+    def _load(self) -> dict:
+        try:
+            file_stat = stat(self._path)
+        except FileNotFoundError:
+            return {}
+        version = _file_version(file_stat)
+        with _files_cache_lock:
+            cached = _files_cache.get(self._path)
+        if cached and cached[0] == version:
+            return cached[1]
+        with open(self._path, 'r') as config_file:
+            try:
+                content = load(config_file) if file_stat.st_size else {}
+            except JSONDecodeError:
+                raise MeException("Not a valid json file: " + self.config_file)
+        with _files_cache_lock:
+            _files_cache[self._path] = (version, content)
+        return content
+
+    def _write(self, content: dict):
+        with NamedTemporaryFile('w', dir=path.dirname(self._path), prefix=path.basename(self._path) + '.',
+                                suffix='.tmp', delete=False) as tmp_file:
+            try:
+                dump(content, tmp_file, indent=4, sort_keys=True)
+                tmp_file.flush()
+                fsync(tmp_file.fileno())
+            except BaseException:
+                tmp_file.close()
+                remove(tmp_file.name)
+                raise
+        replace(tmp_file.name, self._path)
+        file_stat = stat(self._path)
+        with _files_cache_lock:
+            _files_cache[self._path] = (_file_version(file_stat), content)
+
+
+class SQLiteCredentialStore(CredentialStore):
+    """
+    Credentials of accounts in a SQLite database, for many accounts on one host.
+
+    - Each account is a row, so a token update writes only that row.
+    - The database runs in WAL mode, so several processes can share one file.
+
+    :param db_file: Path to the SQLite database file. Default: ``meapi_credentials.db``.
+    :type db_file: str
+    :param busy_timeout: Seconds to wait for a lock held by another process. Default: ``10``.
+    :type busy_timeout: float
+    """
+    def __init__(self, db_file: str = 'meapi_credentials.db', busy_timeout: float = 10):
+        self.db_file = db_file
+        self.lock_path = db_file
+        self._lock = Lock()
+        self._db = connect(db_file, timeout=busy_timeout, check_same_thread=False, isolation_level=None)
+        self._db.execute('PRAGMA journal_mode=WAL')
+        self._db.execute('CREATE TABLE IF NOT EXISTS credentials (phone_number TEXT PRIMARY KEY, data TEXT NOT NULL)')
+
+    def get(self, phone_number: Union[int, str]) -> Union[dict, None]:
+        with self._lock:
+            row = self._db.execute('SELECT data FROM credentials WHERE phone_number = ?', (str(phone_number),)).fetchone()
+        return loads(row[0]) if row else None
+
+    def set(self, phone_number: Union[int, str], data: dict):
+        with self._lock:
+            self._db.execute('INSERT OR REPLACE INTO credentials (phone_number, data) VALUES (?, ?)',
+                             (str(phone_number), dumps(data)))
+
+    def delete(self, phone_number: Union[int, str]):
+        with self._lock:
+            self._db.execute('DELETE FROM credentials WHERE phone_number = ?', (str(phone_number),))
+
+    def close(self):
+        """
+        Close the database connection.
+        """
+        with self._lock:
+            self._db.close()
+
+
+class MemoryCredentialStore(CredentialStore):
+    """
+    Credentials of accounts in memory only, for short-lived processes and tests. Nothing is written to disk.
+
+    :param credentials: Initial credentials by phone number. Default: ``None``.
+    :type credentials: Union[dict, None]
+    """
+    def __init__(self, credentials: Union[dict, None] = None):
+        self._lock = Lock()
+        self._credentials = {str(phone_number): deepcopy(data) for phone_number, data in (credentials or {}).items()}
+        self.lock_path = None
+
+    def get(self, phone_number: Union[int, str]) -> Union[dict, None]:
+        with self._lock:
+            data = self._credentials.get(str(phone_number))
+            return deepcopy(data) if data else None
+
+    def set(self, phone_number: Union[int, str], data: dict):
+        with self._lock:
+            self._credentials[str(phone_number)] = deepcopy(data)
+
+    def delete(self, phone_number: Union[int, str]):
+        with self._lock:
+            self._credentials.pop(str(phone_number), None)
@@ -8,6 +8,10 @@ class MeApiException(Exception):
     :type msg: str
     :param reason: Human reason to the error.
     :type reason: str
+    :param attempts: How many times the request was sent, including retries. See :py:class:`~meapi.RetryPolicy`.
+    :type attempts: int
+    :param waited: Total seconds spent waiting between the attempts.
+    :type waited: float
 
     **Expected msg's:**
 
@@ -16,12 +20,17 @@ class MeApiException(Exception):
     - ``api_search_passed_limit`` in :py:func:`~meapi.Me.phone_search`.
     - ``api_profile_view_passed_limit`` in :py:func:`~meapi.Me.get_profile_info`.
     """
-    def __init__(self, http_status: int, msg: str, reason: str = None):
+    def __init__(self, http_status: int, msg: str, reason: str = None, attempts: int = 1, waited: float = 0.0):
         self.http_status = http_status
         self.msg = msg
         self.reason = reason
+        self.attempts = attempts
+        self.waited = waited
 
     def __str__(self):
+        if self.attempts > 1:
+            return f'http status: {self.http_status}, msg: {self.msg}, reason: {self.reason}, ' \
+                   f'attempts: {self.attempts}, waited: {round(self.waited, 2)}s'
         return f'http status: {self.http_status}, msg: {self.msg}, reason: {self.reason}'
 
 
@@ -37,3 +46,52 @@ class MeException(Exception):
 
     def __str__(self):
         return self.msg
+
+
+class MeDeadlineException(MeException):
+    """
+    Raise this exception when a call did not finish before its deadline. See :py:func:`~meapi.Me.deadline`.
+
+    :param msg: Reason of the exception.
+    :type msg: str
+    """
+
+
+class MeConnectionException(MeException):
+    """
+    Raise this exception when a request failed to connect or timed out, after the retries of :py:class:`~meapi.RetryPolicy`.
+    The error of the transport is chained as ``__cause__``.
+
+    :param msg: Reason of the exception.
+    :type msg: str
+    :param attempts: How many times the request was sent, including retries.
+    :type attempts: int
+    :param waited: Total seconds spent waiting between the attempts.
+    :type waited: float
+    """
+    def __init__(self, msg: str, attempts: int = 1, waited: float = 0.0):
+        super().__init__(msg)
+        self.attempts = attempts
+        self.waited = waited
+
+    def __str__(self):
+        if self.attempts > 1:
+            return f'{self.msg}, attempts: {self.attempts}, waited: {round(self.waited, 2)}s'
+        return self.msg
+
+
+class MeQuotaException(MeException):
+    """
+    Raise this exception when the local quota of a method passed the limit. See :py:class:`~meapi.QuotaTracker`.
+
+    :param msg: Reason of the exception.
+    :type msg: str
+    :param name: Method name: ``phone_search`` or ``get_profile_info``.
+    :type name: str
+    :param retry_after: Seconds until the next call is allowed.
+    :type retry_after: float
+    """
+    def __init__(self, msg: str, name: str = None, retry_after: float = None):
+        super().__init__(msg)
+        self.name = name
+        self.retry_after = retry_after
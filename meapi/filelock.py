@@ -0,0 +1,124 @@
+from os import path
+from threading import Lock, RLock
+from time import sleep
+from weakref import WeakValueDictionary
+
+try:
+    from fcntl import flock, LOCK_EX, LOCK_NB, LOCK_UN
+    msvcrt = None
+except ImportError:  # Windows
+    import msvcrt
+    flock = None
+
+
+def _lock(file, blocking: bool) -> bool:
+    try:
+        if flock is not None:
+            flock(file.fileno(), LOCK_EX if blocking else LOCK_EX | LOCK_NB)
+        else:
+            file.seek(0)
+            while True:
+                try:
+                    msvcrt.locking(file.fileno(), msvcrt.LK_NBLCK, 1)
+                    break
+                except OSError:
+                    if not blocking:
+                        raise
+                    sleep(0.05)
+        return True
+    except (BlockingIOError, PermissionError, OSError):
+        if blocking:
+            raise
+        return False
+
+
+def _unlock(file):
+    if flock is not None:
+        flock(file.fileno(), LOCK_UN)
+    else:
+        file.seek(0)
+        msvcrt.locking(file.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+class FileLock:
+    """
+    Exclusive lock between threads and processes, held on a lock file.
+
+    - Re-entrant in the thread that holds it.
+    - Use :py:func:`get_file_lock` to get the shared instance of a path, so all the threads of the process use the same lock.
+
+    :param lock_file: Path to the lock file. Created if not exists.
+    :type lock_file: str
+    """
+    def __init__(self, lock_file: str):
+        self.lock_file = lock_file
+        self._thread_lock = RLock()
+        self._file = None
+        self._depth = 0
+
+    def acquire(self, blocking: bool = True) -> bool:
+        """
+        Acquire the lock.
+
+        :param blocking: Wait until the lock is free. Default: ``True``.
+        :type blocking: bool
+        :return: Is the lock acquired.
+        :rtype: bool
+        """
+        if not self._thread_lock.acquire(blocking):
+            return False
+        if self._depth == 0:
+            file = open(self.lock_file, 'a+')
+            try:
+                locked = _lock(file, blocking)
+            except BaseException:
+                file.close()
+                self._thread_lock.release()
+                raise
+            if not locked:
+                file.close()
+                self._thread_lock.release()
+                return False
+            self._file = file
+        self._depth += 1
+        return True
+
+    def release(self):
+        """
+        Release the lock.
+        """
+        self._depth -= 1
+        if self._depth == 0:
+            _unlock(self._file)
+            self._file.close()
+            self._file = None
+        self._thread_lock.release()
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.release()
+
+
+# Only the locks in use are kept: a lock is dropped when no one holds a reference to it (And so it is not held or waited on).
+_locks: 'WeakValueDictionary[str, FileLock]' = WeakValueDictionary()
+_locks_lock = Lock()
+
+
+def get_file_lock(lock_file: str) -> FileLock:
+    """
+    Get the shared :py:class:`FileLock` of a path in this process.
+
+    :param lock_file: Path to the lock file.
+    :type lock_file: str
+    :return: The lock.
+    :rtype: FileLock
+    """
+    lock_file = path.abspath(lock_file)
+    with _locks_lock:
+        lock = _locks.get(lock_file)
+        if lock is None:
+            lock = _locks[lock_file] = FileLock(lock_file)
+        return lock
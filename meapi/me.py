@@ -1,14 +1,21 @@
-from re import match
-from typing import Union
+from typing import Callable, Dict, List, Union
 from meapi.account import Account
 from meapi.auth import Auth
-from meapi.exceptions import MeException
-from meapi.notifications import Notifications
+from meapi.notifications import Notifications, _ReadCoalescer
+from meapi.cache import ResponseCache
+from meapi.credentials import CredentialStore
+from meapi.metrics import Metrics
+from meapi.quota import QuotaTracker
+from meapi.retry import RetryPolicy
+from meapi.tracing import Tracer, trace_methods
 from meapi.settings import Settings
 from meapi.social import Social
-from meapi.util import Util
+from requests import Session
+from meapi.transport import Transport, RequestsTransport
+from meapi.util import Util, _setup_hooks
 
 
+@trace_methods
 class Me(Auth, Account, Social, Settings, Notifications, Util):
     """
     Create a new instance to interact with MeAPI. **See** `Authentication <https://meapi.readthedocs.io/en/latest/setup.html#authentication>`_ **for more information.**
@@ -21,8 +28,38 @@ class Me(Auth, Account, Social, Settings, Notifications, Util):
     :type access_token: Union[str, None]
     :param config_file: Path to credentials json file. Default: ``config.json``.
     :type config_file: Union[str, None]
+    :param credential_store: Where to keep the credentials, see :py:class:`~meapi.CredentialStore`. Default: ``None`` (:py:class:`~meapi.JsonCredentialStore` of ``config_file``).
+    :type credential_store: Union[CredentialStore, None]
     :param proxies: Dict with proxy configuration. Default: ``None``.
     :type proxies: dict
+    :param session: Shared keep-alive session, see :py:func:`~meapi.util.create_session`. Default: ``None`` (New session for this instance).
+    :type session: Union[requests.Session, None]
+    :param pool_connections: Number of hosts to keep connection pools for, when creating a new session. Default: ``10``.
+    :type pool_connections: int
+    :param pool_maxsize: Max connections to keep open for each host, when creating a new session. Default: ``10``.
+    :type pool_maxsize: int
+    :param retry_policy: Retry policy for transient failures. Default: ``None`` (:py:class:`~meapi.RetryPolicy` defaults).
+    :type retry_policy: Union[RetryPolicy, None]
+    :param connect_timeout: Seconds to wait for a connection to the server. ``None`` to wait forever. Default: ``10``.
+    :type connect_timeout: Union[float, None]
+    :param read_timeout: Seconds to wait for the server between bytes of the response. ``None`` to wait forever. Default: ``30``.
+    :type read_timeout: Union[float, None]
+    :param quota: Client-side quota tracker for searches and profile views. Default: ``None`` (No local quota).
+    :type quota: Union[QuotaTracker, None]
+    :param cache: Cache for searches and profiles. Default: ``None`` (No cache).
+    :type cache: Union[ResponseCache, None]
+    :param metrics: Record metrics of the requests, see :py:class:`~meapi.Metrics`. Default: ``None`` (No metrics).
+    :type metrics: Union[Metrics, None]
+    :param refresh_margin: Refresh the access token in the background this many seconds before it expires. ``None`` to refresh only after the server rejects it. Default: ``60``.
+    :type refresh_margin: Union[float, None]
+    :param lazy: Do not authenticate on construction, only on the first request that needs it (No network I/O or prompt in ``Me()``). Default: ``False``.
+    :type lazy: bool
+    :param transport: Send the requests through this transport instead of ``requests``, see :py:class:`~meapi.transport.Transport`. ``proxies``, ``session`` and the pool arguments are ignored. Default: ``None``.
+    :type transport: Union[Transport, None]
+    :param hooks: Functions to run on every request attempt, by event: ``before_request`` and ``after_response`` (See :py:func:`make_request`). Can be changed later in ``me.hooks``. Default: ``None``.
+    :type hooks: Union[Dict[str, Union[Callable, List[Callable]]], None]
+    :param tracer: Trace the methods and their requests, see :py:class:`~meapi.Tracer`. Default: ``None`` (No tracing).
+    :type tracer: Union[Tracer, None]
     :param account_details: You can provide all login details can be provided in dict format, designed for cases of new account registration without the need for a prompt. Default: ``None``
     :type account_details: dict
 
@@ -43,38 +80,55 @@ class Me(Auth, Account, Social, Settings, Notifications, Util):
                  access_token: Union[str, None] = None,
                  account_details: dict = None,
                  config_file: Union[str, None] = 'config.json',
-                 proxies: dict = None):
-        if config_file.endswith(".json"):
-            self.config_file = config_file
-        else:
-            print("Not a valid config json file. Using default 'config.json' file.")
-            self.config_file = 'config.json'
+                 credential_store: Union[CredentialStore, None] = None,
+                 proxies: dict = None,
+                 session: Union[Session, None] = None,
+                 pool_connections: int = 10,
+                 pool_maxsize: int = 10,
+                 retry_policy: Union[RetryPolicy, None] = None,
+                 connect_timeout: Union[float, None] = 10,
+                 read_timeout: Union[float, None] = 30,
+                 quota: Union[QuotaTracker, None] = None,
+                 cache: Union[ResponseCache, None] = None,
+                 refresh_margin: Union[float, None] = 60,
+                 lazy: bool = False,
+                 transport: Union[Transport, None] = None,
+                 metrics: Union[Metrics, None] = None,
+                 hooks: Union[Dict[str, Union[Callable, List[Callable]]], None] = None,
+                 tracer: Union[Tracer, None] = None):
+        self.tracer = tracer
+        self.hooks = _setup_hooks(hooks)
+        self.refresh_margin = refresh_margin
+        self._refresh_timer = None
+        self._setup_credentials(phone_number=phone_number, activation_code=activation_code,
+                                access_token=access_token, account_details=account_details, config_file=config_file,
+                                credential_store=credential_store)
+        self.proxies = proxies
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.quota = quota
+        self.cache = cache
+        self.metrics = metrics
+        self._read_coalescer = _ReadCoalescer()
+        self._own_transport = transport is None
+        self.transport = transport or RequestsTransport(session=session, proxies=proxies, pool_connections=pool_connections,
+                                                        pool_maxsize=pool_maxsize)
 
-        if not access_token and not phone_number and not account_details:
-            raise MeException("You need to provide phone number, account details or access token!")
-        if access_token and phone_number:
-            raise MeException("Access-token mode does not accept phone number, just access token.")
-        if account_details and (phone_number or access_token):
-            raise MeException("No need to provide phone number or access token if account_detail provided.")
+        if not lazy:
+            self._login()
 
-        if account_details:
-            if not isinstance(account_details, dict):
-                raise MeException("Account details must be data dict. ")
-            if account_details.get('phone_number') and account_details.get('activation_code'):
-                phone_number = account_details['phone_number']
-                if match(r'^\d{6}$', str(account_details['activation_code'])):
-                    activation_code = account_details['activation_code']
-                else:
-                    raise MeException("Not a valid 6-digits activation code!")
+    def close(self):
+        """
+        Close the connection pool of this instance and stop the background token refresh. A session or a transport that was passed in is not closed.
+        """
+        if self._refresh_timer is not None:
+            self._refresh_timer.cancel()
+        if self._own_transport:
+            self.transport.close()
 
-        self.phone_number = self.valid_phone_number(phone_number) if phone_number else phone_number
-        self.activation_code = activation_code
-        self.access_token = access_token
-        self.account_details = account_details
-        self.uuid = None
-        self.proxies = proxies
+    def __enter__(self):
+        return self
 
-        if not self.access_token:
-            auth_data = self.credentials_manager()
-            if auth_data:
-                self.access_token = auth_data['access']
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
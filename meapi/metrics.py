@@ -0,0 +1,263 @@
+from bisect import bisect_left
+from functools import lru_cache
+from os import path, replace
+from re import compile as re_compile
+from tempfile import NamedTemporaryFile
+from threading import Lock
+from time import monotonic
+from typing import Callable, Dict, List, Sequence, Tuple, Union
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+_uuid_re = re_compile(r'^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$')
+
+
+@lru_cache(maxsize=1024)
+def endpoint_template(endpoint: str) -> str:
+    """
+    Get the template of an endpoint, to group the metrics of its calls: the query string is removed,
+    uuids are replaced with ``{uuid}`` and numbers with ``{id}``.
+     - ``/main/users/profile/8a0c...b597`` --> ``/main/users/profile/{uuid}``.
+     - ``/main/contacts/search/?phone_number=972123456789`` --> ``/main/contacts/search/``.
+
+    :param endpoint: api endpoint.
+    :type endpoint: str
+    :rtype: str
+    """
+    parts = endpoint.split('?', 1)[0].split('/')
+    return '/'.join('{uuid}' if _uuid_re.match(part) else '{id}' if part.isdigit() else part for part in parts)
+
+
+class RequestMetric:
+    """
+    Metrics of one :py:func:`~meapi.Me.make_request` call (With all its retries and token refreshes).
+
+    - ``endpoint``: The endpoint template, see :py:func:`endpoint_template`.
+    - ``method``: HTTP request type.
+    - ``status``: HTTP status of the last response, ``None`` if no response was received.
+    - ``error``: ``None`` on success, else the status (``'502'``) or the exception name (``'ConnectionError'``).
+    - ``duration``: Seconds of the whole call. ``attempts``, ``retries`` and ``token_refreshes`` counts.
+    - ``bytes_out`` / ``bytes_in``: Bytes of the request bodies sent / response bodies received, in all attempts.
+    """
+    __slots__ = ('endpoint', 'method', 'status', 'error', 'duration', 'attempts', 'retries', 'token_refreshes',
+                 'bytes_out', 'bytes_in')
+
+    def __init__(self, endpoint: str, method: str, status: Union[int, None], error: Union[str, None], duration: float,
+                 attempts: int, retries: int, token_refreshes: int, bytes_out: int, bytes_in: int):
+        self.endpoint = endpoint
+        self.method = method
+        self.status = status
+        self.error = error
+        self.duration = duration
+        self.attempts = attempts
+        self.retries = retries
+        self.token_refreshes = token_refreshes
+        self.bytes_out = bytes_out
+        self.bytes_in = bytes_in
+
+    def __repr__(self):
+        return f"<RequestMetric {self.method.upper()} {self.endpoint} status={self.status} duration={round(self.duration, 4)}s>"
+
+
+class MemorySink:
+    """
+    Keep aggregated metrics in memory, by endpoint template and method.
+
+    :param buckets: Upper bounds (Seconds) of the latency histogram buckets. Default: ``DEFAULT_BUCKETS`` (5ms to 10s).
+    :type buckets: Sequence[float]
+    """
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self._lock = Lock()
+        self._endpoints: Dict[Tuple[str, str], dict] = {}
+
+    def record(self, metric: RequestMetric):
+        with self._lock:
+            stats = self._endpoints.get((metric.endpoint, metric.method))
+            if stats is None:
+                stats = self._endpoints[(metric.endpoint, metric.method)] = {
+                    'count': 0, 'duration_sum': 0.0, 'buckets': [0] * (len(self.buckets) + 1), 'bytes_out': 0,
+                    'bytes_in': 0, 'retries': 0, 'token_refreshes': 0, 'errors': {}}
+            stats['count'] += 1
+            stats['duration_sum'] += metric.duration
+            stats['buckets'][bisect_left(self.buckets, metric.duration)] += 1
+            stats['bytes_out'] += metric.bytes_out
+            stats['bytes_in'] += metric.bytes_in
+            stats['retries'] += metric.retries
+            stats['token_refreshes'] += metric.token_refreshes
+            if metric.error is not None:
+                stats['errors'][metric.error] = stats['errors'].get(metric.error, 0) + 1
+
+    def snapshot(self) -> Dict[str, dict]:
+        """
+        Get the aggregated metrics.
+
+        :return: Dict by ``'METHOD endpoint'`` of dicts with ``count``, ``duration_sum``, ``buckets`` (Cumulative
+            counts by upper bound, ``'+Inf'`` last), ``bytes_out``, ``bytes_in``, ``retries``, ``token_refreshes`` and ``errors`` (Counts by status / exception name).
+        :rtype: Dict[str, dict]
+
+        Example::
+
+            {
+                "GET /main/users/profile/{uuid}": {
+                    "count": 3,
+                    "duration_sum": 0.412,
+                    "buckets": {"0.005": 0, "0.01": 0, ..., "0.25": 3, ..., "+Inf": 3},
+                    "bytes_out": 0,
+                    "bytes_in": 10311,
+                    "retries": 1,
+                    "token_refreshes": 0,
+                    "errors": {"404": 1}
+                }
+            }
+        """
+        with self._lock:
+            snapshot = {}
+            for (endpoint, method), stats in self._endpoints.items():
+                cumulative, buckets = 0, {}
+                for bound, count in zip([*map(str, self.buckets), '+Inf'], stats['buckets']):
+                    cumulative += count
+                    buckets[bound] = cumulative
+                snapshot[f"{method.upper()} {endpoint}"] = {**stats, 'buckets': buckets, 'errors': dict(stats['errors'])}
+            return snapshot
+
+    def reset(self):
+        """
+        Remove all the metrics.
+        """
+        with self._lock:
+            self._endpoints.clear()
+
+
+class PrometheusFileSink(MemorySink):
+    """
+    Write the aggregated metrics to a file in the Prometheus text exposition format, for the node exporter textfile collector.
+
+    - The file is replaced atomically, at most once in ``interval`` seconds (And on :py:func:`flush`).
+
+    :param metrics_file: Path of the file (Should end with ``.prom``).
+    :type metrics_file: str
+    :param interval: Min seconds between writes. Default: ``10``.
+    :type interval: float
+    :param buckets: Upper bounds (Seconds) of the latency histogram buckets. Default: ``DEFAULT_BUCKETS``.
+    :type buckets: Sequence[float]
+    """
+    def __init__(self, metrics_file: str, interval: float = 10, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(buckets)
+        self.metrics_file = metrics_file
+        self.interval = interval
+        self._written_at = None
+
+    def record(self, metric: RequestMetric):
+        super().record(metric)
+        if self._written_at is None or monotonic() - self._written_at >= self.interval:
+            self.flush()
+
+    def flush(self):
+        """
+        Write the metrics to the file now.
+        """
+        self._written_at = monotonic()
+        content = self.exposition()
+        directory = path.dirname(path.abspath(self.metrics_file))
+        with NamedTemporaryFile('w', dir=directory, prefix=path.basename(self.metrics_file) + '.', suffix='.tmp',
+                                delete=False) as tmp_file:
+            tmp_file.write(content)
+        replace(tmp_file.name, self.metrics_file)
+
+    def exposition(self) -> str:
+        """
+        Get the metrics in the Prometheus text exposition format.
+
+        :rtype: str
+        """
+        snapshot = self.snapshot()
+        lines = []
+
+        def add(name: str, kind: str, help_text: str, samples: List[Tuple[str, dict, float]]):
+            lines.extend((f"# HELP {name} {help_text}", f"# TYPE {name} {kind}"))
+            for sample_name, labels, value in samples:
+                label_text = ','.join(f'{key}="{value}"' for key, value in labels.items())
+                lines.append(f"{sample_name}{{{label_text}}} {value}")
+
+        def labels(key: str, **extra) -> dict:
+            method, endpoint = key.split(' ', 1)
+            return {'endpoint': endpoint, 'method': method.lower(), **extra}
+
+        add('meapi_requests_total', 'counter', 'Calls of make_request.',
+            [('meapi_requests_total', labels(key), stats['count']) for key, stats in snapshot.items()])
+        histogram = []
+        for key, stats in snapshot.items():
+            histogram.extend(('meapi_request_duration_seconds_bucket', labels(key, le=bound), count)
+                             for bound, count in stats['buckets'].items())
+            histogram.append(('meapi_request_duration_seconds_sum', labels(key), stats['duration_sum']))
+            histogram.append(('meapi_request_duration_seconds_count', labels(key), stats['count']))
+        add('meapi_request_duration_seconds', 'histogram', 'Duration of make_request calls, with retries.', histogram)
+        add('meapi_request_bytes_total', 'counter', 'Bytes of request bodies sent.',
+            [('meapi_request_bytes_total', labels(key), stats['bytes_out']) for key, stats in snapshot.items()])
+        add('meapi_response_bytes_total', 'counter', 'Bytes of response bodies received.',
+            [('meapi_response_bytes_total', labels(key), stats['bytes_in']) for key, stats in snapshot.items()])
+        add('meapi_retries_total', 'counter', 'Retries of failed attempts.',
+            [('meapi_retries_total', labels(key), stats['retries']) for key, stats in snapshot.items()])
+        add('meapi_token_refreshes_total', 'counter', 'Access token refreshes after 403.',
+            [('meapi_token_refreshes_total', labels(key), stats['token_refreshes']) for key, stats in snapshot.items()])
+        add('meapi_errors_total', 'counter', 'Failed calls by HTTP status or exception name.',
+            [('meapi_errors_total', labels(key, error=error), count)
+             for key, stats in snapshot.items() for error, count in stats['errors'].items()])
+        return '\n'.join(lines) + '\n'
+
+
+class CallbackSink:
+    """
+    Pass the metrics of each call to a function.
+
+    - The callback runs in the thread (Or event loop) of the call, so it should be fast.
+
+    :param callback: Function that gets a :py:class:`RequestMetric`.
+    :type callback: Callable[[RequestMetric], None]
+    """
+    def __init__(self, callback: Callable[[RequestMetric], None]):
+        self.callback = callback
+
+    def record(self, metric: RequestMetric):
+        self.callback(metric)
+
+
+class Metrics:
+    """
+    Record metrics of the requests of :py:class:`~meapi.Me` (See ``metrics`` in :py:class:`~meapi.Me`) by endpoint template:
+    count, latency histogram, bytes in and out, retries, token refreshes and errors by status.
+
+    - Sinks get each :py:class:`RequestMetric`: :py:class:`MemorySink`, :py:class:`PrometheusFileSink`, :py:class:`CallbackSink` or any object with a ``record`` method.
+    - Without ``metrics`` nothing is measured.
+    - One instance can be shared between several clients.
+
+    :param sinks: Sinks of the metrics. Default: ``None`` (One :py:class:`MemorySink`).
+    :type sinks: Union[List[object], None]
+
+    Example::
+
+        metrics = Metrics([MemorySink(), PrometheusFileSink('/var/lib/node_exporter/meapi.prom')])
+        me = Me(phone_number=972123456789, metrics=metrics)
+        me.phone_search(972987654321)
+        print(metrics.sinks[0].snapshot())
+    """
+    def __init__(self, sinks: Union[List[object], None] = None):
+        self.sinks = list(sinks) if sinks is not None else [MemorySink()]
+
+    def record(self, metric: RequestMetric):
+        for sink in self.sinks:
+            try:
+                sink.record(metric)
+            except Exception as err:  # A broken sink must not fail the call.
+                print(f"Failed to record metrics in {type(sink).__name__}: {err}")
+
+    def snapshot(self) -> Dict[str, dict]:
+        """
+        Get the aggregated metrics of the first :py:class:`MemorySink` (See :py:func:`MemorySink.snapshot`). Empty if there is none.
+
+        :rtype: Dict[str, dict]
+        """
+        for sink in self.sinks:
+            if isinstance(sink, MemorySink):
+                return sink.snapshot()
+        return {}
@@ -0,0 +1,266 @@
+from datetime import datetime
+from json import dumps, loads
+from sqlite3 import connect
+from threading import Lock
+from typing import Iterable, List, Tuple, Union
+from meapi.notifications import notification_categories, _parse_date, _since_time
+
+_columns = 'id, category, distribution_date, context_uuid, is_read, data'
+_paging_arguments = ('results_limit', 'prefetch')  # Change how the notifications are fetched, not which ones.
+
+
+class SQLiteNotificationStore:
+    """
+    Local store of notifications in a SQLite database, for queries and counts without requests.
+
+    - Notifications are added incrementally: :py:func:`ingest` fetches only the notifications newer than the newest one of the last
+      complete ingest. An ingest that failed midway is resumed from the same point, so older notifications are not skipped.
+      The point to resume from is kept for each set of filters, since a filtered ingest does not fetch the other notifications.
+    - Indexed by category, ``distribution_date``, ``context.uuid`` and read state.
+    - The database runs in WAL mode, so several processes can share one file: readers do not block the writer.
+
+    :param db_file: Path to the SQLite database file. Default: ``meapi_notifications.db``.
+    :type db_file: str
+    :param busy_timeout: Seconds to wait for a lock held by another process. Default: ``10``.
+    :type busy_timeout: float
+
+    Example::
+
+        store = SQLiteNotificationStore()
+        store.ingest(me)
+        birthdays = store.query(category='birthday', since='2022-04-01')
+        unread_comments = store.count(category='comments', is_read=False)
+    """
+    def __init__(self, db_file: str = 'meapi_notifications.db', busy_timeout: float = 10):
+        self.db_file = db_file
+        self._lock = Lock()
+        self._db = connect(db_file, timeout=busy_timeout, check_same_thread=False, isolation_level=None)
+        self._db.execute('PRAGMA journal_mode=WAL')
+        self._db.execute('PRAGMA synchronous=NORMAL')
+        self._db.execute('CREATE TABLE IF NOT EXISTS notifications (id INTEGER PRIMARY KEY, category TEXT, '
+                         'distribution_date REAL, context_uuid TEXT, is_read INTEGER NOT NULL, data TEXT NOT NULL)')
+        self._db.execute('CREATE INDEX IF NOT EXISTS notifications_category ON notifications (category, distribution_date)')
+        self._db.execute('CREATE INDEX IF NOT EXISTS notifications_date ON notifications (distribution_date)')
+        self._db.execute('CREATE INDEX IF NOT EXISTS notifications_uuid ON notifications (context_uuid, distribution_date)')
+        self._db.execute('CREATE INDEX IF NOT EXISTS notifications_read ON notifications (is_read, distribution_date)')
+        self._db.execute('CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value INTEGER)')
+
+    def add(self, notifications: Iterable[dict]) -> int:
+        """
+        Add notifications, or update the stored ones with the same id (Read state for example).
+
+        :param notifications: Notifications from :py:func:`~meapi.Me.get_notifications` (``results``) or :py:func:`~meapi.Me.iter_notifications`.
+        :type notifications: Iterable[dict]
+        :return: Count of notifications written.
+        :rtype: int
+        """
+        rows = []
+        for notification in notifications:
+            date = notification.get('distribution_date') or notification.get('created_at')
+            rows.append((int(notification['id']), notification.get('message_category'),
+                         _parse_date(date).timestamp() if date else None, (notification.get('context') or {}).get('uuid'),
+                         int(bool(notification.get('is_read'))), dumps(notification)))
+        if not rows:
+            return 0
+        with self._lock:
+            self._db.execute('BEGIN')
+            try:
+                self._db.executemany(f'INSERT OR REPLACE INTO notifications ({_columns}) VALUES (?, ?, ?, ?, ?, ?)', rows)
+                self._db.execute('COMMIT')
+            except BaseException:
+                self._db.execute('ROLLBACK')
+                raise
+        return len(rows)
+
+    def ingest(self, me, chunk_size: int = 500, **filters) -> int:
+        """
+        Fetch the notifications newer than the newest one of the last complete ingest with the same filters (All of them on the
+        first run) and add them.
+
+        - Chunks are written as they are fetched, but the point to resume from moves only after the whole walk, so after a
+          failure the next ingest fetches the same range again (Notifications that were already stored are just updated).
+
+        :param me: The client.
+        :type me: Me
+        :param chunk_size: Notifications to write in each transaction. Default: ``500``.
+        :type chunk_size: int
+        :param filters: Arguments of :py:func:`~meapi.Me.iter_notifications`, like ``results_limit``.
+        :return: Count of fetched notifications.
+        :rtype: int
+        """
+        since_id, newest_id = self.ingested_id(**filters), None
+        added, chunk = 0, []
+        for notification in me.iter_notifications(since_id=since_id, **filters):
+            newest_id = max(newest_id or 0, int(notification['id']))
+            chunk.append(notification)
+            if len(chunk) >= chunk_size:
+                added += self.add(chunk)
+                chunk = []
+        added += self.add(chunk)
+        self._set_ingested_id(newest_id, **filters)
+        return added
+
+    async def ingest_async(self, me, chunk_size: int = 500, **filters) -> int:
+        """
+        :py:func:`ingest` for :py:class:`~meapi.AsyncMe`.
+        """
+        since_id, newest_id = self.ingested_id(**filters), None
+        added, chunk = 0, []
+        async for notification in me.iter_notifications(since_id=since_id, **filters):
+            newest_id = max(newest_id or 0, int(notification['id']))
+            chunk.append(notification)
+            if len(chunk) >= chunk_size:
+                added += self.add(chunk)
+                chunk = []
+        added += self.add(chunk)
+        self._set_ingested_id(newest_id, **filters)
+        return added
+
+    def query(self,
+              category: Union[str, List[str], None] = None,
+              since: Union[datetime, str, int, float, None] = None,
+              until: Union[datetime, str, int, float, None] = None,
+              uuid: Union[str, None] = None,
+              is_read: Union[bool, None] = None,
+              limit: Union[int, None] = None,
+              offset: int = 0,
+              newest_first: bool = True) -> List[dict]:
+        """
+        Get stored notifications.
+
+        :param category: Group of ``notification_categories`` (``'birthday'``, ``'comments'``...), a ``message_category`` (``'BIRTHDAY'``), or a list of them. Default: ``None``.
+        :type category: Union[str, List[str], None]
+        :param since: Only notifications distributed after this time: ``datetime`` (Naive is UTC), ISO 8601 string or unix timestamp. Default: ``None``.
+        :type since: Union[datetime, str, int, float, None]
+        :param until: Only notifications distributed before this time. Default: ``None``.
+        :type until: Union[datetime, str, int, float, None]
+        :param uuid: Only notifications about this user (``context.uuid``). Default: ``None``.
+        :type uuid: Union[str, None]
+        :param is_read: Only read (``True``) or unread (``False``) notifications. Default: ``None``.
+        :type is_read: Union[bool, None]
+        :param limit: Max notifications. Default: ``None`` (All).
+        :type limit: Union[int, None]
+        :param offset: Notifications to skip. Default: ``0``.
+        :type offset: int
+        :param newest_first: Sort from the newest. Default: ``True``.
+        :type newest_first: bool
+        :return: List of notifications, in the format of :py:func:`~meapi.Me.get_notifications` ``results``.
+        :rtype: List[dict]
+        """
+        where, params = self._where(category, since, until, uuid, is_read)
+        sql = f"SELECT data FROM notifications{where} ORDER BY distribution_date {'DESC' if newest_first else 'ASC'}, id " \
+              f"{'DESC' if newest_first else 'ASC'} LIMIT ? OFFSET ?"
+        with self._lock:
+            rows = self._db.execute(sql, (*params, -1 if limit is None else limit, offset)).fetchall()
+        return [loads(row[0]) for row in rows]
+
+    def count(self,
+              category: Union[str, List[str], None] = None,
+              since: Union[datetime, str, int, float, None] = None,
+              until: Union[datetime, str, int, float, None] = None,
+              uuid: Union[str, None] = None,
+              is_read: Union[bool, None] = None) -> int:
+        """
+        Count stored notifications. The filters are the same as in :py:func:`query`.
+
+        :rtype: int
+        """
+        where, params = self._where(category, since, until, uuid, is_read)
+        with self._lock:
+            return self._db.execute(f'SELECT COUNT(*) FROM notifications{where}', params).fetchone()[0]
+
+    def mark_read(self, notification_ids: Iterable[Union[int, str]]):
+        """
+        Mark stored notifications as read, after :py:func:`~meapi.Me.read_notification` or :py:func:`~meapi.Me.read_notifications`.
+
+        :param notification_ids: Notification ids.
+        :type notification_ids: Iterable[Union[int, str]]
+        """
+        ids = [(int(notification_id),) for notification_id in notification_ids]
+        with self._lock:
+            self._db.execute('BEGIN')
+            try:
+                self._db.executemany("UPDATE notifications SET is_read = 1, data = json_set(data, '$.is_read', json('true')) "
+                                     "WHERE id = ?", ids)
+                self._db.execute('COMMIT')
+            except BaseException:
+                self._db.execute('ROLLBACK')
+                raise
+
+    def latest_id(self) -> Union[int, None]:
+        """
+        Id of the newest stored notification, ``None`` if the store is empty.
+
+        :rtype: Union[int, None]
+        """
+        with self._lock:
+            return self._db.execute('SELECT MAX(id) FROM notifications').fetchone()[0]
+
+    def ingested_id(self, **filters) -> Union[int, None]:
+        """
+        Id of the newest notification of the last complete :py:func:`ingest` with these filters, ``None`` if there was none.
+
+        :param filters: The filters of the ingest, like ``birthday_filter=True``.
+        :rtype: Union[int, None]
+        """
+        with self._lock:
+            row = self._db.execute('SELECT value FROM meta WHERE key = ?', (self._ingest_key(filters),)).fetchone()
+        return row[0] if row else None
+
+    def clear(self):
+        """
+        Remove all the notifications.
+        """
+        with self._lock:
+            self._db.execute('BEGIN')
+            try:
+                self._db.execute('DELETE FROM notifications')
+                self._db.execute("DELETE FROM meta WHERE key = 'ingested_id' OR key LIKE 'ingested_id:%'")
+                self._db.execute('COMMIT')
+            except BaseException:
+                self._db.execute('ROLLBACK')
+                raise
+
+    def close(self):
+        """
+        Close the database connection.
+        """
+        with self._lock:
+            self._db.close()
+
+    def _set_ingested_id(self, newest_id: Union[int, None], **filters):
+        if newest_id is None:  # Nothing new, the last complete ingest is still the newest.
+            return
+        key = self._ingest_key(filters)
+        with self._lock:
+            self._db.execute('INSERT OR REPLACE INTO meta (key, value) VALUES (?, '
+                             'MAX(?, COALESCE((SELECT value FROM meta WHERE key = ?), 0)))', (key, newest_id, key))
+
+    @staticmethod
+    def _ingest_key(filters: dict) -> str:
+        # Like 'ingested_id:birthday_filter=True', by the filters that change which notifications are fetched.
+        scope = sorted((name, str(value)) for name, value in filters.items() if value and name not in _paging_arguments)
+        return 'ingested_id' + (':' + ','.join(f'{name}={value}' for name, value in scope) if scope else '')
+
+    @staticmethod
+    def _where(category, since, until, uuid, is_read) -> Tuple[str, tuple]:
+        conditions, params = [], []
+        if category is not None:
+            categories = []
+            for name in [category] if isinstance(category, str) else category:
+                categories.extend(notification_categories.get(name.lower().replace('_filter', ''), [name.upper()]))
+            conditions.append(f"category IN ({', '.join('?' * len(categories))})")
+            params.extend(categories)
+        if since is not None:
+            conditions.append('distribution_date > ?')
+            params.append(_since_time(since).timestamp())
+        if until is not None:
+            conditions.append('distribution_date < ?')
+            params.append(_since_time(until).timestamp())
+        if uuid is not None:
+            conditions.append('context_uuid = ?')
+            params.append(uuid)
+        if is_read is not None:
+            conditions.append('is_read = ?')
+            params.append(int(is_read))
+        return (' WHERE ' + ' AND '.join(conditions) if conditions else ''), tuple(params)
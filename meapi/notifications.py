@@ -1,4 +1,8 @@
-from typing import Tuple, List, Union
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextvars import copy_context
+from datetime import datetime, timezone
+from threading import Lock
+from typing import Dict, Iterable, Iterator, Tuple, List, Union
 from meapi.exceptions import MeException
 
 notification_categories = {
@@ -13,6 +17,66 @@ notification_categories = {
 }
 
 
+def _notifications_params(page_number: int, results_limit: int, **filters) -> str:
+    categories = []
+    for fil, val in filters.items():
+        if val:
+            categories = [*categories, *notification_categories[fil.replace("_filter", "")]]
+    params = f"?page={page_number}&page_size={results_limit}&status=distributed"
+    if categories:
+        params += f"&categories=%5B{'%2C%20'.join(categories)}%5D"
+    return params
+
+
+def _parse_date(date: str) -> datetime:
+    return datetime.fromisoformat(date.replace('Z', '+00:00'))
+
+
+def _since_time(since: Union[datetime, str, int, float, None]) -> Union[datetime, None]:
+    if since is None:
+        return None
+    if isinstance(since, (int, float)):
+        return datetime.fromtimestamp(since, timezone.utc)
+    if isinstance(since, str):
+        since = _parse_date(since)
+    return since if since.tzinfo is not None else since.replace(tzinfo=timezone.utc)
+
+
+def _reached_since(notification: dict, since_time: Union[datetime, None], since_id: Union[int, None]) -> bool:
+    # Notifications are sorted from the newest, so the first one that is not newer than ``since`` ends the walk.
+    if since_id is not None and int(notification['id']) <= since_id:
+        return True
+    if since_time is not None:
+        date = notification.get('distribution_date') or notification.get('created_at')
+        return bool(date) and _parse_date(date) <= since_time
+    return False
+
+
+class _ReadCoalescer:
+    # Calls to read the same notification while a read of it is in flight wait for that read, instead of sending another.
+    def __init__(self):
+        self._lock = Lock()
+        self._in_flight: Dict[int, Future] = {}
+
+    def read(self, notification_id: int, read) -> bool:
+        with self._lock:
+            future = self._in_flight.get(notification_id)
+            owner = future is None
+            if owner:
+                future = self._in_flight[notification_id] = Future()
+        if not owner:
+            return future.result()
+        try:
+            future.set_result(read())
+        except BaseException as err:
+            future.set_exception(err)
+            raise
+        finally:
+            with self._lock:
+                del self._in_flight[notification_id]
+        return future.result()
+
+
 class Notifications:
     def unread_notifications_count(self) -> int:
         """
@@ -137,14 +201,87 @@ class Notifications:
         """
         args = locals()
         del args['self']
-        filters = []
-        for fil, val in args.items():
-            if val:
-                filters = [*filters, *notification_categories[fil.replace("_filter", "")]]
-        params = f"?page={page_number}&page_size={results_limit}&status=distributed"
-        if filters:
-            params += f"&categories=%5B{'%2C%20'.join(filters)}%5D"
-        return self.make_request('get', '/notification/notification/items/' + params)
+        return self.make_request('get', '/notification/notification/items/' + _notifications_params(**args))
+
+    def iter_notifications(self,
+                           results_limit: int = 100,
+                           since: Union[datetime, str, int, float, None] = None,
+                           since_id: Union[int, str, None] = None,
+                           prefetch: bool = True,
+                           names_filter: bool = False,
+                           system_filter: bool = False,
+                           comments_filter: bool = False,
+                           who_watch_filter: bool = False,
+                           who_deleted_filter: bool = False,
+                           birthday_filter: bool = False,
+                           location_filter: bool = False) -> Iterator[dict]:
+        """
+        Iterate over all the notifications, from the newest, page after page (See :py:func:`get_notifications`).
+
+        - The next page is fetched in the background while the current page is processed.
+        - Pages are fetched lazily: stopping the iteration stops the requests.
+
+        :param results_limit: Notifications in each page. Default: ``100``.
+        :type results_limit: int
+        :param since: Stop at the first notification that is not newer than this time: ``datetime`` (Naive is UTC), ISO 8601 string or unix timestamp. Default: ``None``.
+        :type since: Union[datetime, str, int, float, None]
+        :param since_id: Stop at this notification id (Or an older one). Default: ``None``.
+        :type since_id: Union[int, str, None]
+        :param prefetch: Fetch the next page while the current one is processed. Default: ``True``.
+        :type prefetch: bool
+        :param names_filter: See :py:func:`get_notifications`. Default: False
+        :type names_filter: bool
+        :param system_filter: See :py:func:`get_notifications`. Default: False
+        :type system_filter: bool
+        :param comments_filter: See :py:func:`get_notifications`. Default: False
+        :type comments_filter: bool
+        :param who_watch_filter: See :py:func:`get_notifications`. Default: False
+        :type who_watch_filter: bool
+        :param who_deleted_filter: See :py:func:`get_notifications`. Default: False
+        :type who_deleted_filter: bool
+        :param birthday_filter: See :py:func:`get_notifications`. Default: False
+        :type birthday_filter: bool
+        :param location_filter: See :py:func:`get_notifications`. Default: False
+        :type location_filter: bool
+        :return: Iterator of notifications, in the format of the ``results`` of :py:func:`get_notifications`.
+        :rtype: Iterator[dict]
+
+        Example::
+
+            for notification in me.iter_notifications(since=last_run, birthday_filter=True):
+                print(notification['context']['name'])
+        """
+        filters = dict(names_filter=names_filter, system_filter=system_filter, comments_filter=comments_filter,
+                       who_watch_filter=who_watch_filter, who_deleted_filter=who_deleted_filter,
+                       birthday_filter=birthday_filter, location_filter=location_filter)
+        since_time, since_id = _since_time(since), int(since_id) if since_id is not None else None
+
+        def fetch(page_number: int) -> dict:
+            return self.get_notifications(page_number=page_number, results_limit=results_limit, **filters)
+
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='meapi-notifications') if prefetch else None
+        page_number, next_page = 1, None
+        try:
+            notifications = fetch(page_number)
+            while True:
+                results = notifications['results']
+                more = bool(notifications.get('next') and results) and not _reached_since(results[-1], since_time, since_id)
+                if more and executor is not None:  # The deadline and the trace span of the caller apply to the prefetch.
+                    next_page = executor.submit(copy_context().run, fetch, page_number + 1)
+                for notification in results:
+                    if _reached_since(notification, since_time, since_id):
+                        return
+                    yield notification
+                if not more:
+                    return
+                page_number += 1
+                notifications = next_page.result() if next_page is not None else fetch(page_number)
+                next_page = None
+        finally:
+            if executor is not None:
+                if next_page is not None:
+                    next_page.cancel()
+                executor.shutdown(wait=False)
 
     def read_notification(self, notification_id: Union[int, str]) -> bool:
         """
@@ -155,8 +292,49 @@ class Notifications:
         :return: Is read success.
         :rtype: bool
         """
-        body = {"notification_id": int(notification_id)}
-        return self.make_request('post', '/notification/notification/read/', body)['is_read']
+        notification_id = int(notification_id)
+        body = {"notification_id": notification_id}
+        return self._read_coalescer.read(
+            notification_id, lambda: self.make_request('post', '/notification/notification/read/', body)['is_read'])
+
+    def read_notifications(self,
+                           notification_ids: Iterable[Union[int, str]],
+                           max_concurrency: int = 8) -> Dict[int, Union[bool, Exception]]:
+        """
+        Mark many notifications as read, with up to ``max_concurrency`` requests at a time.
+
+        - Duplicate ids are read once. Ids that are already being read by another call are not sent again (This applies to :py:func:`read_notification` too).
+        - A failed id does not stop the others: its result is the exception.
+
+        :param notification_ids: Notification ids from :py:func:`get_notifications` (Or :py:func:`iter_notifications`).
+        :type notification_ids: Iterable[Union[int, str]]
+        :param max_concurrency: Max requests at a time. Default: ``8``.
+        :type max_concurrency: int
+        :return: Dict of results by notification id: ``True`` if read, ``False`` if not, or the exception (:py:exc:`~meapi.exceptions.MeApiException` for example).
+        :rtype: Dict[int, Union[bool, Exception]]
+
+        Example::
+
+            unread = [n['id'] for n in me.iter_notifications() if not n['is_read']]
+            results = me.read_notifications(unread)
+            failed = [notification_id for notification_id, result in results.items() if result is not True]
+        """
+        ids = list(dict.fromkeys(int(notification_id) for notification_id in notification_ids))
+        results: Dict[int, Union[bool, Exception]] = {}
+        if not ids:
+            return results
+
+        def read(notification_id: int):
+            try:
+                results[notification_id] = self.read_notification(notification_id)
+            except Exception as err:
+                results[notification_id] = err
+
+        with ThreadPoolExecutor(max_workers=max(1, min(max_concurrency, len(ids))),
+                                thread_name_prefix='meapi-read') as executor:
+            for notification_id in ids:  # The deadline and the trace span of the caller apply to each read.
+                executor.submit(copy_context().run, read, notification_id)
+        return {notification_id: results[notification_id] for notification_id in ids}
 
     def change_notification_settings(self,
                                      who_deleted_notification_enabled: bool = None,
@@ -0,0 +1,138 @@
+from json import load, dump, JSONDecodeError
+from os import path, replace
+from threading import Lock
+from time import time
+from typing import Union, Dict
+from meapi.exceptions import MeException, MeQuotaException
+
+DEFAULT_LIMITS = {'phone_search': 350, 'get_profile_info': 500}
+
+
+class QuotaTracker:
+    """
+    Client-side tracker for the daily limits of :py:func:`~meapi.Me.phone_search` and :py:func:`~meapi.Me.get_profile_info`.
+
+    - Counts the calls in a rolling window and stops before the server limit is hit, without wasting a request.
+    - When the server still answers with ``api_search_passed_limit`` / ``api_profile_view_passed_limit``, the quota is marked as used up.
+    - With ``quota_file``, the counters survive restarts. Use one file per account.
+
+    :param limits: Max calls per window for each method, merged with the defaults: ``{'phone_search': 350, 'get_profile_info': 500}``.
+        ``None`` or ``0`` turns the limit of a method off. Default: ``None``.
+    :type limits: Dict[str, Union[int, None]]
+    :param window: Length of the rolling window in seconds. Default: ``86400`` (One day).
+    :type window: float
+    :param quota_file: Path to json file to save the counters in. Default: ``None`` (In memory only).
+    :type quota_file: Union[str, None]
+    :param block: Wait until the quota frees up instead of raising :py:class:`~meapi.exceptions.MeQuotaException`. Default: ``False``.
+    :type block: bool
+
+    Example::
+
+        me = Me(phone_number=972123456789, quota=QuotaTracker(quota_file='quota.json'))
+        print(me.quota.remaining('phone_search'))
+    """
+    def __init__(self,
+                 limits: Dict[str, Union[int, None]] = None,
+                 window: float = 86400,
+                 quota_file: Union[str, None] = None,
+                 block: bool = False):
+        # Methods without a limit are not tracked: reserve() and exhaust() pass them through.
+        self.limits = {name: limit for name, limit in {**DEFAULT_LIMITS, **(limits or {})}.items() if limit}
+        self.window = window
+        self.quota_file = quota_file
+        self.block = block
+        self._lock = Lock()
+        self._calls = {name: [] for name in self.limits}
+        if quota_file and path.isfile(quota_file):
+            with open(quota_file, 'r') as file:
+                try:
+                    saved = load(file)
+                except JSONDecodeError:
+                    raise MeException("Not a valid json file: " + quota_file)
+            for name in self._calls:
+                self._calls[name] = sorted(saved.get(name, []))
+
+    def remaining(self, name: str) -> int:
+        """
+        Get how many calls are left in the current window.
+
+        :param name: Method name: ``phone_search`` or ``get_profile_info``.
+        :type name: str
+        :return: Count of calls left.
+        :rtype: int
+        """
+        with self._lock:
+            self._purge(name)
+            return max(0, self.limits[name] - len(self._calls[name]))
+
+    def reset_in(self, name: str) -> float:
+        """
+        Get how many seconds until the next call is allowed.
+
+        :param name: Method name: ``phone_search`` or ``get_profile_info``.
+        :type name: str
+        :return: Seconds to wait. ``0`` if there is quota left.
+        :rtype: float
+        """
+        with self._lock:
+            return self._wait_time(name)
+
+    def reserve(self, name: str) -> float:
+        """
+        Count a call if there is quota left.
+
+        :param name: Method name: ``phone_search`` or ``get_profile_info``.
+        :type name: str
+        :raises MeQuotaException: If no quota left and ``block`` is ``False``.
+        :return: ``0`` if the call was counted, else seconds to wait before trying again.
+        :rtype: float
+        """
+        if name not in self.limits:
+            return 0
+        with self._lock:
+            wait = self._wait_time(name)
+            if wait:
+                if not self.block:
+                    raise MeQuotaException(f"Local quota of {name} passed the limit ({self.limits[name]} calls "
+                                           f"in {self.window} seconds).", name, wait)
+                return wait
+            self._calls[name].append(time())
+            self._save()
+            return 0
+
+    def exhaust(self, name: str):
+        """
+        Mark the quota as used up, for when the server reports that the limit has passed.
+
+        :param name: Method name: ``phone_search`` or ``get_profile_info``.
+        :type name: str
+        """
+        if name not in self.limits:
+            return
+        with self._lock:
+            self._purge(name)
+            missing = self.limits[name] - len(self._calls[name])
+            if missing > 0:
+                self._calls[name].extend([time()] * missing)
+                self._save()
+
+    def _purge(self, name: str):
+        calls = self._calls[name]
+        oldest = time() - self.window
+        while calls and calls[0] <= oldest:
+            calls.pop(0)
+
+    def _wait_time(self, name: str) -> float:
+        self._purge(name)
+        calls = self._calls[name]
+        if len(calls) < self.limits[name]:
+            return 0
+        return max(0.0, calls[len(calls) - self.limits[name]] + self.window - time())
+
+    def _save(self):
+        if not self.quota_file:
+            return
+        tmp_file = self.quota_file + '.tmp'
+        with open(tmp_file, 'w') as file:
+            dump(self._calls, file)
+        replace(tmp_file, self.quota_file)
@@ -0,0 +1,91 @@
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+from random import uniform
+from typing import Union, Iterable
+
+
+class RetryPolicy:
+    """
+    Retry policy for transient failures: connection errors, timeouts and retryable HTTP statuses (``429`` and ``5xx``).
+
+    - The delay before retry number ``n`` is a random number between ``0`` and ``min(max_backoff, backoff_factor * 2 ** (n - 1))`` (Exponential backoff with full jitter).
+    - If the server sends a ``Retry-After`` header, the delay is at least that long (Up to ``max_backoff``).
+    - By default only idempotent requests (``get``, ``put``, ``delete``) are retried.
+    - When the retries run out, the last error is raised with ``attempts`` and ``waited``: :py:class:`~meapi.exceptions.MeApiException`
+      for HTTP statuses, :py:class:`~meapi.exceptions.MeConnectionException` for connection errors and timeouts.
+
+    :param max_retries: Max retries per request (Not including the first attempt). ``0`` disables retries. Default: ``3``.
+    :type max_retries: int
+    :param backoff_factor: Base delay in seconds. Default: ``0.5``.
+    :type backoff_factor: float
+    :param max_backoff: Max delay in seconds between two attempts. Default: ``30``.
+    :type max_backoff: float
+    :param retry_statuses: HTTP statuses to retry on. Default: ``429``, ``500``, ``502``, ``503``, ``504``.
+    :type retry_statuses: Iterable[int]
+    :param retry_methods: HTTP request types to retry. Default: ``get``, ``put``, ``delete``.
+    :type retry_methods: Iterable[str]
+    :param respect_retry_after: Wait at least the ``Retry-After`` header of the response. Default: ``True``.
+    :type respect_retry_after: bool
+
+    Example::
+
+        me = Me(phone_number=972123456789, retry_policy=RetryPolicy(max_retries=5, retry_methods=['get', 'post']))
+    """
+    def __init__(self,
+                 max_retries: int = 3,
+                 backoff_factor: float = 0.5,
+                 max_backoff: float = 30,
+                 retry_statuses: Iterable[int] = (429, 500, 502, 503, 504),
+                 retry_methods: Iterable[str] = ('get', 'put', 'delete'),
+                 respect_retry_after: bool = True):
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.retry_statuses = frozenset(retry_statuses)
+        self.retry_methods = frozenset(method.lower() for method in retry_methods)
+        self.respect_retry_after = respect_retry_after
+
+    def is_retryable_status(self, status_code: int) -> bool:
+        return status_code in self.retry_statuses
+
+    def get_delay(self, req_type: str, retry: int, retry_after: Union[str, None] = None) -> Union[float, None]:
+        """
+        Get the delay before the next retry.
+
+        :param req_type: HTTP request type.
+        :type req_type: str
+        :param retry: Number of the upcoming retry (``1`` for the first retry).
+        :type retry: int
+        :param retry_after: ``Retry-After`` header of the last response. Default: ``None``.
+        :type retry_after: Union[str, None]
+        :return: Seconds to wait, or ``None`` if the request should not be retried.
+        :rtype: Union[float, None]
+        """
+        if retry > self.max_retries or req_type not in self.retry_methods:
+            return None
+        delay = self.backoff(retry)
+        if retry_after and self.respect_retry_after:
+            delay = max(delay, min(self.max_backoff, _parse_retry_after(retry_after)))
+        return delay
+
+    def backoff(self, retry: int) -> float:
+        """
+        Get a random backoff delay (Full jitter) before retry number ``retry``, regardless of the request type.
+
+        :param retry: Number of the upcoming retry (``1`` for the first retry).
+        :type retry: int
+        :rtype: float
+        """
+        return uniform(0, min(self.max_backoff, self.backoff_factor * 2 ** (retry - 1)))
+
+
+def _parse_retry_after(retry_after: str) -> float:
+    # Retry-After is either delay-seconds or an HTTP date.
+    try:
+        return max(0.0, float(retry_after))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, (parsedate_to_datetime(retry_after) - datetime.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError):
+        return 0.0
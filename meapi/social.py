@@ -49,7 +49,10 @@ class Social:
         """
         body = {"country_code": country_code.upper(), "is_spam": True, "is_from_v": False,
                 "name": str(spam_name), "phone_number": str(self.valid_phone_number(phone_number))}
-        return self.make_request('post', '/main/names/suggestion/report/', body)['success']
+        results = self.make_request('post', '/main/names/suggestion/report/', body)
+        if self.cache is not None:
+            self.cache.invalidate_contact(body['phone_number'])
+        return results['success']
 
     def who_deleted(self) -> List[dict]:
         """
@@ -179,7 +182,7 @@ class Social:
         """
         if not uuid:
             if self.phone_number:
-                uuid = self.uuid
+                uuid = self.get_uuid()
             else:
                 raise MeException("In https://meapi.readthedocs.io/en/latest/setup.html#official-method mode you must to provide user uuid.")
         return self.make_request('get', '/main/comments/list/' + uuid)
@@ -504,7 +507,7 @@ class Social:
         """
         if not uuid:
             return self.make_request('post', '/main/social/update/')
-        return self.extra_info(str(uuid))['social']
+        return self.get_profile_info(str(uuid))['social']
 
     def add_social(self,
                    twitter_token: str = None,
@@ -556,6 +559,7 @@ class Social:
                 results = self.make_request('post', f'/main/social/{endpoint}/', body)
                 if not (bool(results['success']) if is_token else bool(results[social_name]['profile_id'] == token_or_url)):
                     failed.append(social_name)
+        self._invalidate_own_profile()
         return not bool(failed), failed
 
     def remove_social(self,
@@ -595,6 +599,7 @@ class Social:
                 body = {"social_name": str(social)}
                 if self.make_request('post', '/main/social/delete/', body).get('success'):
                     successes += 1
+        self._invalidate_own_profile()
         return bool(true_values == successes)
 
     def switch_social_status(self,
@@ -637,7 +642,7 @@ class Social:
                     new_status = not bool(self.make_request('post', '/main/social/hide/', body)['is_hidden'])
                     if status == new_status:
                         successes += 1
-
+        self._invalidate_own_profile()
         return bool(not_null_values == successes)
 
     def numbers_count(self) -> int:
@@ -694,11 +699,7 @@ class Social:
         :return: User age if date of birth exists. else - 0.0
         :rtype: float
         """
-        if not uuid:
-            date_of_birth = self.get_profile_info()['profile']['date_of_birth']
-        else:
-            print(self.get_profile_info(uuid))
-            date_of_birth = self.get_profile_info(uuid)['profile']['date_of_birth']
+        date_of_birth = self.get_profile_info(uuid)['profile']['date_of_birth']
         if match(r"^\d{4}(\-)([0-2][0-9]|(3)[0-1])(\-)(((0)[0-9])|((1)[0-2]))$", str(date_of_birth)):
             days_in_year = 365.2425
             return round((date.today() - datetime.strptime(date_of_birth, "%Y-%m-%d").date()).days / days_in_year, 1)
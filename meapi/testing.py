@@ -0,0 +1,774 @@
+"""
+Local stand-in of the Me API, to test, benchmark and soak-test meapi offline.
+
+- :py:class:`FakeMeApi` implements the endpoints that meapi calls, with realistic payloads, latency, error rates and rate limits.
+- :py:class:`MeTestServer` serves it over HTTP on localhost. :py:class:`InProcessTransport` calls it without sockets.
+
+Example::
+
+    from meapi import Me, MemoryCredentialStore
+    from meapi.testing import FakeMeApi, MeTestServer
+
+    with MeTestServer(FakeMeApi(latency=0.02, error_rate=0.01)) as server:
+        me = Me(phone_number=972501234567, activation_code=123456,
+                credential_store=MemoryCredentialStore(), transport=server.transport())
+        me.phone_search(972500000001)
+"""
+from asyncio import sleep as async_sleep
+from base64 import urlsafe_b64encode
+from collections import Counter, defaultdict, deque
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from json import dumps, loads
+from math import ceil
+from random import Random
+from re import compile as re_compile
+from threading import Lock, Thread
+from time import monotonic, sleep, time
+from typing import Any, Dict, Mapping, Tuple, Union
+from urllib.parse import parse_qs, unquote, urlsplit
+from uuid import UUID
+from meapi.aio.transport import AsyncTransport
+from meapi.notifications import notification_categories
+from meapi.transport import Transport, TransportResponse, RequestsTransport
+
+_html_errors = {
+    502: b'<html><head><title>502 Bad Gateway</title></head><body><h1>502 Bad Gateway</h1></body></html>',
+    503: b'<html><head><title>503 Service Unavailable</title></head><body><h1>503 Service Unavailable</h1></body></html>',
+    504: b'<html><head><title>504 Gateway Time-out</title></head><body><h1>504 Gateway Time-out</h1></body></html>',
+}
+_socials = ['facebook', 'fakebook', 'instagram', 'linkedin', 'pinterest', 'spotify', 'tiktok', 'twitter']
+_first_names = ['Chandler', 'Monica', 'Rachel', 'Phoebe', 'Ross', 'Joey', 'Gunther', 'Janice', 'Mike', 'Emily',
+                'Richard', 'Carol', 'Susan', 'Ben', 'Emma', 'Frank', 'Ursula', 'Estelle', 'Judy', 'Jack']
+_last_names = ['Bing', 'Geller', 'Green', 'Buffay', 'Tribbiani', 'Hannigan', 'Waltham', 'Burke', '']
+
+
+def _jwt(payload: dict) -> str:
+    def encode(part: dict) -> str:
+        return urlsafe_b64encode(dumps(part).encode()).decode().rstrip('=')
+    return f"{encode({'alg': 'HS256', 'typ': 'JWT'})}.{encode(payload)}.c2lnbmF0dXJl"
+
+
+def _iso(timestamp: float) -> str:
+    return datetime.fromtimestamp(timestamp, timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+
+
+class FakeMeApi:
+    """
+    In-memory stand-in of the Me API.
+
+    - Accounts are created on activation (With ``activation_code``). Tokens are JWTs that expire after ``token_lifetime``.
+    - Other users (``users``) can be searched, viewed and commented. Each account gets ``notifications`` notifications.
+    - ``requests`` counts the handled requests by endpoint name.
+
+    :param latency: Seconds to wait before each response. Default: ``0``.
+    :type latency: float
+    :param latency_jitter: Random extra seconds (Uniform, ``0`` to this value) to wait before each response. Default: ``0``.
+    :type latency_jitter: float
+    :param error_rate: Part of the requests (``0`` to ``1``) that fail with one of ``error_statuses``. Default: ``0``.
+    :type error_rate: float
+    :param error_statuses: Status codes of the failed requests (``502``, ``503`` and ``504`` with an HTML body). Default: ``(500, 502, 503)``.
+    :type error_statuses: Tuple[int, ...]
+    :param rate_limit: Max requests of each token in ``rate_limit_window`` seconds, more get ``429`` with ``Retry-After``. Default: ``None`` (No limit).
+    :type rate_limit: Union[int, None]
+    :param rate_limit_window: Seconds of the rate limit window. Default: ``1``.
+    :type rate_limit_window: float
+    :param search_limit: Max phone searches of each account, more get ``api_search_passed_limit``. Default: ``None`` (No limit).
+    :type search_limit: Union[int, None]
+    :param profile_view_limit: Max profile views of each account, more get ``api_profile_view_passed_limit``. Default: ``None`` (No limit).
+    :type profile_view_limit: Union[int, None]
+    :param token_lifetime: Seconds until an access token expires. Default: ``3600``.
+    :type token_lifetime: float
+    :param activation_code: The code that activates any account. Default: ``123456``.
+    :type activation_code: Union[int, str]
+    :param users: Count of other Me users (Phone numbers ``972500000000`` and up). Default: ``200``.
+    :type users: int
+    :param notifications: Count of notifications of each account. Default: ``200``.
+    :type notifications: int
+    :param seed: Seed of the random data and errors. Default: ``None``.
+    :type seed: Union[int, None]
+    """
+    base_url = 'http://127.0.0.1'
+
+    def __init__(self,
+                 latency: float = 0.0,
+                 latency_jitter: float = 0.0,
+                 error_rate: float = 0.0,
+                 error_statuses: Tuple[int, ...] = (500, 502, 503),
+                 rate_limit: Union[int, None] = None,
+                 rate_limit_window: float = 1.0,
+                 search_limit: Union[int, None] = None,
+                 profile_view_limit: Union[int, None] = None,
+                 token_lifetime: float = 3600,
+                 activation_code: Union[int, str] = 123456,
+                 users: int = 200,
+                 notifications: int = 200,
+                 seed: Union[int, None] = None):
+        self.latency = latency
+        self.latency_jitter = latency_jitter
+        self.error_rate = error_rate
+        self.error_statuses = tuple(error_statuses)
+        self.rate_limit = rate_limit
+        self.rate_limit_window = rate_limit_window
+        self.search_limit = search_limit
+        self.profile_view_limit = profile_view_limit
+        self.token_lifetime = token_lifetime
+        self.activation_code = str(activation_code)
+        self.notifications_count = notifications
+        self.requests = Counter()
+        self._random = Random(seed)
+        self._lock = Lock()
+        self._tokens: Dict[str, Tuple[str, float]] = {}
+        self._accounts: Dict[str, dict] = {}
+        self._calls = defaultdict(deque)
+        self._comments: Dict[int, dict] = {}
+        self._users: Dict[str, dict] = {}
+        self._uuids: Dict[str, str] = {}
+        for i in range(users):
+            self._add_user(str(972500000000 + i))
+        self._routes = [(method, re_compile(pattern), handler, auth) for method, pattern, handler, auth in (
+            ('post', r'^/auth/authorization/activate/$', self._activate, False),
+            ('post', r'^/auth/authorization/login/$', self._login, False),
+            ('get', r'^/main/contacts/search/$', self._phone_search, True),
+            ('get', r'^/main/users/profile/me/$', self._my_profile, True),
+            ('patch', r'^/main/users/profile/$', self._update_profile, True),
+            ('get', r'^/main/users/profile/who-deleted/$', self._who_deleted, True),
+            ('get', r'^/main/users/profile/who-watched/$', self._who_watched, True),
+            ('get', r'^/main/users/profile/share-location/$', self._shared_by_me, True),
+            ('post', r'^/main/users/profile/share-location/stop/$', self._stop_sharing, True),
+            ('post', r'^/main/users/profile/share-location/stop-for-me/$', self._success, True),
+            ('post', r'^/main/users/profile/share-location/(?P<uuid>[\w-]+)/?$', self._share_location, True),
+            ('post', r'^/main/users/profile/block/$', self._block, True),
+            ('post', r'^/main/users/profile/bulk-block/$', self._bulk_block, True),
+            ('post', r'^/main/users/profile/bulk-unblock/$', self._bulk_unblock, True),
+            ('post', r'^/main/users/profile/suggest-turn-on-(comments|mutual|location)/$', self._requested, True),
+            ('get', r'^/main/users/profile/(?P<uuid>[\w-]+)/?$', self._profile, True),
+            ('get', r'^/main/contacts/friendship/$', self._friendship, True),
+            ('get', r'^/main/contacts/count/$', self._contacts_count, True),
+            ('post', r'^/main/contacts/sync/$', self._contacts_sync, True),
+            ('post', r'^/main/contacts/hide/$', self._success, True),
+            ('post', r'^/main/call-log/change-sync/$', self._calls_sync, True),
+            ('get', r'^/main/names/groups/$', self._groups_names, True),
+            ('post', r'^/main/names/suggestion/(report/)?$', self._success, True),
+            ('get', r'^/main/settings/$', self._settings, True),
+            ('patch', r'^/main/settings/$', self._update_settings, True),
+            ('get', r'^/main/settings/blocked-phone-numbers/$', self._blocked_numbers, True),
+            ('get', r'^/main/settings/hidden-names/$', self._hidden_names, True),
+            ('post', r'^/main/settings/hidden-names/$', self._success, True),
+            ('put', r'^/main/settings/suspend-user/$', self._suspend, True),
+            ('delete', r'^/main/settings/remove-user/$', self._remove_user, True),
+            ('post', r'^/main/location/update/$', self._success, True),
+            ('get', r'^/main/comments/list/(?P<uuid>[\w-]+)/?$', self._comments_list, True),
+            ('get', r'^/main/comments/add/(?P<uuid>[\w-]+)/?$', self._comment_add, True),
+            ('get', r'^/main/comments/retrieve/(?P<id>\d+)/?$', self._comment_retrieve, True),
+            ('post', r'^/main/comments/approve/(?P<id>\d+)/?$', self._comment_approve, True),
+            ('delete', r'^/main/comments/approve/(?P<id>\d+)/?$', self._comment_ignore, True),
+            ('post', r'^/main/comments/like/(?P<id>\d+)/?$', self._comment_like, True),
+            ('post', r'^/main/social/(?P<endpoint>save-auth-token|update-url)/$', self._social_add, True),
+            ('post', r'^/main/social/update/$', self._socials, True),
+            ('post', r'^/main/social/delete/$', self._social_delete, True),
+            ('post', r'^/main/social/hide/$', self._social_hide, True),
+            ('get', r'^/notification/notification/count/$', self._notifications_count, True),
+            ('get', r'^/notification/notification/items/$', self._notifications, True),
+            ('post', r'^/notification/notification/read/$', self._read_notification, True),
+        )]
+
+    def issue_token(self, phone_number: Union[int, str]) -> str:
+        """
+        Create an account (If not exists) and get a valid access token for it, to use as ``access_token``.
+
+        :param phone_number: Phone number of the account.
+        :type phone_number: Union[int, str]
+        :return: Access token.
+        :rtype: str
+        """
+        with self._lock:
+            return self._issue_tokens(self._account(str(phone_number)))['access']
+
+    def delay(self) -> float:
+        """
+        Seconds to wait before the next response: ``latency`` and a random part of ``latency_jitter``.
+        """
+        return self.latency + (self._random.uniform(0, self.latency_jitter) if self.latency_jitter else 0)
+
+    def handle(self, method: str, endpoint: str, body: bytes = b'', headers: Mapping[str, str] = None
+               ) -> Tuple[int, Dict[str, str], bytes]:
+        """
+        Handle a request (Without the latency, see :py:func:`delay`).
+
+        :param method: HTTP request type.
+        :type method: str
+        :param endpoint: Path and query string.
+        :type endpoint: str
+        :param body: Raw JSON body. Default: ``b''``.
+        :type body: bytes
+        :param headers: Request headers with lower-case names. Default: ``None``.
+        :type headers: Mapping[str, str]
+        :return: Tuple of: status code, response headers, raw body.
+        :rtype: Tuple[int, Dict[str, str], bytes]
+        """
+        headers = headers or {}
+        url = urlsplit(endpoint)
+        query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        method = method.lower()
+        with self._lock:
+            for route_method, pattern, handler, auth in self._routes:
+                match = pattern.match(url.path)
+                if match and route_method == method:
+                    break
+            else:
+                return self._response(404, {'detail': 'Not found.'})
+            self.requests[handler.__name__.lstrip('_')] += 1
+            token = headers.get('authorization') or ''
+            if self.rate_limit is not None:
+                retry_after = self._throttle(token)
+                if retry_after:
+                    return self._response(429, {'detail': f'Request was throttled. Expected available in {retry_after} seconds.'},
+                                          {'Retry-After': str(retry_after)})
+            if self.error_rate and self._random.random() < self.error_rate:
+                status = self._random.choice(self.error_statuses)
+                if status in _html_errors:
+                    return status, {'Content-Type': 'text/html'}, _html_errors[status]
+                return self._response(status, {'detail': 'A server error occurred.'})
+            account = None
+            if auth:
+                account = self._authenticate(token)
+                if account is None:
+                    return self._response(403, {'detail': 'Given token not valid for any token type', 'code': 'token_not_valid'})
+            try:
+                data = loads(body) if body else {}
+            except ValueError:
+                return self._response(400, {'detail': 'JSON parse error.'})
+            result = handler(account, data, query, **match.groupdict())
+        status, payload = result if isinstance(result, tuple) else (200, result)
+        return self._response(status, payload)
+
+    @staticmethod
+    def _response(status: int, payload: Any, headers: Dict[str, str] = None) -> Tuple[int, Dict[str, str], bytes]:
+        return status, {'Content-Type': 'application/json', **(headers or {})}, dumps(payload).encode()
+
+    def _throttle(self, token: str) -> int:
+        now = monotonic()
+        calls = self._calls[token]
+        while calls and calls[0] <= now - self.rate_limit_window:
+            calls.popleft()
+        if len(calls) >= self.rate_limit:
+            return max(ceil(calls[0] + self.rate_limit_window - now), 1)
+        calls.append(now)
+        return 0
+
+    def _authenticate(self, token: str) -> Union[dict, None]:
+        phone_number, expires_at = self._tokens.get(token, (None, 0))
+        if phone_number is None or expires_at <= time():
+            return None
+        return self._accounts.get(phone_number)
+
+    # Data
+
+    def _add_user(self, phone_number: str) -> dict:
+        first_name = self._random.choice(_first_names)
+        uuid = str(UUID(int=self._random.getrandbits(128), version=4))
+        user = {
+            "email": f"{first_name.lower()}{phone_number[-4:]}@friends.tv",
+            "profile_picture": None,
+            "first_name": first_name,
+            "last_name": self._random.choice(_last_names),
+            "gender": self._random.choice(['M', 'F', None]),
+            "uuid": uuid,
+            "is_verified": self._random.random() < 0.3,
+            "phone_number": int(phone_number),
+            "slogan": None,
+            "is_premium": False,
+            "verify_subscription": True,
+        }
+        self._users[phone_number] = user
+        self._uuids[uuid] = phone_number
+        return user
+
+    def _account(self, phone_number: str) -> dict:
+        if phone_number in self._accounts:
+            return self._accounts[phone_number]
+        user = self._users.get(phone_number) or self._add_user(phone_number)
+        account = {
+            'phone_number': phone_number,
+            'user': user,
+            'pwd_token': _jwt({'phone_number': phone_number, 'nonce': self._random.getrandbits(64)}),
+            'profile': {
+                **user, "carrier": "Fake mobile", "comments_enabled": True, "country_code": "IL",
+                "date_of_birth": '1990-05-20', "device_type": "android", "distance": None, "facebook_url": None,
+                "gdpr_consent": True, "google_url": None, "location_enabled": False, "location_name": None,
+                "login_type": "email", "me_in_contacts": True, "phone_prefix": phone_number[:3], "user_type": "BLUE",
+                "who_deleted_enabled": True, "who_watched_enabled": True,
+            },
+            'social': {social: {"is_active": False, "is_hidden": True, "posts": [], "profile_id": None} for social in _socials},
+            'settings': {
+                "birthday_notification_enabled": True, "comments_enabled": True, "comments_notification_enabled": True,
+                "contact_suspended": False, "distance_notification_enabled": True, "language": "iw",
+                "last_backup_at": None, "last_restore_at": None, "location_enabled": True,
+                "mutual_contacts_available": True, "names_notification_enabled": True, "notifications_enabled": True,
+                "spammers_count": 24615, "system_notification_enabled": True, "who_deleted_enabled": True,
+                "who_deleted_notification_enabled": True, "who_watched_enabled": True,
+                "who_watched_notification_enabled": True,
+            },
+            'contacts': {},
+            'calls': {},
+            'blocked': {},
+            'shared_location': set(),
+            'notifications': self._new_notifications(),
+        }
+        self._accounts[phone_number] = account
+        return account
+
+    def _new_notifications(self) -> list:
+        categories = [category for group in notification_categories.values() for category in group if category != 'NONE']
+        users = list(self._users.values())
+        now = time()
+        notifications = []
+        for i in range(self.notifications_count):
+            category = self._random.choice(categories)
+            sender = self._random.choice(users) if users else {"uuid": None, "phone_number": None, "first_name": None}
+            date = _iso(now - i * 3600 - self._random.randint(0, 3599))
+            notifications.append({
+                "id": 100000000 - i,
+                "created_at": date,
+                "modified_at": date,
+                "is_read": self._random.random() < 0.5,
+                "sender": sender['uuid'],
+                "status": "distributed",
+                "delivery_method": "push",
+                "distribution_date": date,
+                "message_subject": None,
+                "message_category": category,
+                "message_body": None,
+                "message_lang": "iw",
+                "context": {
+                    "name": sender['first_name'],
+                    "uuid": sender['uuid'],
+                    "category": category,
+                    "new_name": self._random.choice(_first_names) if category == 'UPDATED_CONTACT' else None,
+                    "phone_number": sender['phone_number'],
+                    "notification_id": None,
+                    "profile_picture": None,
+                },
+            })
+        return notifications
+
+    def _issue_tokens(self, account: dict) -> dict:
+        access = _jwt({'token_type': 'access', 'exp': int(time() + self.token_lifetime),
+                       'phone_number': account['phone_number'], 'jti': self._random.getrandbits(64)})
+        self._tokens[access] = (account['phone_number'], time() + self.token_lifetime)
+        return {'access': access, 'refresh': _jwt({'token_type': 'refresh', 'jti': self._random.getrandbits(64)})}
+
+    def _contact(self, phone_number: str, account: dict) -> dict:
+        user = self._users.get(phone_number)
+        saved = account['contacts'].get(phone_number)
+        return {
+            "name": (saved or {}).get('name') or (f"{user['first_name']} {user['last_name']}".strip() if user else None),
+            "picture": None,
+            "user": dict(user) if user else None,
+            "suggested_as_spam": int(phone_number[-2:]) % 7 if phone_number[-2:].isdigit() else 0,
+            "is_permanent": False,
+            "is_pending_name_change": False,
+            "user_type": "BLUE" if user else "GREEN",
+            "phone_number": int(phone_number),
+            "cached": False,
+            "is_my_contact": saved is not None,
+            "is_shared_location": False,
+        }
+
+    def _full_profile(self, profile: dict, social: dict, shared: bool = False) -> dict:
+        return {
+            "comments_blocked": False, "is_he_blocked_me": False, "is_permanent": False, "is_shared_location": shared,
+            "last_comment": None, "mutual_contacts_available": True, "mutual_contacts": [],
+            "profile": profile, "share_location": shared, "social": social,
+        }
+
+    # Endpoints
+
+    def _activate(self, account, data, query):
+        if str(data.get('activation_code')) != self.activation_code:
+            return 400, {'detail': 'api_incorrect_activation_code'}
+        account = self._account(str(data.get('phone_number')))
+        return {**self._issue_tokens(account), 'pwd_token': account['pwd_token']}
+
+    def _login(self, account, data, query):
+        account = self._accounts.get(str(data.get('phone_number')))
+        if account is None or account['pwd_token'] != data.get('pwd_token'):
+            return 400, {'detail': 'api_incorrect_pwd_token'}
+        return self._issue_tokens(account)
+
+    def _phone_search(self, account, data, query):
+        account['searches'] = account.get('searches', 0) + 1
+        if self.search_limit is not None and account['searches'] > self.search_limit:
+            return 400, {'detail': 'api_search_passed_limit'}
+        phone_number = query.get('phone_number', '')
+        if not phone_number.isdigit():
+            return 404, {'detail': 'Not found.'}
+        return {"contact": self._contact(phone_number, account)}
+
+    def _my_profile(self, account, data, query):
+        # Unlike other profiles, the own profile fields are on the top level.
+        return {**account['profile'], 'social': account['social']}
+
+    def _profile(self, account, data, query, uuid):
+        account['profile_views'] = account.get('profile_views', 0) + 1
+        if self.profile_view_limit is not None and account['profile_views'] > self.profile_view_limit:
+            return 400, {'detail': 'api_profile_view_passed_limit'}
+        phone_number = self._uuids.get(uuid)
+        if phone_number is None:
+            return 404, {'detail': 'Not found.'}
+        if phone_number in self._accounts:
+            other = self._accounts[phone_number]
+            return self._full_profile(other['profile'], other['social'], uuid in account['shared_location'])
+        user = self._users[phone_number]
+        profile = {**user, "comments_enabled": True, "country_code": "IL", "date_of_birth": '1985-01-01',
+                   "distance": round(self._random.uniform(0.1, 50), 3) if uuid in account['shared_location'] else None,
+                   "location_enabled": True, "user_type": "BLUE"}
+        social = {name: {"is_active": False, "is_hidden": True, "posts": [], "profile_id": None} for name in _socials}
+        return self._full_profile(profile, social, uuid in account['shared_location'])
+
+    def _update_profile(self, account, data, query):
+        account['profile'].update(data)
+        return dict(account['profile'])
+
+    def _who_deleted(self, account, data, query):
+        return [{"created_at": _iso(time() - 86400), "user": user} for user in list(self._users.values())[:3]]
+
+    def _who_watched(self, account, data, query):
+        return [{"last_view": _iso(time() - 3600), "user": user, "count": 2, "is_search": None}
+                for user in list(self._users.values())[3:6]]
+
+    def _shared_by_me(self, account, data, query):
+        users = (self._users[self._uuids[uuid]] for uuid in account['shared_location'] if uuid in self._uuids)
+        return [{key: user[key] for key in ('first_name', 'last_name', 'phone_number', 'profile_picture', 'uuid')}
+                for user in users]
+
+    def _share_location(self, account, data, query, uuid):
+        account['shared_location'].add(uuid)
+        return {'success': True}
+
+    def _stop_sharing(self, account, data, query):
+        account['shared_location'].difference_update(data.get('uuids') or [])
+        return {'success': True}
+
+    def _block(self, account, data, query):
+        phone_number = str(data.get('phone_number'))
+        account['blocked'][phone_number] = {"block_contact": bool(data.get('block_contact')),
+                                            "me_full_block": bool(data.get('me_full_block')),
+                                            "phone_number": int(phone_number)}
+        if not data.get('block_contact') and not data.get('me_full_block'):
+            del account['blocked'][phone_number]
+        return {'success': True}
+
+    def _bulk_block(self, account, data, query):
+        for phone_number in data.get('phone_numbers') or []:
+            account['blocked'][str(phone_number)] = {"block_contact": True, "me_full_block": False,
+                                                     "phone_number": int(phone_number)}
+        return {'success': True, 'block_contact': True}
+
+    def _bulk_unblock(self, account, data, query):
+        for phone_number in data.get('phone_numbers') or []:
+            account['blocked'].pop(str(phone_number), None)
+        return {'success': True}
+
+    def _blocked_numbers(self, account, data, query):
+        return list(account['blocked'].values())
+
+    def _requested(self, account, data, query):
+        return {'requested': True}
+
+    def _success(self, account, data, query, **kwargs):
+        return {'success': True}
+
+    def _friendship(self, account, data, query):
+        return {"calls_duration": None, "he_called": 0, "he_named": None, "he_watched": self._random.randint(0, 5),
+                "his_comment": None, "i_called": 0, "i_named": None, "i_watched": self._random.randint(0, 5),
+                "is_premium": False, "mutual_friends_count": self._random.randint(0, 20), "my_comment": None}
+
+    def _contacts_count(self, account, data, query):
+        return {'count': len(account['contacts'])}
+
+    def _contacts_sync(self, account, data, query):
+        added = removed = 0
+        for contact in data.get('remove') or []:
+            if account['contacts'].pop(str(contact.get('phone_number')), None) is not None:
+                removed += 1
+        for contact in data.get('add') or []:
+            account['contacts'][str(contact.get('phone_number'))] = contact
+            added += 1
+        return {'success': True, 'added': added, 'removed': removed, 'count': len(account['contacts'])}
+
+    def _calls_sync(self, account, data, query):
+        def key(call: dict) -> str:
+            return f"{call.get('phone_number')}:{call.get('called_at')}"
+        removed_list = [call for call in data.get('remove') or [] if account['calls'].pop(key(call), None) is not None]
+        added_list = data.get('add') or []
+        account['calls'].update((key(call), call) for call in added_list)
+        return {'success': True, 'added_list': added_list, 'removed_list': removed_list}
+
+    def _groups_names(self, account, data, query):
+        users = list(self._users.values())
+        groups = []
+        for i in range(0, len(users), 5):  # Every 5 users named you the same, so the payload grows with ``users``.
+            contacts = [{
+                "id": 2218840161 + i + j,
+                "created_at": _iso(time() - 86400 * (i + j + 1)),
+                "modified_at": _iso(time() - 86400 * (i + j + 1)),
+                "user": {key: user[key] for key in ('profile_picture', 'first_name', 'last_name', 'uuid', 'is_verified', 'phone_number')},
+                "in_contact_list": j % 2 == 0,
+            } for j, user in enumerate(users[i:i + 5])]
+            name = f"{_first_names[i // 5 % len(_first_names)]} {_last_names[i // 5 % len(_last_names)]}".strip()
+            groups.append({"name": name, "count": len(contacts),
+                           "last_contact_at": contacts[0]['created_at'] if contacts else None,
+                           "contacts": contacts, "contact_ids": [contact['id'] for contact in contacts]})
+        return {"cached": False, "groups": groups}
+
+    def _settings(self, account, data, query):
+        return dict(account['settings'])
+
+    def _update_settings(self, account, data, query):
+        account['settings'].update(data)
+        return dict(account['settings'])
+
+    def _hidden_names(self, account, data, query):
+        return {"names": [], "count": 0, "contact_ids": []}
+
+    def _suspend(self, account, data, query):
+        account['settings']['contact_suspended'] = True
+        return {'contact_suspended': True}
+
+    def _remove_user(self, account, data, query):
+        del self._accounts[account['phone_number']]
+        return {}
+
+    def _comments_list(self, account, data, query, uuid):
+        return {"comments": [comment for comment in self._comments.values() if comment['uuid'] == uuid],
+                "count": sum(comment['uuid'] == uuid for comment in self._comments.values()), "user_comment": None}
+
+    def _comment_add(self, account, data, query, uuid):
+        comment_id = len(self._comments) + 1
+        self._comments[comment_id] = {"like_count": 0, "status": "waiting", "message": data.get('message'),
+                                      "author": dict(account['user']), "is_liked": False, "id": comment_id,
+                                      "comments_blocked": False, "uuid": uuid}
+        return {'id': comment_id, 'status': 'waiting'}
+
+    def _comment_retrieve(self, account, data, query, id):
+        comment = self._comments.get(int(id))
+        return comment if comment else (404, {'detail': 'Not found.'})
+
+    def _comment_approve(self, account, data, query, id):
+        comment = self._comments.get(int(id))
+        if comment is None:
+            return 404, {'detail': 'Not found.'}
+        comment['status'] = 'approved'
+        return {'status': 'approved'}
+
+    def _comment_ignore(self, account, data, query, id):
+        comment = self._comments.get(int(id))
+        if comment is None:
+            return 404, {'detail': 'Not found.'}
+        comment['status'] = 'ignored'
+        return {'status': 'ignored'}
+
+    def _comment_like(self, account, data, query, id):
+        comment = self._comments.get(int(id))
+        if comment is None:
+            return 404, {'detail': 'Not found.'}
+        comment['like_count'] += 1
+        return {'success': True}
+
+    def _social_add(self, account, data, query, endpoint):
+        social = account['social'].get(data.get('social_name'))
+        if social is None:
+            return 400, {'detail': 'Unknown social.'}
+        social.update(profile_id=data.get('profile_id') or data.get('code_first'), is_active=True, is_hidden=False)
+        if endpoint == 'update-url':
+            return self._socials(account, data, query)
+        return {'success': True}
+
+    def _socials(self, account, data, query):
+        return {name: dict(value) for name, value in account['social'].items()}
+
+    def _social_delete(self, account, data, query):
+        social = account['social'].get(data.get('social_name'))
+        if social is None:
+            return 400, {'detail': 'Unknown social.'}
+        social.update(profile_id=None, is_active=False, is_hidden=True, posts=[])
+        return {'success': True}
+
+    def _social_hide(self, account, data, query):
+        social = account['social'].get(data.get('social_name'))
+        if social is None:
+            return 400, {'detail': 'Unknown social.'}
+        social['is_hidden'] = not social['is_hidden']
+        return {'is_hidden': social['is_hidden']}
+
+    def _notifications_count(self, account, data, query):
+        return {'count': sum(not notification['is_read'] for notification in account['notifications'])}
+
+    def _notifications(self, account, data, query):
+        page, page_size = max(int(query.get('page', 1)), 1), max(int(query.get('page_size', 20)), 1)
+        notifications = account['notifications']
+        categories = query.get('categories')
+        if categories:
+            categories = set(unquote(categories).strip('[]').replace(' ', '').split(','))
+            notifications = [notification for notification in notifications if notification['message_category'] in categories]
+        start = (page - 1) * page_size
+        url = f"{self.base_url}/notification/notification/items/?page={{}}&page_size={page_size}&status=distributed"
+        return {
+            "count": len(notifications),
+            "next": url.format(page + 1) if start + page_size < len(notifications) else None,
+            "previous": url.format(page - 1) if page > 1 else None,
+            "results": notifications[start:start + page_size],
+        }
+
+    def _read_notification(self, account, data, query):
+        for notification in account['notifications']:
+            if notification['id'] == data.get('notification_id'):
+                notification['is_read'] = True
+                return {'is_read': True}
+        return 404, {'detail': 'Not found.'}
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'  # Keep-alive, like the real server.
+    disable_nagle_algorithm = True  # Headers and body are written separately, Nagle would delay the body by ~40ms.
+    api: FakeMeApi = None
+
+    def _handle(self):
+        length = int(self.headers.get('content-length') or 0)
+        body = self.rfile.read(length) if length else b''
+        delay = self.api.delay()
+        if delay:
+            sleep(delay)
+        status, headers, content = self.api.handle(self.command, self.path, body,
+                                                   {key.lower(): value for key, value in self.headers.items()})
+        self.send_response(status)
+        for key, value in headers.items():
+            self.send_header(key, value)
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        try:
+            self.wfile.write(content)
+        except (BrokenPipeError, ConnectionResetError):  # The client gave up (Timeout or deadline).
+            self.close_connection = True
+
+    do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = _handle
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _HTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128  # The default (5) drops connections of concurrent clients.
+
+
+class MeTestServer:
+    """
+    Serve a :py:class:`FakeMeApi` over HTTP on localhost, in a background thread.
+
+    :param api: The stand-in api. Default: ``None`` (:py:class:`FakeMeApi` defaults).
+    :type api: Union[FakeMeApi, None]
+    :param host: Host to listen on. Default: ``127.0.0.1``.
+    :type host: str
+    :param port: Port to listen on. Default: ``0`` (Random free port).
+    :type port: int
+    """
+    def __init__(self, api: Union[FakeMeApi, None] = None, host: str = '127.0.0.1', port: int = 0):
+        self.api = api or FakeMeApi()
+        handler = type('RequestHandler', (_RequestHandler,), {'api': self.api})
+        self._server = _HTTPServer((host, port), handler)
+        self._thread = None
+        self.api.base_url = self.url
+
+    @property
+    def url(self) -> str:
+        """
+        Base url of the server, to use as ``base_url`` of a transport.
+        """
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> 'MeTestServer':
+        """
+        Start serving in a background thread.
+        """
+        if self._thread is None:
+            self._thread = Thread(target=self._server.serve_forever, name='meapi-test-server', daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        """
+        Stop serving and close the socket.
+        """
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._server.server_close()
+
+    def transport(self, **kwargs) -> RequestsTransport:
+        """
+        Get a transport for :py:class:`~meapi.Me` that sends the requests to this server.
+
+        :param kwargs: Arguments of :py:class:`~meapi.transport.RequestsTransport`.
+        :rtype: RequestsTransport
+        """
+        return RequestsTransport(base_url=self.url, **kwargs)
+
+    def async_transport(self, **kwargs) -> 'AiohttpTransport':
+        """
+        Get a transport for :py:class:`~meapi.AsyncMe` that sends the requests to this server.
+
+        :param kwargs: Arguments of :py:class:`~meapi.aio.transport.AiohttpTransport`.
+        :rtype: AiohttpTransport
+        """
+        from meapi.aio.transport import AiohttpTransport
+        return AiohttpTransport(base_url=self.url, **kwargs)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+
+class InProcessTransport(Transport):
+    """
+    Transport that calls a :py:class:`FakeMeApi` directly, without sockets. Measures the client side only.
+
+    :param api: The stand-in api. Default: ``None`` (:py:class:`FakeMeApi` defaults).
+    :type api: Union[FakeMeApi, None]
+    """
+    def __init__(self, api: Union[FakeMeApi, None] = None):
+        self.api = api or FakeMeApi()
+
+    def request(self, method, endpoint, body=None, headers=None, timeout=(None, None)) -> TransportResponse:
+        delay = self.api.delay()
+        if delay:
+            sleep(delay)
+        status, response_headers, content = self.api.handle(method, endpoint, body or b'',
+                                                            {key.lower(): value for key, value in (headers or {}).items()})
+        return TransportResponse(status, content, {key.lower(): value for key, value in response_headers.items()})
+
+
+class AsyncInProcessTransport(AsyncTransport):
+    """
+    Async version of :py:class:`InProcessTransport`, for :py:class:`~meapi.AsyncMe`.
+
+    :param api: The stand-in api. Default: ``None`` (:py:class:`FakeMeApi` defaults).
+    :type api: Union[FakeMeApi, None]
+    """
+    def __init__(self, api: Union[FakeMeApi, None] = None):
+        self.api = api or FakeMeApi()
+
+    async def request(self, method, endpoint, body=None, headers=None, timeout=(None, None),
+                      total_timeout=None) -> TransportResponse:
+        delay = self.api.delay()
+        if delay:
+            await async_sleep(delay)
+        status, response_headers, content = self.api.handle(method, endpoint, body or b'',
+                                                            {key.lower(): value for key, value in (headers or {}).items()})
+        return TransportResponse(status, content, {key.lower(): value for key, value in response_headers.items()})
@@ -0,0 +1,406 @@
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from inspect import isfunction, iscoroutinefunction, isgeneratorfunction, isasyncgenfunction
+from json import dumps
+from queue import Queue, Full, Empty
+from random import getrandbits
+from threading import Lock, Thread
+from time import perf_counter, time
+from typing import Dict, Iterator, List, Union
+
+_current_span = ContextVar('meapi_span', default=None)
+_epoch_offset = time() - perf_counter()
+# Methods that are not traced: make_request has its own span, the others do no I/O.
+_untraced = {'make_request', 'valid_phone_number', 'deadline', 'close'}
+
+
+class Span:
+    """
+    A timed operation, with the spans of the operations it made as ``children``.
+
+    - ``name``: Method name (``get_uuid``), request (``GET /main/users/profile/{uuid}``), ``attempt``, ``token_refresh``, ``decode``,
+      or a phase of an attempt: ``dns``, ``connect`` (Including TLS), ``send``, ``wait`` (For the server) and ``receive``.
+    - ``attributes``: Details like ``status``, ``attempts`` and ``endpoint``.
+    - ``error``: ``None`` on success, else the status (``'502'``) or the exception name.
+    """
+    __slots__ = ('name', 'trace_id', 'span_id', 'parent_id', 'attributes', 'children', 'start', 'end', 'error',
+                 '_parent', '_token')
+
+    def __init__(self, name: str, parent: Union['Span', None] = None, attributes: Union[dict, None] = None,
+                 start: Union[float, None] = None, end: Union[float, None] = None):
+        self.name = name
+        self.trace_id = parent.trace_id if parent is not None else '%032x' % getrandbits(128)
+        self.span_id = '%016x' % getrandbits(64)
+        self.parent_id = parent.span_id if parent is not None else None
+        self.attributes = attributes or {}
+        self.children: List[Span] = []
+        self.start = perf_counter() if start is None else start
+        self.end = end
+        self.error = None
+        self._parent = parent
+        self._token = None
+
+    @property
+    def duration(self) -> Union[float, None]:
+        """
+        Seconds of the span, ``None`` if it did not end yet.
+        """
+        return None if self.end is None else self.end - self.start
+
+    @property
+    def start_time(self) -> float:
+        """
+        Start of the span as a unix timestamp.
+        """
+        return _epoch_offset + self.start
+
+    def walk(self) -> Iterator['Span']:
+        """
+        Iterate over the span and all its descendants.
+        """
+        yield self
+        for child in self.children:
+            yield from child.walk()
+
+    def to_dict(self) -> dict:
+        """
+        Get the span and its children as a dict (JSON-serializable if the attributes are).
+
+        :rtype: dict
+        """
+        return {'name': self.name, 'trace_id': self.trace_id, 'span_id': self.span_id, 'parent_id': self.parent_id,
+                'start': self.start_time, 'duration': self.duration, 'attributes': self.attributes, 'error': self.error,
+                'children': [child.to_dict() for child in self.children]}
+
+    def format(self) -> str:
+        """
+        Get the span tree as indented text, with the duration of each span in ms.
+
+        Example::
+
+            switch_social_status 412.1ms
+              get_socials 201.7ms
+                GET /main/users/profile/me/ 201.5ms status=200 attempts=1
+                  attempt 198.9ms status=200
+                    connect 61.2ms
+                    send 0.2ms
+                    wait 131.0ms
+                    receive 6.4ms
+                  decode 1.8ms
+              ...
+
+        :rtype: str
+        """
+        lines = []
+
+        def add(span: Span, depth: int):
+            duration = '...' if span.end is None else f"{round(span.duration * 1000, 1)}ms"
+            details = ' '.join(f"{key}={value}" for key, value in span.attributes.items() if key != 'endpoint')
+            error = f" error={span.error}" if span.error is not None else ''
+            lines.append(f"{'  ' * depth}{span.name} {duration}{' ' + details if details else ''}{error}")
+            for child in span.children:
+                add(child, depth + 1)
+
+        add(self, 0)
+        return '\n'.join(lines)
+
+    def __repr__(self):
+        return f"<Span {self.name} duration={self.duration}>"
+
+
+def current_span() -> Union[Span, None]:
+    """
+    Get the span that is open in the current thread / asyncio task, ``None`` if there is none.
+    """
+    return _current_span.get()
+
+
+def record_phase(name: str, start: Union[float, None] = None, end: Union[float, None] = None):
+    """
+    Add a finished child span to the current span. Used by transports to report the phases of an attempt.
+
+    :param name: Name of the phase: ``dns``, ``connect``, ``send``, ``wait`` or ``receive``.
+    :type name: str
+    :param start: ``time.perf_counter()`` at the start. Default: ``None`` (The end of the previous phase).
+    :type start: Union[float, None]
+    :param end: ``time.perf_counter()`` at the end. Default: ``None`` (Now).
+    :type end: Union[float, None]
+    """
+    span = _current_span.get()
+    if span is None:
+        return
+    if end is None:
+        end = perf_counter()
+    if start is None:
+        start = span.children[-1].end if span.children else span.start
+    span.children.append(Span(name, span, None, start, end))
+
+
+def _error_name(err: BaseException) -> str:
+    http_status = getattr(err, 'http_status', None)
+    return str(http_status) if http_status is not None else type(err).__name__
+
+
+class MemoryExporter:
+    """
+    Keep the last traces in memory.
+
+    :param max_traces: Max traces to keep. Default: ``1000``.
+    :type max_traces: int
+    """
+    def __init__(self, max_traces: int = 1000):
+        self.traces = deque(maxlen=max_traces)
+
+    def export(self, span: Span):
+        self.traces.append(span)
+
+
+class FileExporter:
+    """
+    Append each trace to a file as one JSON line (See :py:func:`Span.to_dict`).
+
+    :param trace_file: Path of the file.
+    :type trace_file: str
+    """
+    def __init__(self, trace_file: str):
+        self.trace_file = trace_file
+        self._lock = Lock()
+
+    def export(self, span: Span):
+        line = dumps(span.to_dict(), default=str) + '\n'
+        with self._lock:
+            with open(self.trace_file, 'a', encoding='utf-8') as trace_file:
+                trace_file.write(line)
+
+
+class OTLPExporter:
+    """
+    Send the traces to a local OpenTelemetry collector (Jaeger, Grafana Tempo, the OpenTelemetry Collector), with OTLP/HTTP JSON.
+
+    - The traces are sent by a background thread, so the calls do not wait for the collector.
+    - If the collector is down, traces are dropped and an error is printed.
+
+    :param url: OTLP/HTTP traces endpoint. Default: ``http://127.0.0.1:4318/v1/traces``.
+    :type url: str
+    :param service_name: ``service.name`` of the traces. Default: ``meapi``.
+    :type service_name: str
+    :param timeout: Seconds to wait for the collector. Default: ``5``.
+    :type timeout: float
+    :param max_queue: Max traces waiting to be sent, more are dropped. Default: ``1000``.
+    :type max_queue: int
+    """
+    def __init__(self, url: str = 'http://127.0.0.1:4318/v1/traces', service_name: str = 'meapi', timeout: float = 5,
+                 max_queue: int = 1000):
+        self.url = url
+        self.service_name = service_name
+        self.timeout = timeout
+        self._queue = Queue(maxsize=max_queue)
+        self._thread = None
+        self._thread_lock = Lock()
+        self._failing = False
+
+    def export(self, span: Span):
+        if self._thread is None:
+            with self._thread_lock:
+                if self._thread is None:
+                    self._thread = Thread(target=self._run, name='meapi-otlp-exporter', daemon=True)
+                    self._thread.start()
+        try:
+            self._queue.put_nowait(span)
+        except Full:
+            pass
+
+    def flush(self):
+        """
+        Wait until the queued traces are sent.
+        """
+        if self._thread is not None:
+            self._queue.join()
+
+    def payload(self, spans: List[Span]) -> dict:
+        """
+        Get the OTLP JSON payload of traces.
+
+        :param spans: Root spans.
+        :type spans: List[Span]
+        :rtype: dict
+        """
+        def value(attribute) -> dict:
+            if isinstance(attribute, bool):
+                return {'boolValue': attribute}
+            if isinstance(attribute, int):
+                return {'intValue': str(attribute)}
+            if isinstance(attribute, float):
+                return {'doubleValue': attribute}
+            return {'stringValue': str(attribute)}
+
+        otlp_spans = []
+        for root in spans:
+            for span in root.walk():
+                otlp_span = {
+                    'traceId': span.trace_id, 'spanId': span.span_id, 'name': span.name, 'kind': 3,
+                    'startTimeUnixNano': str(int(span.start_time * 1e9)),
+                    'endTimeUnixNano': str(int((span.start_time + (span.duration or 0)) * 1e9)),
+                    'attributes': [{'key': key, 'value': value(attribute)} for key, attribute in span.attributes.items()],
+                    'status': {'code': 2, 'message': span.error} if span.error is not None else {'code': 1}}
+                if span.parent_id is not None:
+                    otlp_span['parentSpanId'] = span.parent_id
+                otlp_spans.append(otlp_span)
+        return {'resourceSpans': [{
+            'resource': {'attributes': [{'key': 'service.name', 'value': {'stringValue': self.service_name}}]},
+            'scopeSpans': [{'scope': {'name': 'meapi'}, 'spans': otlp_spans}]}]}
+
+    def _run(self):
+        from urllib.request import Request, urlopen
+        while True:
+            spans = [self._queue.get()]
+            while len(spans) < 100:
+                try:
+                    spans.append(self._queue.get_nowait())
+                except Empty:
+                    break
+            try:
+                request = Request(self.url, data=dumps(self.payload(spans)).encode(),
+                                  headers={'content-type': 'application/json'}, method='POST')
+                with urlopen(request, timeout=self.timeout) as response:
+                    response.read()
+                self._failing = False
+            except Exception as err:
+                if not self._failing:  # Print once until the collector is back.
+                    print(f"Failed to send traces to {self.url}: {err}")
+                self._failing = True
+            finally:
+                for _ in spans:
+                    self._queue.task_done()
+
+
+class Tracer:
+    """
+    Trace the calls of :py:class:`~meapi.Me` (See ``tracer`` in :py:class:`~meapi.Me`): each public method gets a span, with nested spans
+    for the methods it calls and the requests it makes. Each request has spans for its attempts (With the ``dns``, ``connect``, ``send``,
+    ``wait`` and ``receive`` phases), the token refresh and the JSON decode.
+
+    - Exporters get each finished trace (Root :py:class:`Span`): :py:class:`MemoryExporter`, :py:class:`FileExporter`,
+      :py:class:`OTLPExporter` or any object with an ``export`` method.
+    - Without ``tracer`` nothing is traced.
+    - Spans belong to the current thread / asyncio task. Calls in other threads start their own traces.
+    - The phases are measured by the default transports with their own sessions (:py:func:`~meapi.util.create_session` and :py:func:`~meapi.aio.util.create_async_session`).
+
+    :param exporters: Exporters of the traces. Default: ``None`` (One :py:class:`MemoryExporter`).
+    :type exporters: Union[List[object], None]
+
+    Example::
+
+        tracer = Tracer([MemoryExporter(), FileExporter('traces.jsonl')])
+        me = Me(phone_number=972123456789, tracer=tracer)
+        me.switch_social_status('spotify', True)
+        print(tracer.traces[-1].format())
+    """
+    def __init__(self, exporters: Union[List[object], None] = None):
+        self.exporters = list(exporters) if exporters is not None else [MemoryExporter()]
+
+    @property
+    def traces(self) -> List[Span]:
+        """
+        Traces of the first :py:class:`MemoryExporter`. Empty if there is none.
+        """
+        for exporter in self.exporters:
+            if isinstance(exporter, MemoryExporter):
+                return list(exporter.traces)
+        return []
+
+    def start(self, name: str, **attributes) -> Span:
+        """
+        Start a span, as a child of the current span. It must be ended with :py:func:`finish` in the same thread / task.
+
+        :param name: Name of the span.
+        :type name: str
+        :rtype: Span
+        """
+        span = Span(name, _current_span.get(), attributes)
+        span._token = _current_span.set(span)
+        return span
+
+    def finish(self, span: Span, error: Union[str, None] = None):
+        """
+        End a span. A root span is passed to the exporters.
+
+        :param span: The span from :py:func:`start`.
+        :type span: Span
+        :param error: Status or exception name, if it failed. Default: ``None``.
+        :type error: Union[str, None]
+        """
+        span.end = perf_counter()
+        span.error = error
+        _current_span.reset(span._token)
+        if span._parent is not None:
+            span._parent.children.append(span)
+        else:
+            self.export(span)
+
+    @contextmanager
+    def span(self, name: str, **attributes) -> Iterator[Span]:
+        """
+        Trace the block as a span. Use it to group several calls under one trace.
+
+        :param name: Name of the span.
+        :type name: str
+
+        Example::
+
+            with tracer.span('sync-contacts', count=len(contacts)):
+                me.add_contacts(contacts)
+                me.get_saved_contacts()
+        """
+        span = self.start(name, **attributes)
+        try:
+            yield span
+        except BaseException as err:
+            self.finish(span, _error_name(err))
+            raise
+        self.finish(span)
+
+    def export(self, span: Span):
+        for exporter in self.exporters:
+            try:
+                exporter.export(span)
+            except Exception as err:  # A broken exporter must not fail the call.
+                print(f"Failed to export trace to {type(exporter).__name__}: {err}")
+
+
+def _traced_method(func):
+    if iscoroutinefunction(func):
+        @wraps(func)
+        async def wrapper(self, *args, **kwargs):
+            if self.tracer is None:
+                return await func(self, *args, **kwargs)
+            with self.tracer.span(func.__name__):
+                return await func(self, *args, **kwargs)
+    else:
+        @wraps(func)
+        def wrapper(self, *args, **kwargs):
+            if self.tracer is None:
+                return func(self, *args, **kwargs)
+            with self.tracer.span(func.__name__):
+                return func(self, *args, **kwargs)
+    return wrapper
+
+
+def trace_methods(cls: type) -> type:
+    """
+    Class decorator: wrap the public methods of the class and its mixins with a span, when ``self.tracer`` is set.
+    """
+    traced: Dict[str, object] = {}
+    for klass in reversed(cls.__mro__[:-1]):
+        for name, attribute in vars(klass).items():
+            if name.startswith('_') or name in _untraced:
+                continue
+            if isfunction(attribute) and not isgeneratorfunction(attribute) and not isasyncgenfunction(attribute):
+                traced[name] = attribute
+            else:  # Overridden by a property or an iterator.
+                traced.pop(name, None)
+    for name, func in traced.items():
+        setattr(cls, name, _traced_method(func))
+    return cls
@@ -0,0 +1,113 @@
+from typing import Mapping, Tuple, Union
+from requests import Session
+from requests.exceptions import ConnectionError as RequestsConnectionError, Timeout
+from meapi.tracing import record_phase
+from meapi.util import ME_BASE_API, create_session
+
+
+class TransportResponse:
+    """
+    HTTP response returned by a :py:class:`Transport`.
+
+    :param status_code: HTTP status code.
+    :type status_code: int
+    :param content: Raw body of the response.
+    :type content: bytes
+    :param headers: Response headers. Lookups are done with lower-case names (``retry-after``).
+    :type headers: Mapping[str, str]
+    :param reason: HTTP reason phrase. Default: ``None``.
+    :type reason: Union[str, None]
+    """
+    __slots__ = ('status_code', 'content', 'headers', 'reason')
+
+    def __init__(self, status_code: int, content: bytes, headers: Mapping[str, str], reason: Union[str, None] = None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers
+        self.reason = reason
+
+    @property
+    def text(self) -> str:
+        """
+        The body decoded as UTF-8.
+        """
+        return self.content.decode('utf-8', errors='replace')
+
+
+class Transport:
+    """
+    Base class for the transports that send the requests of :py:class:`~meapi.Me` (See ``transport`` in :py:class:`~meapi.Me`).
+
+    - Subclass it and implement :py:func:`request` to send the requests elsewhere (A stand-in server, a recorder, another HTTP library).
+    - ``errors`` are the exceptions of failed connections and timeouts, which :py:class:`~meapi.RetryPolicy` retries.
+    """
+    base_url: str = ME_BASE_API
+    errors: Tuple[type, ...] = (ConnectionError, TimeoutError)
+
+    def request(self,
+                method: str,
+                endpoint: str,
+                body: Union[bytes, None] = None,
+                headers: Union[dict, None] = None,
+                timeout: Tuple[Union[float, None], Union[float, None]] = (None, None)) -> TransportResponse:
+        """
+        Send a request.
+
+        :param method: HTTP request type: ``post``, ``get``, ``put``, ``patch``, ``delete``.
+        :type method: str
+        :param endpoint: api endpoint (Path and query string).
+        :type endpoint: str
+        :param body: The JSON body of the request, already encoded. Default: ``None``.
+        :type body: Union[bytes, None]
+        :param headers: Request headers. Default: ``None``.
+        :type headers: Union[dict, None]
+        :param timeout: Tuple of connect and read timeouts in seconds (``None`` to wait forever). Default: ``(None, None)``.
+        :type timeout: Tuple[Union[float, None], Union[float, None]]
+        :return: The response.
+        :rtype: TransportResponse
+        """
+        raise NotImplementedError
+
+    def close(self):
+        """
+        Release the resources of the transport.
+        """
+
+
+class RequestsTransport(Transport):
+    """
+    The default transport: ``requests`` with a keep-alive connection pool.
+
+    :param session: Shared keep-alive session, see :py:func:`~meapi.util.create_session`. Default: ``None`` (New session, closed on :py:func:`close`).
+    :type session: Union[requests.Session, None]
+    :param base_url: Base url of the api. Default: ``https://app.mobile.me.app``.
+    :type base_url: str
+    :param proxies: Dict with proxy configuration. Default: ``None``.
+    :type proxies: Union[dict, None]
+    :param pool_connections: Number of hosts to keep connection pools for, when creating a new session. Default: ``10``.
+    :type pool_connections: int
+    :param pool_maxsize: Max connections to keep open for each host, when creating a new session. Default: ``10``.
+    :type pool_maxsize: int
+    """
+    errors = (RequestsConnectionError, Timeout)
+
+    def __init__(self,
+                 session: Union[Session, None] = None,
+                 base_url: str = ME_BASE_API,
+                 proxies: Union[dict, None] = None,
+                 pool_connections: int = 10,
+                 pool_maxsize: int = 10):
+        self.base_url = base_url
+        self.proxies = proxies
+        self._own_session = session is None
+        self.session = session or create_session(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+
+    def request(self, method, endpoint, body=None, headers=None, timeout=(None, None)) -> TransportResponse:
+        response = self.session.request(method=method, url=self.base_url + endpoint, data=body, headers=headers,
+                                        proxies=self.proxies, timeout=timeout)
+        record_phase('receive')
+        return TransportResponse(response.status_code, response.content, response.headers, response.reason)
+
+    def close(self):
+        if self._own_session:
+            self.session.close()
@@ -1,10 +1,174 @@
-from json import loads, JSONDecodeError
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from json import dumps, loads
 from re import match, sub
-from typing import Union
-from requests import patch, delete, put, get, post
-from meapi.exceptions import MeException, MeApiException
+from typing import Callable, Dict, List, Union
+from time import sleep, monotonic, perf_counter
+from requests import Session
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from meapi.exceptions import MeException, MeApiException, MeConnectionException, MeDeadlineException
+from meapi.metrics import RequestMetric, endpoint_template
+from meapi.tracing import record_phase
+
+try:
+    from orjson import dumps as orjson_dumps, loads as orjson_loads, OPT_NON_STR_KEYS
+except ImportError:
+    orjson_dumps = orjson_loads = OPT_NON_STR_KEYS = None
 
 ME_BASE_API = 'https://app.mobile.me.app'
+REQUEST_TYPES = ['post', 'get', 'put', 'patch', 'delete']
+HOOK_EVENTS = ('before_request', 'after_response')
+JSON_BACKEND = 'json' if orjson_loads is None else 'orjson'
+_deadline = ContextVar('meapi_deadline', default=None)
+
+
+class _TimedConnectionMixin:
+    # Report the connect, send and wait phases of the requests to the current trace span.
+    _connected_at = 0.0
+
+    def connect(self):
+        start = perf_counter()
+        super().connect()
+        self._connected_at = perf_counter()
+        record_phase('connect', start, self._connected_at)
+
+    def request(self, *args, **kwargs):
+        start = perf_counter()
+        super().request(*args, **kwargs)
+        record_phase('send', max(start, self._connected_at))  # Plain http connects inside request().
+
+    def getresponse(self, *args, **kwargs):
+        start = perf_counter()
+        response = super().getresponse(*args, **kwargs)
+        record_phase('wait', start)
+        return response
+
+
+class _TimedHTTPConnection(_TimedConnectionMixin, HTTPConnection):
+    pass
+
+
+class _TimedHTTPSConnection(_TimedConnectionMixin, HTTPSConnection):
+    pass
+
+
+class _TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _TimedHTTPConnection
+
+
+class _TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _TimedHTTPSConnection
+
+
+class _TimedHTTPAdapter(HTTPAdapter):
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {'http': _TimedHTTPConnectionPool, 'https': _TimedHTTPSConnectionPool}
+
+
+def create_session(pool_connections: int = 10, pool_maxsize: int = 10, pool_block: bool = False) -> Session:
+    """
+    Create a keep-alive HTTP session with a connection pool. The session can be shared between several :py:class:`~meapi.Me` instances.
+
+    :param pool_connections: Number of hosts to keep connection pools for. Default: ``10``.
+    :type pool_connections: int
+    :param pool_maxsize: Max connections to keep open for each host. Default: ``10``.
+    :type pool_maxsize: int
+    :param pool_block: Block when the pool of a host is full instead of opening a new (not pooled) connection. Default: ``False``.
+    :type pool_block: bool
+    :return: requests Session (Reports the ``connect``, ``send`` and ``wait`` phases to :py:class:`~meapi.Tracer`).
+    :rtype: requests.Session
+    """
+    session = Session()
+    adapter = _TimedHTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, pool_block=pool_block)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+def _default_headers() -> dict:
+    return {'accept-encoding': 'gzip', 'user-agent': 'okhttp/4.9.1',
+            'content-type': 'application/json; charset=UTF-8'}
+
+
+def _clean_phone_number(phone_number: Union[str, int, None]) -> Union[int, None]:
+    # The rules of Util.valid_phone_number, returning None instead of raising.
+    if phone_number:
+        phone_number = sub(r'[\D]', '', str(phone_number))
+        if match(r"^\d{9,15}$", phone_number):
+            return int(phone_number)
+    return None
+
+
+def _setup_hooks(hooks: Union[Dict[str, Union[Callable, List[Callable]]], None]) -> Dict[str, List[Callable]]:
+    hooks = hooks or {}
+    unknown = set(hooks) - set(HOOK_EVENTS)
+    if unknown:
+        raise MeException(f"Unknown hook events: {', '.join(unknown)}. Available events: {', '.join(HOOK_EVENTS)}")
+    return {event: [hooks[event]] if callable(hooks.get(event)) else list(hooks.get(event) or ())
+            for event in HOOK_EVENTS}
+
+
+def _json_dumps(obj) -> bytes:
+    if orjson_dumps is not None:
+        try:
+            return orjson_dumps(obj, option=OPT_NON_STR_KEYS)
+        except TypeError:  # Types that orjson does not support, like integers over 64 bits.
+            pass
+    return dumps(obj, separators=(',', ':')).encode()
+
+
+def _json_loads(data: Union[bytes, str]) -> Union[dict, list, str, int, float, bool, None]:
+    # Both backends decode the raw bytes directly, without building a str first.
+    return orjson_loads(data) if orjson_loads is not None else loads(data)
+
+
+def _encode_body(body) -> Union[bytes, None]:
+    return _json_dumps(body) if body is not None else None
+
+
+def _decode_response(status_code: int, content: bytes) -> Union[dict, list, str]:
+    try:
+        return _json_loads(content)
+    except ValueError:  # JSONDecodeError of both backends, and UnicodeDecodeError.
+        text = content.decode('utf-8', errors='replace')
+        if status_code >= 400:  # Error pages (proxies, load balancers) are not always JSON.
+            return text
+        raise MeException(f"The response (Status code: {status_code}) received does not contain a valid JSON:\n" + text)
+
+
+def _api_error(status_code: int, response_json: Union[dict, list, str], reason: str = None,
+               attempts: int = 1, waited: float = 0.0) -> MeApiException:
+    if isinstance(response_json, dict):
+        msg = response_json.get('detail') or response_json.get('phone_number') or response_json
+    else:
+        msg = response_json
+    return MeApiException(status_code, str(msg), reason, attempts=attempts, waited=waited)
+
+
+def _remaining_time() -> Union[float, None]:
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+    remaining = deadline - monotonic()
+    if remaining <= 0:
+        raise MeDeadlineException("The deadline of the call exceeded.")
+    return remaining
+
+
+def _fit_delay(delay: Union[float, None]) -> Union[float, None]:
+    remaining = _remaining_time()
+    if delay is not None and remaining is not None and delay >= remaining:
+        raise MeDeadlineException(f"The deadline of the call exceeded (No time left to retry in {round(delay, 2)}s).")
+    return delay
+
+
+def _min_timeout(timeout: Union[float, None], remaining: Union[float, None]) -> Union[float, None]:
+    if remaining is None:
+        return timeout
+    return remaining if timeout is None else min(timeout, remaining)
 
 
 class Util:
@@ -20,11 +184,10 @@ class Util:
         :return: fixed phone number
         :rtype: int
         """
-        if phone_number:
-            phone_number = sub(r'[\D]', '', str(phone_number))
-            if match(r"^\d{9,15}$", phone_number):
-                return int(phone_number)
-        raise MeException("Not a valid phone number! " + phone_number)
+        clean_number = _clean_phone_number(phone_number)
+        if clean_number is None:
+            raise MeException("Not a valid phone number! " + str(phone_number))
+        return clean_number
 
     def make_request(self,
                      req_type: str,
@@ -45,42 +208,128 @@ class Util:
         :param headers: Use different headers instead of the default.
         :type headers: dict
         :param auth: Do use access token in this request? Default: ``True``.
-        :raises MeApiException: If HTTP status is bigger than ``400``.
+        :raises MeApiException: If HTTP status is bigger than ``400`` (After the retries of :py:class:`~meapi.RetryPolicy`).
+        :raises MeConnectionException: If the request failed to connect or timed out (After the retries).
+        :raises MeDeadlineException: If the :py:func:`deadline` of the call exceeded.
         :return: API response as dict or list.
         :rtype: Union[dict, list]
+
+        Hooks (See ``hooks`` in :py:class:`~meapi.Me`) run on every attempt:
+         - ``before_request(method, endpoint, body, headers)``: ``body`` is the encoded JSON (``bytes`` or ``None``), ``headers`` can be changed.
+         - ``after_response(method, endpoint, response)``: ``response`` is a :py:class:`~meapi.transport.TransportResponse`.
         """
-        url = ME_BASE_API + endpoint
-        request_types = ['post', 'get', 'put', 'patch', 'delete']
-        if req_type not in request_types:
-            raise MeException("Request type not in requests type list!!\nAvailable types: " + ", ".join(request_types))
+        if req_type not in REQUEST_TYPES:
+            raise MeException("Request type not in requests type list!!\nAvailable types: " + ", ".join(REQUEST_TYPES))
         if headers is None:
-            headers = {'accept-encoding': 'gzip', 'user-agent': 'okhttp/4.9.1',
-                       'content-type': 'application/json; charset=UTF-8'}
-        max_rounds = 3
-        while max_rounds != 0:
-            max_rounds -= 1
-            if headers and auth:
-                headers['authorization'] = self.access_token
-            if req_type == 'post':
-                response = post(url=url, json=body, headers=headers, proxies=self.proxies)
-            elif req_type == 'get':
-                response = get(url=url, json=body, headers=headers, proxies=self.proxies)
-            elif req_type == 'put':
-                response = put(url=url, json=body, headers=headers, proxies=self.proxies)
-            elif req_type == 'delete':
-                response = delete(url=url, json=body, headers=headers, proxies=self.proxies)
-            elif req_type == 'patch':
-                response = patch(url=url, json=body, headers=headers, proxies=self.proxies)
-            try:
-                response_text = loads(response.text)
-            except JSONDecodeError:
-                raise MeException(f"The response (Status code: {response.status_code}) received does not contain a valid JSON:\n" + str(response.text))
-            if response.status_code == 403 and self.phone_number:
-                self.generate_access_token()
-                continue
-
-            if response.status_code >= 400:
-                raise MeApiException(response.status_code, str(response_text.get('detail') or response_text.get('phone_number') or response_text), response.reason)
-            return response_text
-        else:
-            raise MeException(f"Error when trying to send a {req_type} request to {url}, with body:\n{body} and with headers:\n{headers}.")
+            headers = _default_headers()
+        if auth and not self.access_token:
+            self._login()
+        data = _encode_body(body)
+        attempts, retries, waited, token_refreshes, bytes_in = 0, 0, 0.0, 0, 0
+        started, status, error = monotonic(), None, None
+        tracer = self.tracer
+        span = tracer.start(f"{req_type.upper()} {endpoint_template(endpoint)}", endpoint=endpoint) if tracer else None
+        try:
+            while True:
+                attempts += 1
+                remaining = _remaining_time()
+                timeout = (_min_timeout(self.connect_timeout, remaining), _min_timeout(self.read_timeout, remaining))
+                if headers and auth:
+                    headers['authorization'] = self.access_token
+                for hook in self.hooks['before_request']:
+                    hook(req_type, endpoint, data, headers)
+                try:
+                    with tracer.span('attempt') if tracer else nullcontext() as attempt:
+                        response = self.transport.request(req_type, endpoint, data, headers, timeout=timeout)
+                        if attempt is not None:
+                            attempt.attributes['status'] = response.status_code
+                except self.transport.errors as err:
+                    retries += 1
+                    delay = _fit_delay(self.retry_policy.get_delay(req_type, retries))
+                    if delay is None:
+                        raise MeConnectionException(f"Request failed: {type(err).__name__}: {err}", attempts, waited) from err
+                    sleep(delay)
+                    waited += delay
+                    continue
+                status = response.status_code
+                bytes_in += len(response.content)
+                for hook in self.hooks['after_response']:
+                    hook(req_type, endpoint, response)
+                if status == 403 and self.phone_number and token_refreshes < 2:
+                    token_refreshes += 1
+                    with tracer.span('token_refresh') if tracer else nullcontext():
+                        self._refresh_access_token(headers.get('authorization') if auth else None)
+                    continue
+                if self.retry_policy.is_retryable_status(status):
+                    retries += 1
+                    delay = _fit_delay(self.retry_policy.get_delay(req_type, retries, response.headers.get('retry-after')))
+                    if delay is not None:
+                        sleep(delay)
+                        waited += delay
+                        continue
+
+                with tracer.span('decode', bytes=len(response.content)) if tracer else nullcontext():
+                    response_text = _decode_response(status, response.content)
+                if status >= 400:
+                    raise _api_error(status, response_text, response.reason, attempts, waited)
+                return response_text
+        except BaseException as err:
+            if isinstance(err, MeApiException):
+                error = str(err.http_status)
+            else:  # The name of the transport error, like 'ConnectionError'.
+                error = type(err.__cause__ if isinstance(err, MeConnectionException) else err).__name__
+            raise
+        finally:
+            if span is not None:
+                span.attributes.update(status=status, attempts=attempts, retries=retries)
+                tracer.finish(span, error)
+            if self.metrics is not None:
+                self.metrics.record(RequestMetric(endpoint_template(endpoint), req_type, status, error, monotonic() - started,
+                                                  attempts, retries, token_refreshes,
+                                                  len(data) * attempts if data else 0, bytes_in))
+
+    def _own_profile_key(self) -> Union[str, None]:
+        # The own profile is cached by account, since a cache can be shared by several accounts.
+        account = self.phone_number or self.uuid
+        return f'me:{account}' if account else None
+
+    def _invalidate_own_profile(self):
+        if self.cache is not None:
+            if self._own_profile_key() is not None:
+                self.cache.invalidate('get_profile_info', self._own_profile_key())
+            if self.uuid:
+                self.cache.invalidate('get_profile_info', self.uuid)
+
+    def _consume_quota(self, name: str):
+        if self.quota is None:
+            return
+        while True:
+            wait = self.quota.reserve(name)
+            if not wait:
+                return
+            sleep(_fit_delay(wait))
+
+    @contextmanager
+    def deadline(self, seconds: float):
+        """
+        Limit the total time of the calls inside the ``with`` block, including retries and token refresh.
+
+        - The deadline belongs to the current thread / asyncio task, so it also bounds composite methods like :py:func:`get_uuid`.
+        - Nested deadlines never extend the outer one.
+
+        :param seconds: Time limit in seconds.
+        :type seconds: float
+        :raises MeDeadlineException: If a request inside the block does not finish in time.
+
+        Example::
+
+            with me.deadline(5):
+                results = me.phone_search(972123456789)
+        """
+        deadline = monotonic() + seconds
+        outer = _deadline.get()
+        token = _deadline.set(deadline if outer is None else min(outer, deadline))
+        try:
+            yield
+        finally:
+            _deadline.reset(token)
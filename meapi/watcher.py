@@ -0,0 +1,210 @@
+from datetime import datetime, timezone
+from json import load, dump, JSONDecodeError
+from os import path, replace
+from tempfile import NamedTemporaryFile
+from threading import Event, Thread, current_thread
+from time import monotonic
+from typing import Callable, List, Union
+from meapi.exceptions import MeException
+
+
+class _BaseNotificationWatcher:
+    """
+    The state of a notification watcher (Interval, watermark, counts), shared by the sync and the async watchers.
+    """
+    def __init__(self,
+                 me,
+                 callbacks: Union[List[Callable[[dict], None]], None] = None,
+                 watermark_file: Union[str, None] = None,
+                 min_interval: float = 5,
+                 max_interval: float = 300,
+                 backoff: float = 2,
+                 resync_interval: Union[float, None] = 900,
+                 results_limit: int = 100,
+                 deliver_existing: bool = False,
+                 **filters):
+        self.me = me
+        self.callbacks = list(callbacks or [])
+        self.watermark_file = watermark_file
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.resync_interval = resync_interval
+        self.results_limit = results_limit
+        self.deliver_existing = deliver_existing
+        self.filters = filters
+        self.interval = min_interval
+        self.watermark = self._load_watermark()
+        self._last_count = None
+        self._synced_at = None
+        self._redeliver = False
+
+    def _should_fetch(self, count: int) -> bool:
+        if self._synced_at is None or self._redeliver or count != self._last_count:
+            return True
+        if self.resync_interval is not None and monotonic() - self._synced_at >= self.resync_interval:
+            return True
+        self._back_off()
+        return False
+
+    def _page_size(self, count: int) -> int:
+        if self._last_count is None:
+            return self.results_limit
+        # A few more than the change of the count, for notifications that were read in the meantime.
+        return max(1, min(self.results_limit, count - self._last_count + 5))
+
+    def _fetched(self, count: int, new: List[dict]) -> List[dict]:
+        self._last_count = count
+        self._synced_at = monotonic()
+        self._redeliver = False
+        if new:
+            self.interval = self.min_interval
+        else:
+            self._back_off()
+        return new[::-1]
+
+    def _back_off(self):
+        self.interval = min(self.interval * self.backoff, self.max_interval)
+
+    def _callback_failed(self, callback: Callable, notification: dict, err: Exception):
+        print(f"Notification callback {getattr(callback, '__name__', callback)} failed on notification "
+              f"{notification.get('id')}: {err}. It will be passed again on the next poll.")
+
+    def _advance(self, new: List[dict], delivered: List[dict]):
+        # The watermark passes only the notifications that all the callbacks took, the rest are passed again.
+        if delivered:
+            self._set_watermark(max(int(notification['id']) for notification in delivered))
+        elif self.watermark is None and not new:
+            self._set_watermark(0)
+        if len(delivered) < len(new):
+            self._redeliver = True
+            self._back_off()
+
+    def _load_watermark(self) -> Union[int, None]:
+        if self.watermark_file is None or not path.isfile(self.watermark_file):
+            return None
+        try:
+            with open(self.watermark_file, encoding='utf-8') as watermark_file:
+                return load(watermark_file)['watermark']
+        except (JSONDecodeError, KeyError):
+            raise MeException(f"Not a valid watermark file: {self.watermark_file}")
+
+    def _set_watermark(self, watermark: int):
+        self.watermark = watermark
+        if self.watermark_file is None:
+            return
+        directory = path.dirname(path.abspath(self.watermark_file))
+        with NamedTemporaryFile('w', dir=directory, prefix=path.basename(self.watermark_file) + '.', suffix='.tmp',
+                                delete=False, encoding='utf-8') as tmp_file:
+            dump({'watermark': watermark, 'updated_at': datetime.now(timezone.utc).isoformat(timespec='seconds')}, tmp_file)
+        replace(tmp_file.name, self.watermark_file)
+
+
+class NotificationWatcher(_BaseNotificationWatcher):
+    """
+    Watch for new notifications of :py:class:`~meapi.Me` and pass them to callbacks.
+
+    - Polls the cheap :py:func:`~meapi.Me.unread_notifications_count`, and fetches notifications only when the count changes
+      (And every ``resync_interval``, for new notifications that came with reads that kept the count).
+    - Fetches only the notifications past the watermark (The id of the newest notification that was passed on), in a page sized by the change of the count.
+    - The poll interval starts at ``min_interval`` and grows by ``backoff`` up to ``max_interval`` while nothing is new.
+    - The watermark is saved in ``watermark_file`` after the callbacks, so after a restart notifications are passed at least once and not missed.
+    - If a callback raises, the watermark stops before that notification, and it is passed again (To all the callbacks) on the next poll.
+    - On the first run without a watermark, only notifications that arrive from now on are passed (Unless ``deliver_existing``).
+
+    :param me: The client.
+    :type me: Me
+    :param callbacks: Functions that get each new notification (Dict, see :py:func:`~meapi.Me.get_notifications`), from the oldest. Default: ``None``.
+    :type callbacks: Union[List[Callable[[dict], None]], None]
+    :param watermark_file: Path of a json file to keep the watermark between runs. Default: ``None`` (In memory).
+    :type watermark_file: Union[str, None]
+    :param min_interval: Seconds between polls after a change. Default: ``5``.
+    :type min_interval: float
+    :param max_interval: Max seconds between polls. Default: ``300``.
+    :type max_interval: float
+    :param backoff: Factor of the poll interval after each poll without new notifications. Default: ``2``.
+    :type backoff: float
+    :param resync_interval: Fetch new notifications at least once in this many seconds, even if the count did not change. ``None`` to never. Default: ``900``.
+    :type resync_interval: Union[float, None]
+    :param results_limit: Max notifications in each page. Default: ``100``.
+    :type results_limit: int
+    :param deliver_existing: Without a watermark, pass all the existing notifications on the first poll. Default: ``False``.
+    :type deliver_existing: bool
+    :param filters: Filters of :py:func:`~meapi.Me.get_notifications`, like ``birthday_filter=True``.
+
+    Example::
+
+        watcher = NotificationWatcher(me, [print], watermark_file='watermark.json', comments_filter=True)
+        watcher.start()  # Or watcher.run() to block, or watcher.poll() from a scheduler.
+    """
+    def __init__(self, me, callbacks: Union[List[Callable[[dict], None]], None] = None, **kwargs):
+        super().__init__(me, callbacks, **kwargs)
+        self._stop_event = Event()
+        self._thread = None
+
+    def poll(self) -> List[dict]:
+        """
+        Check once for new notifications and pass them to the callbacks.
+
+        :return: The new notifications that were passed on, from the oldest.
+        :rtype: List[dict]
+        """
+        count = self.me.unread_notifications_count()
+        if self.watermark is None and not self.deliver_existing:
+            latest = self.me.get_notifications(results_limit=1, **self.filters)['results']
+            self._set_watermark(latest[0]['id'] if latest else 0)
+            self._fetched(count, [])
+            return []
+        if not self._should_fetch(count):
+            return []
+        new = self._fetched(count, list(self.me.iter_notifications(
+            results_limit=self._page_size(count), since_id=self.watermark, prefetch=False, **self.filters)))
+        delivered = []
+        for notification in new:
+            failed = False
+            for callback in self.callbacks:
+                try:
+                    callback(notification)
+                except Exception as err:  # A broken callback must not stop the watcher.
+                    self._callback_failed(callback, notification, err)
+                    failed = True
+            if failed:
+                break
+            delivered.append(notification)
+        self._advance(new, delivered)
+        return delivered
+
+    def run(self):
+        """
+        Poll until :py:func:`stop` is called. Errors of a poll are printed and the next poll is delayed.
+        """
+        self._stop_event.clear()
+        self._run()
+
+    def start(self) -> Thread:
+        """
+        Run the watcher in a background (daemon) thread.
+
+        :rtype: threading.Thread
+        """
+        self._stop_event.clear()  # Here and not in the thread, so a stop() right after start() is not lost.
+        self._thread = Thread(target=self._run, name='meapi-notification-watcher', daemon=True)
+        self._thread.start()
+        return self._thread
+
+    def stop(self):
+        """
+        Stop the watcher after the current poll.
+        """
+        self._stop_event.set()
+        if self._thread is not None and self._thread is not current_thread():
+            self._thread.join()
+
+    def _run(self):
+        while not self._stop_event.is_set():
+            try:
+                self.poll()
+            except Exception as err:
+                print(f"Failed to poll notifications: {err}")
+                self._back_off()
+            self._stop_event.wait(self.interval)
@@ -23,4 +23,5 @@ setup(
     author='David lev',
     license='MIT',
     install_requires=['requests'],
+    extras_require={'async': ['aiohttp'], 'fast': ['orjson'], 'test': ['aiohttp', 'pytest']},
 )
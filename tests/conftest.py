@@ -0,0 +1,29 @@
+import pytest
+from meapi import Me, MemoryCredentialStore
+from meapi.testing import FakeMeApi, InProcessTransport
+
+PHONE_NUMBER = 972500000100
+
+
+@pytest.fixture
+def api():
+    return FakeMeApi(seed=1)
+
+
+@pytest.fixture
+def make_me(api):
+    """
+    Factory of clients of the stand-in api, closed after the test.
+    """
+    clients = []
+
+    def make(phone_number=PHONE_NUMBER, **kwargs):
+        kwargs.setdefault('credential_store', MemoryCredentialStore())
+        kwargs.setdefault('transport', InProcessTransport(api))
+        me = Me(phone_number=phone_number, activation_code=123456, **kwargs)
+        clients.append(me)
+        return me
+
+    yield make
+    for me in clients:
+        me.close()
@@ -0,0 +1,140 @@
+from asyncio import gather, run
+from gc import collect
+from os import listdir
+from threading import RLock, Thread, active_count, current_thread, main_thread
+from time import sleep
+from weakref import ref
+import tempfile
+from meapi import AsyncMe, JsonCredentialStore, Me, MemoryCredentialStore
+from meapi.testing import AsyncInProcessTransport, FakeMeApi, InProcessTransport
+from meapi.transport import TransportResponse
+from conftest import PHONE_NUMBER
+
+
+def _refresh_in_threads(clients, used_token):
+    threads = [Thread(target=me._refresh_access_token, args=(used_token,)) for me in clients]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+def test_refresh_is_single_flight_across_threads(api, make_me):
+    me = make_me()
+    used_token, logins = me.access_token, api.requests['login']
+    _refresh_in_threads([me] * 8, used_token)
+    assert api.requests['login'] - logins == 1
+    assert me.access_token != used_token
+
+
+def test_refresh_is_single_flight_across_instances(api, make_me, tmp_path):
+    store = JsonCredentialStore(str(tmp_path / 'config.json'))
+    first = make_me(credential_store=store)
+    second = make_me(credential_store=JsonCredentialStore(str(tmp_path / 'config.json')))
+    assert first.access_token == second.access_token
+    used_token, logins = first.access_token, api.requests['login']
+    _refresh_in_threads([first, second] * 4, used_token)
+    assert api.requests['login'] - logins == 1
+    assert first.access_token == second.access_token != used_token
+
+
+def test_memory_store_refresh_is_single_flight_without_lock_files(api, make_me, monkeypatch, tmp_path):
+    monkeypatch.setattr(tempfile, 'tempdir', str(tmp_path))
+    store = MemoryCredentialStore()
+    first, second = make_me(credential_store=store), make_me(credential_store=store)
+    used_token, logins = first.access_token, api.requests['login']
+    _refresh_in_threads([first, second] * 4, used_token)
+    assert api.requests['login'] - logins == 1
+    assert store.lock_path is None and listdir(tmp_path) == []
+
+
+def test_async_refresh_is_single_flight_in_every_event_loop(tmp_path):
+    api = FakeMeApi(seed=1, latency=0.01)  # The refresh must yield, so the second one waits on the lock.
+    store = JsonCredentialStore(str(tmp_path / 'config.json'))
+
+    async def refresh_twice() -> int:
+        me = AsyncMe(phone_number=PHONE_NUMBER, activation_code=123456, credential_store=store,
+                     transport=AsyncInProcessTransport(api))
+        try:
+            await me.get_uuid()
+            used_token, logins = me.access_token, api.requests['login']
+            await gather(me._refresh_access_token(used_token), me._refresh_access_token(used_token))
+            assert me.access_token != used_token
+            return api.requests['login'] - logins
+        finally:
+            await me.close()
+
+    assert run(refresh_twice()) == 1
+    assert run(refresh_twice()) == 1  # A new event loop, contending on the lock of the same file.
+
+
+def test_rejected_token_is_replaced_by_the_stored_one(api, make_me):
+    me = make_me()
+    stored_token, logins = me.access_token, api.requests['login']
+    me.access_token = stored_token[:-4] + 'XXXX'  # Rejected by the server.
+    assert me.get_profile_info()['uuid'] == me.uuid
+    assert me.access_token == stored_token
+    assert api.requests['login'] == logins
+
+
+def test_rejected_token_is_refreshed_once(api, make_me):
+    me = make_me()
+    rejected_token = me.access_token[:-4] + 'XXXX'
+    me._credentials.set(PHONE_NUMBER, {**me._credentials.get(PHONE_NUMBER), 'access': rejected_token})
+    me.access_token, logins = rejected_token, api.requests['login']
+    assert me.get_profile_info()['uuid'] == me.uuid
+    assert api.requests['login'] - logins == 1
+    assert me._credentials.get(PHONE_NUMBER)['access'] == me.access_token != rejected_token
+
+
+def test_background_refresh_uses_one_thread_and_weak_references():
+    api = FakeMeApi(seed=1, token_lifetime=60)
+    before = active_count()
+    clients = [Me(phone_number=972500000110 + i, activation_code=123456, credential_store=MemoryCredentialStore(),
+                  transport=InProcessTransport(api)) for i in range(20)]  # Never closed.
+    assert active_count() - before <= 1
+    client = ref(clients[0])
+    del clients[:]
+    collect()
+    assert client() is None  # Not kept alive by its scheduled refresh.
+
+
+def test_background_refresh_before_expiry(make_me):
+    api = FakeMeApi(seed=1, token_lifetime=2)
+    me = make_me(transport=InProcessTransport(api), refresh_margin=1.9)  # Refreshed after half of the lifetime.
+    used_token, logins = me.access_token, api.requests['login']
+    sleep(1.2)
+    assert api.requests['login'] - logins >= 1
+    assert me.access_token != used_token
+
+
+def test_async_registration_prompts_off_the_event_loop(api, monkeypatch):
+    class NewAccountTransport(AsyncInProcessTransport):
+        registered = False
+
+        async def request(self, method, endpoint, body=None, headers=None, timeout=(None, None), total_timeout=None):
+            if method == 'patch' and endpoint == '/main/users/profile/':
+                self.registered = True
+            elif endpoint == '/main/users/profile/me/' and not self.registered:
+                return TransportResponse(401, b'{"detail": "User not found."}', {})
+            return await super().request(method, endpoint, body, headers, timeout, total_timeout)
+
+    prompted_in = []
+
+    def prompt(account_details):
+        prompted_in.append(current_thread())
+        return 'Ross', 'Geller', None, False
+
+    monkeypatch.setattr('meapi.aio.account._prompt_registration_details', prompt)
+
+    async def main():
+        me = AsyncMe(phone_number=PHONE_NUMBER, activation_code=123456, credential_store=MemoryCredentialStore(),
+                     transport=NewAccountTransport(api))
+        try:
+            assert isinstance(me._auth_lock, type(RLock()))  # Kept for the helpers shared with Me.
+            return await me.get_uuid()
+        finally:
+            await me.close()
+
+    assert run(main())
+    assert len(prompted_in) == 1 and prompted_in[0] is not main_thread()
@@ -0,0 +1,74 @@
+from time import sleep
+from meapi import ResponseCache, SQLiteCacheStore
+
+
+def test_lru_eviction():
+    cache = ResponseCache(max_size=2)
+    cache.set('phone_search', 1, {'a': 1})
+    cache.set('phone_search', 2, {'a': 2})
+    assert cache.get('phone_search', 1) == (True, {'a': 1})  # 1 is now the most recent.
+    cache.set('phone_search', 3, {'a': 3})
+    assert cache.get('phone_search', 2) == (False, None)
+    assert cache.get('phone_search', 1)[0] and cache.get('phone_search', 3)[0]
+    assert cache.stats['evictions'] == 1
+
+
+def test_ttl_expiry():
+    cache = ResponseCache(ttls={'phone_search': 0.05})
+    cache.set('phone_search', 1, {'a': 1})
+    assert cache.get('phone_search', 1)[0]
+    sleep(0.1)
+    assert cache.get('phone_search', 1) == (False, None)
+    assert cache.stats['size'] == 0
+
+
+def test_values_are_copies():
+    cache = ResponseCache()
+    cache.set('phone_search', 1, {'a': [1]})
+    cache.get('phone_search', 1)[1]['a'].append(2)
+    assert cache.get('phone_search', 1)[1] == {'a': [1]}
+
+
+def test_invalidate_contact_removes_the_profile_of_its_user():
+    cache = ResponseCache()
+    cache.set('phone_search', 972500000001, {'contact': {'user': {'uuid': 'abc'}}})
+    cache.set('get_profile_info', 'abc', {'profile': {}})
+    cache.invalidate_contact(972500000001)
+    assert not cache.get('phone_search', 972500000001)[0]
+    assert not cache.get('get_profile_info', 'abc')[0]
+
+
+def test_sqlite_store_survives_restart(tmp_path):
+    db_file = str(tmp_path / 'cache.db')
+    cache = ResponseCache(store=SQLiteCacheStore(db_file))
+    cache.set('phone_search', 1, {'a': 1})
+    cache.store.close()
+    cache = ResponseCache(store=SQLiteCacheStore(db_file))
+    assert cache.get('phone_search', 1) == (True, {'a': 1})
+    cache.invalidate('phone_search', 1)
+    assert not cache.store.get('phone_search', '1')[0]
+    cache.store.close()
+
+
+def test_own_profile_is_cached_per_account(make_me, tmp_path):
+    cache = ResponseCache(store=SQLiteCacheStore(str(tmp_path / 'cache.db')))
+    first = make_me(972500000101, cache=cache)
+    second = make_me(972500000102, cache=cache)
+    assert first.uuid and second.uuid and first.uuid != second.uuid
+    assert first.get_profile_info()['uuid'] == first.uuid
+    assert second.get_profile_info()['uuid'] == second.uuid
+    assert second.get_uuid() == second.uuid
+    cache.store.close()
+
+
+def test_delete_account_keeps_the_entries_of_other_accounts(make_me):
+    cache = ResponseCache()
+    first = make_me(972500000101, cache=cache)
+    second = make_me(972500000102, cache=cache)
+    second.get_profile_info()
+    first.get_profile_info()
+    cache.set('phone_search', 972500000200, {'contact': {}})
+    first.delete_account()
+    assert not cache.get('get_profile_info', first._own_profile_key())[0]
+    assert cache.get('get_profile_info', second._own_profile_key())[0]
+    assert cache.get('phone_search', 972500000200)[0]
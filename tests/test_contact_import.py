@@ -0,0 +1,79 @@
+from io import BytesIO, StringIO
+from random import Random
+import pytest
+from meapi import ContactImporter
+from meapi.contact_import import _PhoneNumberFilter
+from meapi.exceptions import MeException
+
+VCARD = (
+    'BEGIN:VCARD\r\nVERSION:3.0\r\nN:Geller;Ross;Eustace;;\r\n'
+    'item1.TEL;TYPE=CELL:+972 (50) 000-0001\r\nTEL;TYPE=HOME:tel:+972-3-000-0002;ext=5\r\nTEL:12\r\n'
+    'PHOTO;ENCODING=b;TYPE=JPEG:AAAA\r\n BBBB\r\n BBBB\r\nBDAY:19700118\r\nEND:VCARD\r\n'
+    'BEGIN:VCARD\r\nVERSION:3.0\r\nFN:Monica Geller\\, Chef\r\nTEL:+972 50 000 0001\r\nEND:VCARD\r\n'
+    'BEGIN:VCARD\r\nVERSION:2.1\r\nN;CHARSET=UTF-8;ENCODING=QUOTED-PRINTABLE:=D7=92=D7=9C=D7=A8;=D7=A8=D7=95=\r\n'
+    '=D7=A1\r\nTEL;CELL:0501234567\r\nEND:VCARD\r\n'
+    'BEGIN:VCARD\r\nVERSION:3.0\r\nTEL:972500000009\r\nEND:VCARD\r\n'
+)
+GOOGLE_CSV = (
+    'First Name,Middle Name,Last Name,Birthday,Phone 1 - Type,Phone 1 - Value,Phone 2 - Type,Phone 2 - Value\r\n'
+    'Chandler,Muriel,Bing,1968-04-08,Mobile,+1 555 000 0001 ::: +1 555 000 0002,Home,\r\n'
+    'Joey,,Tribbiani,,Mobile,+1 555 000 0001,,\r\n'
+)
+
+
+def test_phone_number_filter_is_exact_past_its_capacity():
+    numbers = _PhoneNumberFilter(capacity=100, error_rate=0.01, flush_size=50)
+    try:
+        values = [Random(1).randrange(10 ** 11, 10 ** 12) for _ in range(5000)]
+        first_seen = [numbers.add(value) for value in values]
+        assert sum(first_seen) == len(set(values))
+        assert not any(numbers.add(value) for value in values)
+    finally:
+        numbers.close()
+
+
+def test_vcard():
+    importer = ContactImporter(StringIO(VCARD), country_code='IL')
+    contacts = list(importer)
+    assert [(contact['name'], contact['phone_number']) for contact in contacts] == [
+        ('Ross Eustace Geller', 972500000001), ('Ross Eustace Geller', 97230000002), ('רוס גלר', 501234567)]
+    assert contacts[0]['date_of_birth'] == '1970-01-18' and contacts[0]['country_code'] == 'IL'
+    assert importer.stats == {'records': 4, 'contacts': 3, 'invalid': 2, 'duplicates': 1}
+
+
+def test_csv_columns_are_detected():
+    importer = ContactImporter(BytesIO(GOOGLE_CSV.encode('utf-8-sig')), file_format='csv')
+    contacts = list(importer)
+    assert [(contact['name'], contact['phone_number']) for contact in contacts] == [
+        ('Chandler Muriel Bing', 15550000001), ('Chandler Muriel Bing', 15550000002)]
+    assert contacts[0]['date_of_birth'] == '1968-04-08'
+    assert importer.stats == {'records': 2, 'contacts': 2, 'invalid': 0, 'duplicates': 1}
+
+
+def test_csv_explicit_columns_and_errors():
+    importer = ContactImporter(StringIO('who;number\nA;050-123-4567\n'), file_format='csv', delimiter=';',
+                               name_columns='who', phone_columns=['number'])
+    assert [contact['phone_number'] for contact in importer] == [501234567]
+    with pytest.raises(MeException):
+        list(ContactImporter(StringIO('a,b\n1,2\n'), file_format='csv'))
+    with pytest.raises(MeException):
+        ContactImporter(StringIO(''), file_format='xlsx')
+
+
+def test_format_is_detected_from_the_first_line(tmp_path):
+    assert len(list(ContactImporter(StringIO(VCARD)))) == 3
+    path = tmp_path / 'contacts.txt'
+    path.write_text(GOOGLE_CSV)
+    assert len(list(ContactImporter(str(path)))) == 2
+
+
+def test_upload_in_batches(make_me, api):
+    me = make_me()
+    book = ''.join(f'BEGIN:VCARD\r\nFN:Contact {i}\r\nTEL:{972500010000 + i % 2500}\r\nEND:VCARD\r\n' for i in range(3000))
+    progress = []
+    result = ContactImporter(StringIO(book)).upload(me, chunk_size=100, max_concurrency=2,
+                                                    progress=lambda uploaded, read: progress.append((uploaded, read)))
+    assert result['contacts'] == 2500 and result['duplicates'] == 500
+    assert result['chunks'] == 25 and result['failed'] == [] and result['errors'] == []
+    assert len(api._accounts[str(me.phone_number)]['contacts']) == 2500
+    assert progress[-1] == (2500, 2500) and all(uploaded <= read for uploaded, read in progress)
@@ -0,0 +1,64 @@
+import pytest
+from meapi import ContactSync, Me
+from meapi.exceptions import MeException
+from meapi.testing import InProcessTransport
+
+BOOK = [
+    {'name': 'Ross', 'phone_number': '+972-50-000-0001'},
+    {'name': 'Monica', 'phone_number': 972500000002},
+    {'name': 'Ross again', 'phone_number': 972500000001},  # Duplicate number
+    {'name': 'No number', 'phone_number': '12'},
+    {'name': '', 'phone_number': 972500000003},
+]
+
+
+@pytest.fixture
+def contact_sync(tmp_path):
+    contact_sync = ContactSync(str(tmp_path / 'contacts.db'))
+    yield contact_sync
+    contact_sync.close()
+
+
+def test_delta(contact_sync):
+    add, remove, counts = contact_sync.delta(BOOK, 'account')
+    assert [contact['phone_number'] for contact in add] == [972500000001, 972500000002]
+    assert add[0]['name'] == 'Ross' and remove == []
+    assert counts == {'unchanged': 0, 'skipped': 3}
+    contact_sync.commit('account', add, remove)
+    changed = [{'name': 'Monica Geller', 'phone_number': 972500000002}, {'name': 'Rachel', 'phone_number': 972500000004}]
+    add, remove, counts = contact_sync.delta(changed, 'account')
+    assert sorted(contact['name'] for contact in add) == ['Monica Geller', 'Rachel']
+    assert [contact['phone_number'] for contact in remove] == [972500000001]
+    assert counts['unchanged'] == 0
+    assert len(contact_sync.delta(BOOK, 'other account')[0]) == 2  # Snapshots are by account.
+    assert contact_sync.count('account') == 2 and contact_sync.count('other account') == 0
+
+
+def test_sync_sends_only_changes(make_me, contact_sync, api):
+    me = make_me()
+    assert contact_sync.sync(me, BOOK)['added'] == 2
+    syncs = api.requests['contacts_sync']
+    result = contact_sync.sync(me, BOOK)
+    assert result['added'] == result['removed'] == 0 and result['response'] is None
+    assert api.requests['contacts_sync'] == syncs
+    assert contact_sync.sync(me, BOOK[1:2])['removed'] == 1
+    assert len(api._accounts[str(me.phone_number)]['contacts']) == 1
+
+
+def test_access_token_accounts_get_their_own_snapshot(api, contact_sync):
+    first = Me(access_token=api.issue_token(972500000201), transport=InProcessTransport(api), config_file='unused.json')
+    second = Me(access_token=api.issue_token(972500000202), transport=InProcessTransport(api), config_file='unused.json')
+    assert contact_sync.sync(first, BOOK)['added'] == 2
+    assert contact_sync.sync(second, BOOK)['added'] == 2
+    assert contact_sync.count(first.uuid) == contact_sync.count(second.uuid) == 2
+
+
+def test_unknown_account_raises(contact_sync):
+    class NoAccount:
+        phone_number = uuid = None
+
+        def get_uuid(self):
+            return None
+
+    with pytest.raises(MeException):
+        contact_sync.sync(NoAccount(), BOOK)
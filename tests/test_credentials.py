@@ -0,0 +1,53 @@
+from gc import collect
+from json import dump
+from os import replace, stat, utime
+from meapi import JsonCredentialStore, MemoryCredentialStore, SQLiteCredentialStore
+from meapi.filelock import _locks, get_file_lock
+
+ACCOUNT = {'access': 'a' * 20, 'refresh': 'r' * 20, 'pwd_token': 'p' * 20, 'uuid': 'u' * 36}
+
+
+def test_json_store_keeps_other_accounts(tmp_path):
+    config_file = str(tmp_path / 'config.json')
+    JsonCredentialStore(config_file).set(1, ACCOUNT)
+    JsonCredentialStore(config_file).set(2, {**ACCOUNT, 'uuid': 'v' * 36})
+    store = JsonCredentialStore(config_file)
+    assert store.get(1) == ACCOUNT and store.get(2)['uuid'] == 'v' * 36
+    store.delete(1)
+    assert store.get(1) is None and store.get(2) is not None
+
+
+def test_json_store_notices_same_size_rewrite_in_one_mtime_tick(tmp_path):
+    config_file = tmp_path / 'config.json'
+    store = JsonCredentialStore(str(config_file))
+    store.set(1, ACCOUNT)
+    old_stat = stat(config_file)
+    assert store.get(1)['access'] == 'a' * 20
+    # Another process replaces the file with new tokens of the same length, on a filesystem with a coarse mtime.
+    new_file = tmp_path / 'config.json.new'
+    with open(new_file, 'w') as file:
+        dump({'1': {**ACCOUNT, 'access': 'b' * 20}}, file, indent=4, sort_keys=True)
+    utime(new_file, ns=(old_stat.st_atime_ns, old_stat.st_mtime_ns))
+    replace(new_file, config_file)
+    assert stat(config_file).st_size == old_stat.st_size
+    assert store.get(1)['access'] == 'b' * 20
+
+
+def test_returned_credentials_are_copies(tmp_path):
+    for store in (JsonCredentialStore(str(tmp_path / 'config.json')), SQLiteCredentialStore(str(tmp_path / 'creds.db')),
+                  MemoryCredentialStore()):
+        store.set(1, ACCOUNT)
+        store.get(1)['access'] = 'changed'
+        assert store.get(1) == ACCOUNT
+
+
+def test_file_locks_are_shared_while_used_and_then_dropped(tmp_path):
+    lock_file = str(tmp_path / 'config.json.lock')
+    with get_file_lock(lock_file) as lock:
+        assert get_file_lock(lock_file) is lock
+    for i in range(100):
+        with get_file_lock(str(tmp_path / f'{i}.lock')):
+            pass
+    del lock
+    collect()
+    assert not any(path.startswith(str(tmp_path)) for path in _locks)
@@ -0,0 +1,85 @@
+import pytest
+from meapi import RetryPolicy, SQLiteNotificationStore
+from meapi.exceptions import MeApiException
+from meapi.testing import FakeMeApi, InProcessTransport
+from meapi.transport import TransportResponse
+
+NOTIFICATIONS = [
+    {'id': 3, 'message_category': 'BIRTHDAY', 'distribution_date': '2022-05-03T10:00:00Z', 'is_read': False,
+     'context': {'uuid': 'a'}},
+    {'id': 2, 'message_category': 'NEW_COMMENT', 'distribution_date': '2022-05-02T10:00:00Z', 'is_read': True,
+     'context': {'uuid': 'b'}},
+    {'id': 1, 'message_category': 'COMMENT_APPROVED', 'distribution_date': '2022-05-01T10:00:00Z', 'is_read': False,
+     'context': {'uuid': 'a'}},
+]
+
+
+class FailingPagesTransport(InProcessTransport):
+    """
+    Fails the requests of the notification pages from ``fail_from_page``, while ``failing``.
+    """
+    def __init__(self, api, fail_from_page):
+        super().__init__(api)
+        self.fail_from_page, self.failing = fail_from_page, True
+
+    def request(self, method, endpoint, body=None, headers=None, timeout=(None, None)):
+        if self.failing and '/notification/notification/items/' in endpoint and \
+                int(endpoint.split('page=')[1].split('&')[0]) >= self.fail_from_page:
+            return TransportResponse(500, b'{"detail": "A server error occurred."}', {})
+        return super().request(method, endpoint, body, headers, timeout)
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = SQLiteNotificationStore(str(tmp_path / 'notifications.db'))
+    yield store
+    store.close()
+
+
+def test_queries(store):
+    assert store.add(NOTIFICATIONS) == 3
+    assert [n['id'] for n in store.query()] == [3, 2, 1]
+    assert [n['id'] for n in store.query(newest_first=False, limit=2)] == [1, 2]
+    assert [n['id'] for n in store.query(category='birthday')] == [3]
+    assert [n['id'] for n in store.query(category='NEW_COMMENT')] == [2]
+    assert [n['id'] for n in store.query(since='2022-05-01T12:00:00Z', until='2022-05-03')] == [2]
+    assert [n['id'] for n in store.query(uuid='a', is_read=False)] == [3, 1]
+    assert store.count(is_read=False) == 2
+    store.mark_read([3])
+    assert store.count(is_read=False) == 1 and store.query(uuid='a')[0]['is_read'] is True
+    assert store.latest_id() == 3
+    store.clear()
+    assert store.count() == 0 and store.latest_id() is None
+
+
+def test_ingest_is_incremental(make_me, store, api):
+    me = make_me()
+    assert store.ingest(me) == api.notifications_count
+    assert store.ingested_id() == store.latest_id()
+    pages = api.requests['notifications']
+    assert store.ingest(me) == 0
+    assert api.requests['notifications'] - pages == 1
+
+
+def test_failed_ingest_does_not_skip_older_notifications(make_me, store):
+    api = FakeMeApi(seed=1, notifications=1200)
+    transport = FailingPagesTransport(api, fail_from_page=7)
+    me = make_me(transport=transport, retry_policy=RetryPolicy(max_retries=0))
+    with pytest.raises(MeApiException):
+        store.ingest(me, results_limit=100, prefetch=False)
+    assert 0 < store.count() < 1200
+    assert store.ingested_id() is None
+    transport.failing = False
+    store.ingest(me, results_limit=100)
+    assert store.count() == 1200
+
+
+def test_filtered_ingest_does_not_skip_other_notifications(make_me, store, api):
+    me = make_me()
+    birthdays = store.ingest(me, birthday_filter=True, results_limit=50)
+    assert 0 < birthdays < api.notifications_count
+    assert store.ingested_id(birthday_filter=True) is not None and store.ingested_id() is None
+    assert store.ingest(me) == api.notifications_count
+    assert store.count() == api.notifications_count
+    store.clear()
+    assert store.ingested_id(birthday_filter=True) is None
@@ -0,0 +1,22 @@
+import pytest
+from meapi import QuotaTracker
+from meapi.exceptions import MeQuotaException
+
+
+def test_limits_are_merged_with_the_defaults():
+    quota = QuotaTracker(limits={'phone_search': 2})
+    assert quota.limits == {'phone_search': 2, 'get_profile_info': 500}
+    assert quota.reserve('phone_search') == quota.reserve('phone_search') == 0
+    with pytest.raises(MeQuotaException):
+        quota.reserve('phone_search')
+    assert quota.remaining('get_profile_info') == 500
+
+
+def test_limit_can_be_turned_off():
+    quota = QuotaTracker(limits={'phone_search': None, 'get_profile_info': 1})
+    assert 'phone_search' not in quota.limits
+    assert all(quota.reserve('phone_search') == 0 for _ in range(1000))
+    quota.exhaust('phone_search')
+    assert quota.reserve('get_profile_info') == 0
+    with pytest.raises(MeQuotaException):
+        quota.reserve('get_profile_info')
@@ -0,0 +1,115 @@
+from email.utils import format_datetime
+from datetime import datetime, timedelta, timezone
+import pytest
+from meapi import CallbackSink, Metrics, RetryPolicy
+from meapi.exceptions import MeApiException, MeConnectionException
+from meapi.retry import _parse_retry_after
+from meapi.testing import InProcessTransport
+from meapi.transport import TransportResponse
+
+
+class FlakyTransport(InProcessTransport):
+    """
+    Fails the first ``failures`` requests to an endpoint with ``status``.
+    """
+    def __init__(self, api, endpoint, failures, status=503, headers=None):
+        super().__init__(api)
+        self.endpoint, self.failures, self.status, self.headers = endpoint, failures, status, headers or {}
+        self.calls = 0
+
+    def request(self, method, endpoint, body=None, headers=None, timeout=(None, None)):
+        if endpoint.startswith(self.endpoint):
+            self.calls += 1
+            if self.calls <= self.failures:
+                return TransportResponse(self.status, b'{"detail": "flaky"}', self.headers)
+        return super().request(method, endpoint, body, headers, timeout)
+
+
+@pytest.mark.parametrize('retry', [1, 2, 5, 20])
+def test_backoff_is_capped_full_jitter(retry):
+    policy = RetryPolicy(backoff_factor=0.5, max_backoff=3)
+    cap = min(3, 0.5 * 2 ** (retry - 1))
+    delays = [policy.backoff(retry) for _ in range(200)]
+    assert all(0 <= delay <= cap for delay in delays)
+    assert max(delays) > cap / 2
+
+
+def test_get_delay_only_for_retryable_methods_and_retries():
+    policy = RetryPolicy(max_retries=2)
+    assert policy.get_delay('post', 1) is None
+    assert policy.get_delay('get', 3) is None
+    assert policy.get_delay('get', 2) is not None
+    assert policy.is_retryable_status(503) and not policy.is_retryable_status(404)
+
+
+def test_retry_after_is_respected_and_capped():
+    policy = RetryPolicy(backoff_factor=0, max_backoff=10)
+    assert policy.get_delay('get', 1, '4') == 4
+    assert policy.get_delay('get', 1, '120') == 10
+    assert RetryPolicy(backoff_factor=0, respect_retry_after=False).get_delay('get', 1, '4') == 0
+
+
+def test_parse_retry_after():
+    assert _parse_retry_after('2.5') == 2.5
+    assert _parse_retry_after('-1') == 0
+    assert _parse_retry_after('soon') == 0
+    in_a_minute = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=60), usegmt=True)
+    assert 55 < _parse_retry_after(in_a_minute) <= 60
+
+
+def test_get_request_is_retried(api, make_me):
+    transport = FlakyTransport(api, '/main/users/profile/me/', failures=0)
+    me = make_me(transport=transport, retry_policy=RetryPolicy(backoff_factor=0.001))
+    before = transport.calls
+    transport.failures = before + 2
+    me.get_profile_info()
+    assert transport.calls - before == 3
+
+
+def test_post_request_is_not_retried(api, make_me):
+    transport = FlakyTransport(api, '/main/contacts/sync/', failures=1)
+    me = make_me(transport=transport, retry_policy=RetryPolicy(backoff_factor=0.001))
+    with pytest.raises(MeApiException) as err:
+        me.add_contacts([{'name': 'Ross', 'phone_number': 972500000001}])
+    assert err.value.http_status == 503
+    assert transport.calls == 1
+
+
+def test_retries_give_up_after_max_retries(api, make_me):
+    transport = FlakyTransport(api, '/main/users/profile/me/', failures=0)
+    me = make_me(transport=transport, retry_policy=RetryPolicy(max_retries=2, backoff_factor=0.001))
+    before = transport.calls
+    transport.failures = before + 100
+    with pytest.raises(MeApiException):
+        me.get_profile_info()
+    assert transport.calls - before == 3
+
+
+class DownTransport(InProcessTransport):
+    """
+    Fails the requests to an endpoint with a connection error, while ``down``.
+    """
+    def __init__(self, api, endpoint):
+        super().__init__(api)
+        self.endpoint, self.down, self.calls = endpoint, False, 0
+
+    def request(self, method, endpoint, body=None, headers=None, timeout=(None, None)):
+        if self.down and endpoint.startswith(self.endpoint):
+            self.calls += 1
+            raise ConnectionError('boom')
+        return super().request(method, endpoint, body, headers, timeout)
+
+
+def test_retries_give_up_on_connection_errors(api, make_me):
+    transport = DownTransport(api, '/main/users/profile/me/')
+    transport.errors = (ConnectionError,)
+    errors = []
+    me = make_me(transport=transport, retry_policy=RetryPolicy(max_retries=3, backoff_factor=0.001),
+                 metrics=Metrics([CallbackSink(lambda metric: errors.append(metric.error))]))
+    transport.down = True
+    with pytest.raises(MeConnectionException) as err:
+        me.get_profile_info()
+    assert transport.calls == err.value.attempts == 4
+    assert err.value.waited > 0 and isinstance(err.value.__cause__, ConnectionError)
+    assert 'boom' in str(err.value) and 'attempts: 4' in str(err.value)
+    assert errors[-1] == 'ConnectionError'
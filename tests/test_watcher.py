@@ -0,0 +1,94 @@
+from asyncio import create_task, run, sleep as async_sleep
+from copy import deepcopy
+from meapi import AsyncMe, AsyncNotificationWatcher, MemoryCredentialStore, NotificationWatcher
+from meapi.testing import AsyncInProcessTransport
+from conftest import PHONE_NUMBER
+
+
+def push(api, count):
+    """
+    Add unread notifications to the account, newest first like the api.
+    """
+    notifications = api._accounts[str(PHONE_NUMBER)]['notifications']
+    new = []
+    for i in range(count):
+        notification = deepcopy(notifications[-1])
+        notification.update(id=notifications[0]['id'] + len(new) + 1, is_read=False)
+        new.insert(0, notification)
+    notifications[:0] = new
+    return [notification['id'] for notification in reversed(new)]
+
+
+def test_only_new_notifications_are_passed(api, make_me, tmp_path):
+    me = make_me()
+    passed = []
+    watcher = NotificationWatcher(me, [passed.append], watermark_file=str(tmp_path / 'watermark.json'), min_interval=0)
+    assert watcher.poll() == []  # The first poll only sets the watermark.
+    ids = push(api, 3)
+    assert [notification['id'] for notification in watcher.poll()] == ids
+    assert [notification['id'] for notification in passed] == ids
+    assert watcher.poll() == []
+    assert NotificationWatcher(me, watermark_file=str(tmp_path / 'watermark.json')).watermark == ids[-1]
+
+
+def test_failed_callback_is_passed_again(api, make_me):
+    me = make_me()
+    passed, failures = [], {'left': 1}
+
+    def flaky(notification):
+        if notification['id'] == ids[1] and failures['left']:
+            failures['left'] -= 1
+            raise ValueError('broken')
+        passed.append(notification['id'])
+
+    watcher = NotificationWatcher(me, [flaky], min_interval=0, resync_interval=None)
+    watcher.poll()
+    ids = push(api, 3)
+    assert [notification['id'] for notification in watcher.poll()] == ids[:1]
+    assert watcher.watermark == ids[0]
+    assert [notification['id'] for notification in watcher.poll()] == ids[1:]  # Even though the count did not change.
+    assert passed == ids
+
+
+def test_stop_right_after_start():
+    class Idle:
+        def unread_notifications_count(self):
+            return 0
+
+        def get_notifications(self, **kwargs):
+            return {'results': []}
+
+    for _ in range(50):
+        watcher = NotificationWatcher(Idle(), min_interval=60)
+        thread = watcher.start()
+        watcher.stop()
+        thread.join(1)
+        assert not thread.is_alive()
+
+
+def test_async_watcher(api):
+    async def main():
+        me = AsyncMe(phone_number=PHONE_NUMBER, activation_code=123456, credential_store=MemoryCredentialStore(),
+                     transport=AsyncInProcessTransport(api))
+        try:
+            passed = []
+
+            async def callback(notification):
+                passed.append(notification['id'])
+
+            watcher = AsyncNotificationWatcher(me, [callback], min_interval=0.01, backoff=1)
+            assert not hasattr(watcher, 'start')
+            watcher.stop()
+            await watcher.run()  # A stop before the run is kept.
+            task = create_task(watcher.run())
+            await async_sleep(0.05)
+            ids = push(api, 2)
+            await async_sleep(0.1)
+            watcher.stop()
+            await task
+            return passed, ids
+        finally:
+            await me.close()
+
+    passed, ids = run(main())
+    assert passed == ids